@@ -1,11 +1,14 @@
 import dash
-from dash import Dash, html, dcc
+from dash import Dash, html, dcc, callback, Input, Output, State, no_update
+from flask import Response, jsonify
 import dash_mantine_components as dmc
 
 from utils.db import init_db
-from utils.cache import cache
+from utils.cache import cache, callback_cache_stats
 from utils.components import create_navbar
-from utils.constants import APP_TITLE
+from utils.constants import APP_TITLE, VERSION_POLL_INTERVAL
+from utils.live import data_version_events
+from utils.metrics import get_version_key
 
 # Initialize database on startup
 init_db()
@@ -27,6 +30,23 @@ app = Dash(
 server = app.server
 cache.init_app(server)
 
+
+@server.route("/cache-stats")
+def cache_stats():
+    """Callback output cache hits and misses in the worker serving the request."""
+    return jsonify(callback_cache_stats())
+
+
+@server.route(f"{app.config.routes_pathname_prefix}data-version/stream")
+def data_version_stream():
+    """Server-sent events with each new data version (assets/live.js)."""
+    return Response(
+        data_version_events(),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # ─── Layout ──────────────────────────────────────────────────────────────────
 
 app.layout = dmc.MantineProvider(
@@ -37,6 +57,12 @@ app.layout = dmc.MantineProvider(
     },
     children=html.Div(
         [
+            # App-wide data version: the page refresh callbacks listen to
+            # this store instead of running on intervals of their own.
+            # assets/live.js sets it as soon as the server pushes a change;
+            # the interval is the fallback when the stream is down.
+            dcc.Interval(id="data-version-interval", interval=VERSION_POLL_INTERVAL),
+            dcc.Store(id="data-version"),
             create_navbar(),
             html.Div(
                 dash.page_container,
@@ -47,6 +73,19 @@ app.layout = dmc.MantineProvider(
     ),
 )
 
+
+@callback(
+    Output("data-version", "data"),
+    Input("data-version-interval", "n_intervals"),
+    State("data-version", "data"),
+)
+def poll_data_version(_n, current):
+    """One read of the data_versions table per tick. The store only changes,
+    and so only wakes the page callbacks, when a write moved the versions."""
+    version = get_version_key()
+    return no_update if version == current else version
+
+
 # ─── Run ─────────────────────────────────────────────────────────────────────
 
 if __name__ == "__main__":
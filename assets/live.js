@@ -0,0 +1,34 @@
+// Live refresh. The server pushes the data version over server-sent events
+// (<pathname prefix>data-version/stream, utils/live.py) and this writes it
+// into the app's data-version store, which wakes the page refresh callbacks
+// right away.
+// Each event, including the heartbeat repeats of an unchanged version, also
+// pauses the data-version-interval poll; a stream error turns the poll back
+// on until EventSource has reconnected.
+(function () {
+    if (!window.EventSource) {
+        return;
+    }
+    const setProps = (id, props) => {
+        const clientside = window.dash_clientside;
+        if (clientside && clientside.set_props) {
+            clientside.set_props(id, props);
+        }
+    };
+    // Same prefix as Dash's own requests, so the stream also works when the
+    // app is served under a path (requests_pathname_prefix).
+    const config = document.getElementById("_dash-config");
+    const prefix = (config && JSON.parse(config.textContent).requests_pathname_prefix) || "/";
+    let last = null;
+    const source = new EventSource(`${prefix}data-version/stream`);
+    source.addEventListener("version", (event) => {
+        setProps("data-version-interval", { disabled: true });
+        if (event.data !== last) {
+            last = event.data;
+            setProps("data-version", { data: event.data });
+        }
+    });
+    source.addEventListener("error", () => {
+        setProps("data-version-interval", { disabled: false });
+    });
+})();
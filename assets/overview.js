@@ -0,0 +1,300 @@
+// Client-side callbacks for the Overview page. The season payload
+// (pages/overview.py _season_payload) holds every per-match standing, so
+// moving the match slider never goes back to the server.
+(function () {
+    const html = (type, props) => ({ type, namespace: "dash_html_components", props });
+
+    // Python's f"{v:,.0f}": round half to even, comma thousands separators.
+    function fmt0(v) {
+        const floor = Math.floor(v);
+        const frac = v - floor;
+        const r = frac > 0.5 || (frac === 0.5 && floor % 2 !== 0) ? floor + 1 : floor;
+        const digits = String(Math.abs(r)).replace(/\B(?=(\d{3})+(?!\d))/g, ",");
+        return (r < 0 || (r === 0 && v < 0) ? "-" : "") + digits;
+    }
+
+    // Index of the last entry <= match (-1 before the first), as
+    // LeaderboardState's searchsorted row lookup.
+    function rowFor(matches, match) {
+        let row = -1;
+        while (row + 1 < matches.length && matches[row + 1] <= match) {
+            row++;
+        }
+        return row;
+    }
+
+    // First index holding the largest key (Python max() / idxmax()).
+    function argmax(items, key) {
+        let best = -1;
+        items.forEach((item, i) => {
+            const k = key(item);
+            if (k !== null && (best < 0 || k > key(items[best]))) {
+                best = i;
+            }
+        });
+        return best;
+    }
+
+    // ─── Components ──────────────────────────────────────────────────────
+    // The Overview's progress header, leaderboard and fixture card are built
+    // only here; statCard renders the same markup as create_stat_card() in
+    // utils/components.py, which the other pages use.
+
+    function seasonProgress(match, total) {
+        return html("Div", {
+            children: [
+                html("Span", {
+                    children: `Season Progress — Match ${match} of ${total}`,
+                    className: "progress-label",
+                }),
+                html("Span", {
+                    children: `${(match / total * 100).toFixed(0)}%`,
+                    className: "progress-pct",
+                }),
+            ],
+            className: "progress-header",
+        });
+    }
+
+    function statCard(title, value, subtitle, color) {
+        return {
+            type: "Paper",
+            namespace: "dash_mantine_components",
+            props: {
+                children: [
+                    html("Div", {
+                        children: [null, html("H6", { children: title, className: "stat-card-title" })],
+                        className: "stat-card-header",
+                    }),
+                    html("H3", { children: value, className: "stat-card-value", style: { color } }),
+                    html("P", { children: subtitle, className: "stat-card-subtitle" }),
+                ],
+                className: "stat-card",
+                p: "lg",
+            },
+        };
+    }
+
+    function leaderboardRow(rank, team, points, change, color, xfers, score, isMvp) {
+        let changeCls = "rank-same", changeText = "—";
+        if (change > 0) {
+            changeCls = "rank-up";
+            changeText = `▲${change}`;
+        } else if (change < 0) {
+            changeCls = "rank-down";
+            changeText = `▼${-change}`;
+        }
+        let matchText = "—", matchCls = "lb-match";
+        if (score !== null) {
+            matchText = isMvp ? `⭐ ${fmt0(score)}` : fmt0(score);
+            if (isMvp) {
+                matchCls = "lb-match lb-match-mvp";
+            }
+        }
+        return html("Div", {
+            children: [
+                html("Span", { children: `#${rank}`, className: "lb-rank" }),
+                html("Div", {
+                    children: [
+                        html("Div", {
+                            children: null,
+                            className: "lb-color-dot",
+                            style: { backgroundColor: color },
+                        }),
+                        html("Span", { children: `${team}${rank === 1 ? " 👑" : ""}`, className: "lb-team" }),
+                    ],
+                    className: "lb-team-cell",
+                }),
+                html("Span", { children: matchText, className: matchCls }),
+                html("Span", { children: fmt0(points), className: "lb-points" }),
+                html("Span", { children: changeText, className: `lb-change ${changeCls}` }),
+                html("Span", { children: xfers, className: "lb-xfers" }),
+            ],
+            className: `lb-row ${rank === 1 ? "lb-row-leader" : ""}`,
+        });
+    }
+
+    function leaderboardHeader() {
+        const cell = (children, className) => html("Span", { children, className });
+        return html("Div", {
+            children: [
+                cell("#", "lb-h"),
+                cell("Team", "lb-h"),
+                cell("Match", "lb-h lb-h-right"),
+                cell("Season", "lb-h lb-h-right"),
+                cell("±", "lb-h lb-h-center"),
+                cell("Xfers left", "lb-h lb-h-right"),
+            ],
+            className: "lb-header",
+        });
+    }
+
+    // Admin-style fixture card (the layout of the server-built card it replaced).
+    function fixtureCard(fixture) {
+        const badge = ({ name, abbr, logo }) =>
+            html("Div", {
+                children: [
+                    logo
+                        ? html("Img", { children: null, src: logo, alt: name, className: "ov-fix-logo" })
+                        : html("Div", { children: abbr.slice(0, 3), className: "ov-fix-logo ov-fix-logo-fallback" }),
+                    html("Span", { children: abbr, className: "ov-fix-code" }),
+                ],
+                className: "ov-fix-badge",
+            });
+        return html("Div", {
+            children: [
+                html("Div", {
+                    children: [
+                        html("Span", { children: `Match ${fixture.match}`, className: "admin-match-number-pill" }),
+                        html("Span", { children: fixture.date, className: "ov-fix-date" }),
+                    ],
+                    className: "ov-fix-header",
+                }),
+                html("Div", {
+                    children: [
+                        badge(fixture.teams[0]),
+                        html("Span", { children: "vs", className: "ov-fix-vs" }),
+                        badge(fixture.teams[1]),
+                    ],
+                    className: "ov-fix-matchup",
+                }),
+                html("Span", { children: fixture.stadium, className: "ov-fix-stadium" }),
+            ],
+            className: "ov-fix-card",
+        });
+    }
+
+    // Transfers left per team after match, "—" with no transfer rows yet.
+    function transfersLeft(transfers, total, match) {
+        const row = rowFor(transfers.matches, match);
+        const left = {};
+        if (row >= 0) {
+            transfers.teams.forEach((team, j) => {
+                left[team] = String(Math.max(total - Math.trunc(transfers.totals[row][j]), 0));
+            });
+        }
+        return left;
+    }
+
+    // ─── Figures ─────────────────────────────────────────────────────────
+
+    // The first n rows of a payload figure. With webgl set, slices past
+    // webgl_threshold points are drawn with scattergl, which has no spline
+    // lines (chart_helpers._scatter_type / _line_shape).
+    function sliceFigure(figure, payload, n, traceProps, webgl) {
+        const x = payload.matches.slice(0, n);
+        const gl = webgl && n * payload.teams.length > payload.webgl_threshold;
+        return {
+            data: figure.data.map((trace, i) => {
+                const sliced = { ...trace, x, ...traceProps(i), type: gl ? "scattergl" : trace.type };
+                if (gl && trace.line) {
+                    const { shape, ...line } = trace.line;
+                    sliced.line = line;
+                }
+                return sliced;
+            }),
+            layout: figure.layout,
+        };
+    }
+
+    // Bubble sizes of fig_points_earned over the visible rows.
+    function earnedSizes(points) {
+        const entered = points.filter((v) => v !== null);
+        const best = entered.length ? Math.max(...entered) : NaN;
+        if (!(best > 0)) {
+            return 6;
+        }
+        return points.map((v) => (v === null ? null : Math.max(v, 50) / best * 18));
+    }
+
+    function matchView(payload, selected) {
+        const noUpdate = window.dash_clientside.no_update;
+        if (!payload) {
+            return [noUpdate, noUpdate, noUpdate, noUpdate, noUpdate, noUpdate];
+        }
+        const match = selected ? Math.trunc(selected) : payload.max_match || 1;
+        const progress = seasonProgress(match, payload.total_matches);
+        const row = rowFor(payload.matches, match);
+        const empty = payload.empty;
+        if (row < 0) {
+            return [progress, [], empty.leaderboard, empty.race, empty.chart, empty.chart];
+        }
+
+        const { teams, colors, series, standings } = payload;
+        const n = row + 1;
+        const totals = standings.totals[row];
+        const order = standings.order[row];
+        const change = (i) => standings.prev_rank[row][i] - standings.rank[row][i];
+        const scores = series.scores.map((values) => values[row]);
+        const mvp = argmax(scores, (v) => v);
+        const lastMatch = payload.matches[row];
+
+        // Stat cards
+        const leader = order[0];
+        const gap = order.length > 1 ? totals[leader] - totals[order[1]] : 0;
+        const mover = order[argmax(order, (i) => Math.abs(change(i)))];
+        const moved = change(mover);
+        const cards = [
+            statCard("👑 Leader", teams[leader], `${fmt0(totals[leader])} pts`, "#FFD23F"),
+            statCard("📏 Gap", fmt0(gap), "pts between 1st & 2nd", "#EF476F"),
+            statCard(
+                "🚀 Biggest Mover",
+                teams[mover],
+                `${moved > 0 ? "▲" : moved < 0 ? "▼" : "—"} ${Math.abs(moved)} spots`,
+                "#06D6A0"
+            ),
+            statCard(
+                "⭐ Last MVP",
+                mvp >= 0 ? teams[mvp] : null,
+                `Match ${lastMatch} — ${fmt0(mvp >= 0 ? scores[mvp] : 0)} pts`,
+                "#4CC9F0"
+            ),
+        ];
+
+        // Leaderboard
+        const left = transfersLeft(payload.transfers, payload.total_transfers, match);
+        const rows = order.map((i, k) =>
+            leaderboardRow(
+                k + 1,
+                teams[i],
+                totals[i],
+                change(i),
+                colors[i],
+                left[teams[i]] === undefined ? "—" : left[teams[i]],
+                scores[i],
+                i === mvp
+            )
+        );
+        const leaderboard = html("Div", {
+            children: [leaderboardHeader(), ...rows],
+            className: "leaderboard",
+        });
+
+        // Charts
+        const figures = payload.figures;
+        const race = sliceFigure(figures.race, payload, n, (i) => ({
+            y: series.cumulative[i].slice(0, n),
+        }), true);
+        const earned = sliceFigure(figures.earned, payload, n, (i) => {
+            const points = series.scores[i].slice(0, n);
+            const marker = figures.earned.data[i].marker;
+            return { y: points, marker: { ...marker, size: earnedSizes(points) } };
+        }, true);
+        const rank = sliceFigure(figures.rank, payload, n, (i) => ({
+            y: series.rank[i].slice(0, n),
+        }), false);
+
+        return [progress, cards, leaderboard, race, earned, rank];
+    }
+
+    function fixture(payload, selected) {
+        if (!payload) {
+            return window.dash_clientside.no_update;
+        }
+        return selected ? fixtureCard(payload.fixtures[Math.trunc(selected)]) : "";
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        overview: { matchView, fixture },
+    });
+})();
@@ -0,0 +1,30 @@
+// Client-side callbacks for the Stats page.
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    stats: {
+        // Rebuild the rolling chart for the chosen window and stat from the
+        // series already in the store, without a server round trip.
+        rollingFigure: function (payload, windowKey, stat) {
+            if (!payload) {
+                return window.dash_clientside.no_update;
+            }
+            const series = payload.series && payload.series[windowKey];
+            if (!series || !series[stat]) {
+                return payload.figure;
+            }
+            const label = `${payload.labels.windows[windowKey]} ${payload.labels.stats[stat]}`;
+            const layout = payload.figure.layout;
+            return {
+                data: payload.figure.data.map((trace, i) => ({
+                    ...trace,
+                    y: series[stat][i],
+                    hovertemplate: `<b>${trace.name}</b><br>Match %{x}<br>${label}: %{y:,.1f}<extra></extra>`,
+                })),
+                layout: {
+                    ...layout,
+                    title: { ...layout.title, text: `Momentum (${label})` },
+                    yaxis: { ...layout.yaxis, title: { text: label } },
+                },
+            };
+        },
+    },
+});
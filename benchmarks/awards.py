@@ -0,0 +1,224 @@
+"""Vectorized compute_awards() vs the original per-row / per-team loops.
+
+Run from the repo root:  python -m benchmarks.awards
+Works on synthetic 74-match seasons for 10, 100 and 500 teams; no database.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils.calculations import compute_awards
+from utils.constants import CENTURION_THRESHOLD, STREAK_MIN_LENGTH
+from utils.season import Season
+
+MATCHES = 74
+TEAM_COUNTS = (10, 100, 500)
+
+
+# ─── Legacy implementation (iterrows MVPs, per-team filters) ────────────────
+
+
+def _teams(df):
+    return [c for c in df.columns if c != "Match"]
+
+
+def _legacy_consistency(scores_df):
+    """Return DataFrame: Team, Avg, Std Dev, CV (coefficient of variation), Min, Max."""
+    if scores_df.empty:
+        return pd.DataFrame(columns=["Team", "Avg", "Std Dev", "CV", "Min", "Max"])
+    teams = _teams(scores_df)
+    rows = []
+    for t in teams:
+        s = scores_df[t].dropna()
+        avg = s.mean()
+        std = s.std()
+        rows.append(
+            {
+                "Team": t,
+                "Avg": round(avg, 1),
+                "Std Dev": round(std, 1),
+                "CV": round(std / avg * 100, 1) if avg > 0 else 0,
+                "Min": round(s.min(), 1),
+                "Max": round(s.max(), 1),
+            }
+        )
+    return pd.DataFrame(rows).sort_values("Std Dev").reset_index(drop=True)
+
+
+def _legacy_streaks(scores_df):
+    """Compute hot/cold streaks for each team.
+
+    A streak is consecutive matches above (hot) or below (cold) the overall
+    match average. Returns DataFrame: Team, Streak Type, Streak Length.
+    """
+    if scores_df.empty:
+        return pd.DataFrame(columns=["Team", "Streak Type", "Streak Length"])
+    teams = _teams(scores_df)
+    rows = []
+    for t in teams:
+        s = scores_df[t].dropna()
+        if len(s) == 0:
+            rows.append({"Team": t, "Streak Type": "—", "Streak Length": 0})
+            continue
+        match_avgs = scores_df[teams].mean(axis=1)
+        above = (s.values > match_avgs.values).astype(int)
+
+        # Walk backwards to find current streak
+        if len(above) == 0:
+            rows.append({"Team": t, "Streak Type": "—", "Streak Length": 0})
+            continue
+        streak_val = above[-1]
+        streak_len = 0
+        for i in range(len(above) - 1, -1, -1):
+            if above[i] == streak_val:
+                streak_len += 1
+            else:
+                break
+        streak_type = "🔥 Hot" if streak_val == 1 else "❄️ Cold"
+        if streak_len < STREAK_MIN_LENGTH:
+            streak_type = "—"
+        rows.append(
+            {"Team": t, "Streak Type": streak_type, "Streak Length": streak_len}
+        )
+    return pd.DataFrame(rows)
+
+
+def _legacy_awards(scores_df, transfers_df=None):
+    """Compute season awards.
+
+    Returns dict:  { badge_name: [ {team, detail}, ... ] }
+    """
+    awards = {}
+    if scores_df.empty:
+        return awards
+    teams = _teams(scores_df)
+
+    # --- Match MVPs (highest scorer each match) ---
+    mvp_counts = {t: 0 for t in teams}
+    for _, row in scores_df.iterrows():
+        vals = {t: row[t] for t in teams if pd.notna(row[t])}
+        if vals:
+            mvp = max(vals, key=vals.get)
+            mvp_counts[mvp] += 1
+    most_mvps = max(mvp_counts.values()) if mvp_counts else 0
+    awards["🏆 Match MVP Leader"] = [
+        {"team": t, "detail": f"{c} MVPs"}
+        for t, c in sorted(mvp_counts.items(), key=lambda x: -x[1])
+        if c == most_mvps and c > 0
+    ]
+
+    # --- Centurion (500+ single match) ---
+    centurions = []
+    for t in teams:
+        big = scores_df[scores_df[t] >= CENTURION_THRESHOLD]
+        if len(big) > 0:
+            centurions.append(
+                {"team": t, "detail": f"{len(big)}× ({int(scores_df[t].max())} best)"}
+            )
+    awards["💎 Centurion"] = centurions
+
+    # --- Consistency King (lowest CV with above-avg total) ---
+    cons = _legacy_consistency(scores_df)
+    totals = scores_df[teams].sum()
+    avg_total = totals.mean()
+    above_avg = cons[cons["Team"].isin(totals[totals >= avg_total].index)]
+    if not above_avg.empty:
+        best = above_avg.sort_values("CV").iloc[0]
+        awards["🏅 Consistency King"] = [
+            {"team": best["Team"], "detail": f"CV: {best['CV']}%"}
+        ]
+
+    # --- Most Improved (biggest rank climb first match → last) ---
+    if len(scores_df) >= 3:
+        early = scores_df.iloc[:1]
+        early_rank = early[teams].sum().rank(ascending=False)
+        final_rank = scores_df[teams].sum().rank(ascending=False)
+        improvement = early_rank - final_rank
+        best_team = improvement.idxmax()
+        climb = int(improvement[best_team])
+        if climb > 0:
+            awards["📈 Most Improved"] = [
+                {"team": best_team, "detail": f"Climbed {climb} spots"}
+            ]
+
+    # --- Transfer Genius (best cumulative efficiency at latest match) ---
+    if transfers_df is not None and not transfers_df.empty:
+        common = [t for t in teams if t in transfers_df.columns]
+        if common:
+            total_pts = scores_df[common].sum()
+            total_tr = transfers_df[common].fillna(0).sum()
+            eff = total_pts / total_tr.replace(0, np.nan)
+            eff = eff.dropna()
+            if not eff.empty:
+                best_t = eff.idxmax()
+                awards["🎯 Transfer Genius"] = [
+                    {"team": best_t, "detail": f"{eff[best_t]:.1f} pts/transfer"}
+                ]
+
+    # --- On Fire / Ice Cold (current streaks) ---
+    streaks = _legacy_streaks(scores_df)
+    hot = streaks[
+        (streaks["Streak Type"] == "🔥 Hot")
+        & (streaks["Streak Length"] >= STREAK_MIN_LENGTH)
+    ]
+    cold = streaks[
+        (streaks["Streak Type"] == "❄️ Cold")
+        & (streaks["Streak Length"] >= STREAK_MIN_LENGTH)
+    ]
+    if not hot.empty:
+        awards["🔥 On Fire"] = [
+            {"team": r["Team"], "detail": f"{r['Streak Length']} match streak"}
+            for _, r in hot.iterrows()
+        ]
+    if not cold.empty:
+        awards["❄️ Ice Cold"] = [
+            {"team": r["Team"], "detail": f"{r['Streak Length']} match streak"}
+            for _, r in cold.iterrows()
+        ]
+
+    return awards
+
+
+# ─── Harness ────────────────────────────────────────────────────────────────
+
+
+def _frames(n_teams, rng):
+    teams = [f"Team {i:04d}" for i in range(n_teams)]
+    match = np.arange(1, MATCHES + 1)
+    shape = (MATCHES, n_teams)
+    scores = pd.DataFrame(rng.integers(50, 700, shape).astype(float), columns=teams)
+    transfers = pd.DataFrame(rng.integers(0, 5, shape).astype(float), columns=teams)
+    scores.insert(0, "Match", match)
+    transfers.insert(0, "Match", match)
+    return scores, transfers
+
+
+def _time(fn, iterations):
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e3
+
+
+def main():
+    rng = np.random.default_rng(0)
+    for n_teams in TEAM_COUNTS:
+        scores_df, transfers_df = _frames(n_teams, rng)
+        season = Season.from_frame(scores_df)
+        transfer_season = Season.from_frame(transfers_df)
+        assert compute_awards(season, transfer_season) == _legacy_awards(
+            scores_df, transfers_df
+        )
+        iterations = max(1, 200 // n_teams)
+        old = _time(lambda: _legacy_awards(scores_df, transfers_df), iterations)
+        new = _time(lambda: compute_awards(season, transfer_season), 20)
+        print(f"{n_teams:>4} teams × {MATCHES} matches   "
+              f"loops {old:8.2f} ms   vectorized {new:6.2f} ms"
+              f"   ({old / new:.0f}× faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Check that several worker processes share one cache and see writes at once.
+
+Run from the repo root:  python -m benchmarks.cache_workers
+Starts WORKERS processes that each import the app, the way gunicorn does,
+against a throwaway database and cache directory. Exits non-zero if any
+worker serves a stale points Season or recomputes an entry another worker
+already cached. Nothing runs it automatically; run it by hand after changing
+the cache backend or how cache keys are versioned.
+"""
+
+import multiprocessing as mp
+import os
+import tempfile
+
+import numpy as np
+
+_tmp = tempfile.mkdtemp()
+os.environ["FANTASY_DB_PATH"] = os.path.join(_tmp, "bench.db")
+os.environ["FANTASY_CACHE_DIR"] = os.path.join(_tmp, "cache")
+
+from utils.db import init_db
+from utils import models
+
+WORKERS = 4
+
+
+def _total_points(season):
+    return float(season.values.sum(dtype=np.float64))
+
+
+def _worker(commands, results):
+    import app
+
+    queries = 0
+    load_season = models._load_season
+
+    def counting_load_season(*args):
+        nonlocal queries
+        queries += 1
+        return load_season(*args)
+
+    models._load_season = counting_load_season
+    with app.server.app_context():
+        for _ in iter(commands.get, None):
+            before = queries
+            total = _total_points(models.get_season())
+            results.put((os.getpid(), total, queries == before))
+
+
+def _read_all(pipes, results):
+    replies = []
+    for commands in pipes:
+        commands.put("read")
+        replies.append(results.get())
+    return replies
+
+
+def main():
+    init_db()
+    for i in range(10):
+        models.add_team(f"Team {i}", "#FF6B35", f"T{i}")
+    for match in range(1, 6):
+        models.upsert_scores(match, {f"Team {i}": 100 + i for i in range(10)})
+
+    ctx = mp.get_context("fork")
+    results = ctx.Queue()
+    pipes = [ctx.Queue() for _ in range(WORKERS)]
+    procs = [ctx.Process(target=_worker, args=(q, results)) for q in pipes]
+    for p in procs:
+        p.start()
+
+    failures = []
+    try:
+        for label, write in (
+            ("initial", None),
+            ("after new match", lambda: models.upsert_scores(6, {"Team 0": 500})),
+            ("after edit", lambda: models.upsert_scores(2, {"Team 3": 0})),
+            ("after delete", lambda: models.delete_match_data(6)),
+        ):
+            if write:
+                write()
+            expected = _total_points(models.get_season.uncached())
+            replies = _read_all(pipes, results)
+            hits = sum(hit for _, _, hit in replies)
+            stale = [pid for pid, total, _ in replies if total != expected]
+            print(
+                f"{label:16} expected={expected:8.1f}  "
+                f"stale workers={len(stale)}  cache hits={hits}/{WORKERS}"
+            )
+            if stale:
+                failures.append(f"{label}: stale totals in workers {stale}")
+            if hits != WORKERS - 1:
+                failures.append(f"{label}: expected {WORKERS - 1} shared hits, got {hits}")
+    finally:
+        for q in pipes:
+            q.put(None)
+        for p in procs:
+            p.join()
+
+    for failure in failures:
+        print("FAIL:", failure)
+    raise SystemExit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
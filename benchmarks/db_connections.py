@@ -0,0 +1,70 @@
+"""Per-query latency: open-per-call connections vs the pooled reader.
+
+Run from the repo root:  python -m benchmarks.db_connections
+Uses a throwaway database so the real data/fantasy.db is never touched.
+"""
+
+import os
+import sqlite3
+import tempfile
+import time
+
+os.environ["FANTASY_DB_PATH"] = os.path.join(tempfile.mkdtemp(), "bench.db")
+
+from utils.constants import DB_PATH
+from utils.db import init_db, read_connection, write_connection
+
+QUERY = "SELECT id, name, color, abbreviation, active FROM teams WHERE active=1 ORDER BY name"
+ITERATIONS = 5_000
+
+
+def _seed(n_teams=20):
+    with write_connection() as conn:
+        conn.executemany(
+            "INSERT INTO teams (name, color, abbreviation) VALUES (?, ?, ?)",
+            [(f"Team {i}", "#FF6B35", f"T{i}") for i in range(n_teams)],
+        )
+
+
+def _connect():
+    """The old get_connection(): a new connection with WAL and foreign keys."""
+    conn = sqlite3.connect(DB_PATH)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA foreign_keys=ON")
+    return conn
+
+
+def _open_per_call():
+    conn = _connect()
+    try:
+        return conn.execute(QUERY).fetchall()
+    finally:
+        conn.close()
+
+
+def _pooled():
+    with read_connection() as conn:
+        return conn.execute(QUERY).fetchall()
+
+
+def _time(fn, iterations=ITERATIONS):
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    init_db()
+    _seed()
+    per_call = _time(_open_per_call)
+    pooled = _time(_pooled)
+    print(f"open-per-call : {per_call:8.1f} µs/query")
+    print(f"pooled reader : {pooled:8.1f} µs/query")
+    print(f"speedup       : {per_call / pooled:8.1f}×")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""Plain dict figures vs the same figures through Plotly's validators.
+
+Run from the repo root:  python -m benchmarks.figures
+Works on synthetic 74-match seasons for 10 and 100 teams; no database.
+For every chart factory it builds the dict figure, then passes it through
+go.Figure() (the validation the factories used to run trace by trace) and
+checks that the serialized JSON is identical. Times are per figure: building
+it, and building plus serializing it to the JSON Dash sends to the browser.
+(Key order aside; the JSON is compared parsed.)
+"""
+
+import json
+import time
+
+import numpy as np
+import plotly.graph_objects as go
+from plotly.io.json import to_json_plotly
+
+from utils import chart_helpers
+from utils.calculations import (
+    compute_cumulative_points,
+    compute_head_to_head,
+    compute_head_to_head_matrix,
+    compute_power_history,
+    compute_rolling_average,
+    compute_transfer_efficiency,
+    compute_transfer_pacing,
+)
+from utils.projections import simulate_season
+from utils.season import Season
+
+MATCHES = 74
+TEAM_COUNTS = (10, 100)
+ITERATIONS = 5
+
+
+def _season(n_teams, low, high, seed):
+    rng = np.random.default_rng(seed)
+    values = (rng.integers(low, high, (MATCHES, n_teams)) / 2).astype(np.float32)
+    return Season(
+        values=values,
+        mask=np.ones(values.shape, dtype=bool),
+        teams=tuple(f"Team {i:03d}" for i in range(n_teams)),
+        matches=np.arange(1, MATCHES + 1, dtype=np.int32),
+    )
+
+
+def _cases(n_teams):
+    """{factory name: (args...)} covering every fig_* function."""
+    scores = _season(n_teams, 100, 1400, n_teams)
+    transfers = _season(n_teams, 0, 8, n_teams + 1)
+    scores_df, transfers_df = scores.to_frame(), transfers.to_frame()
+    teams = list(scores.teams)
+    a, b = teams[:2]
+    colors = {t: f"#{(i * 2654435761) % 0xFFFFFF:06X}" for i, t in enumerate(teams)}
+    _, power_rank = compute_power_history(scores)
+    return {
+        "empty_fig": (),
+        "fig_points_race": (compute_cumulative_points(scores), colors),
+        "fig_rank_trajectory": (scores.to_frame(power_rank), colors),
+        "fig_points_earned": (scores_df, colors),
+        "fig_points_distribution": (scores_df, colors),
+        "fig_scoring_heatmap": (scores_df, colors),
+        "fig_head_to_head_bars": (scores_df, a, b, colors),
+        "fig_head_to_head_matrix": (compute_head_to_head_matrix(scores), teams),
+        "fig_rank_probabilities": (simulate_season(scores.upto(30), simulations=500),),
+        "fig_radar_comparison": (
+            {"Avg": 310.5, "Best": 690.0, "Wins": 40},
+            {"Avg": 290.0, "Best": 650.5, "Wins": 34},
+            a,
+            b,
+            colors,
+        ),
+        "fig_differential": (
+            scores_df,
+            a,
+            b,
+            compute_head_to_head(scores, a, b)["diff_series"],
+            colors,
+        ),
+        "fig_momentum": (compute_rolling_average(scores), colors),
+        "fig_transfer_efficiency": (compute_transfer_efficiency(scores, transfers), colors),
+        "fig_transfers_accumulated": (transfers_df, colors),
+        "fig_transfer_pacing": (
+            transfers_df.iloc[:30],
+            compute_transfer_pacing(transfers.upto(30), 30),
+            30,
+            colors,
+        ),
+        "fig_transfers_per_match": (transfers_df, colors),
+    }
+
+
+def _parsed(fig):
+    return json.loads(to_json_plotly(fig))
+
+
+def _time(fn):
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        fn()
+    return (time.perf_counter() - start) / ITERATIONS * 1e3
+
+
+def main():
+    for n_teams in TEAM_COUNTS:
+        print(f"{n_teams} teams × {MATCHES} matches (ms per figure: build / build + JSON)")
+        print(f"  {'figure':<28}{'dict':>18}{'validated':>22}")
+        totals = np.zeros(4)
+        for name, args in _cases(n_teams).items():
+            factory = getattr(chart_helpers, name)
+            assert _parsed(factory(*args)) == _parsed(go.Figure(factory(*args))), name
+            timings = (
+                _time(lambda: factory(*args)),
+                _time(lambda: to_json_plotly(factory(*args))),
+                _time(lambda: go.Figure(factory(*args))),
+                _time(lambda: to_json_plotly(go.Figure(factory(*args)))),
+            )
+            totals += timings
+            print(f"  {name:<28}{timings[0]:8.2f} / {timings[1]:7.2f}"
+                  f"{timings[2]:11.2f} / {timings[3]:8.2f}")
+        print(f"  {'all figures':<28}{totals[0]:8.2f} / {totals[1]:7.2f}"
+              f"{totals[2]:11.2f} / {totals[3]:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Server time per refresh tick while no data changes.
+
+Run from the repo root:  python -m benchmarks.idle_ticks
+Seeds a throwaway database, loads each page's refresh callback once, then
+times idle ticks through the Dash update endpoint (Flask test client):
+
+- page interval, cached output: every page interval tick served the stored
+  full outputs of its memoized callback
+- page interval, version check: the tick reaches the page callback, which
+  compares the data version and returns no_update
+- app version poll: the single app-level poll_data_version tick; the page
+  callbacks do not run at all
+"""
+
+import os
+import tempfile
+import time
+
+_tmp = tempfile.mkdtemp()
+os.environ["FANTASY_DB_PATH"] = os.path.join(_tmp, "bench.db")
+os.environ["FANTASY_CACHE_DIR"] = os.path.join(_tmp, "cache")
+
+import numpy as np
+
+import app
+from utils.metrics import get_version_key
+from utils.models import add_team, save_match_results
+
+TEAMS = 10
+MATCHES = 40
+ITERATIONS = 50
+
+# page refresh callback: (output id prefix, version store id)
+PAGES = {
+    "overview": ("overview-season-store", "overview-season-version"),
+    "stats": ("stats-distribution", "stats-version"),
+    "power rankings": ("pr-table", "pr-version"),
+}
+
+
+def _seed():
+    rng = np.random.default_rng(0)
+    names = [f"Team {i:02d}" for i in range(TEAMS)]
+    for name in names:
+        add_team(name, "#FF6B35", name[-2:])
+    for match in range(1, MATCHES + 1):
+        save_match_results(
+            match, dict(zip(names, (rng.integers(100, 1400, TEAMS) / 2).tolist())), {}
+        )
+
+
+def _body(output_key, inputs, state):
+    """A Dash update request for the callback registered under output_key."""
+    outputs = [
+        {"id": part.rsplit(".", 1)[0], "property": part.rsplit(".", 1)[1]}
+        for part in output_key.strip(".").split("...")
+    ]
+    prop = lambda p: {"id": p[0], "property": p[1], "value": p[2]}
+    return {
+        "output": output_key,
+        "outputs": outputs if len(outputs) > 1 else outputs[0],
+        "inputs": [prop(p) for p in inputs],
+        "state": [prop(p) for p in state],
+        "changedPropIds": [],
+    }
+
+
+def _time(client, body):
+    """(ms per request, response bytes)."""
+    size = len(client.post("/_dash-update-component", json=body).data)  # warm-up
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        client.post("/_dash-update-component", json=body)
+    return (time.perf_counter() - start) / ITERATIONS * 1e3, size
+
+
+def main():
+    with app.server.app_context():
+        _seed()
+        version = get_version_key()
+    client = app.server.test_client()
+    client.get("/")  # registers the page callbacks
+    keys = list(app.app.callback_map)
+
+    print(f"{TEAMS} teams × {MATCHES} matches, ms and bytes per idle tick per client")
+    for page, (output_id, store) in PAGES.items():
+        key = next(k for k in keys if f"{output_id}." in k)
+        data = ("data-version", "data", version)
+        full = _body(key, [data], [(store, "data", None)])
+        check = _body(key, [data], [(store, "data", version)])
+        client.post("/_dash-update-component", json=full)
+        for label, body in (("page interval, cached output", full),
+                            ("page interval, version check", check)):
+            ms, size = _time(client, body)
+            print(f"  {page:<16}{label:<32}{ms:8.2f} ms {size:9,} B")
+
+    poll = _body(
+        "data-version.data",
+        [("data-version-interval", "n_intervals", 1)],
+        [("data-version", "data", version)],
+    )
+    ms, size = _time(client, poll)
+    print(f"  {'any page':<16}{'app version poll':<32}{ms:8.2f} ms {size:9,} B")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Incremental LeaderboardState vs full compute_leaderboard() recomputes.
+
+Run from the repo root:  python -m benchmarks.leaderboard_state
+Works on synthetic in-memory Seasons (1,000 teams × 74 matches); no database.
+Syncs are compared with building a new state from scratch, which computes the
+same totals, ranks and power scores for every row.
+"""
+
+import dataclasses
+import time
+
+import numpy as np
+import pandas as pd
+
+from utils.calculations import (
+    compute_leaderboard,
+    compute_power_history,
+    compute_power_rankings,
+)
+from utils.leaderboard import LeaderboardState
+from utils.season import Season
+
+TEAMS = 1_000
+MATCHES = 74
+ITERATIONS = 200
+
+
+def _season(values):
+    return Season(
+        values=values.astype(np.float32),
+        mask=np.ones(values.shape, dtype=bool),
+        teams=tuple(f"Team {i:04d}" for i in range(values.shape[1])),
+        matches=np.arange(1, len(values) + 1, dtype=np.int32),
+    )
+
+
+def _edited(values, match_number):
+    edited = values.copy()
+    edited[match_number - 1, 0] += 25
+    return _season(edited)
+
+
+def _between(season, first, last):
+    rows = (season.matches >= first) & (season.matches <= last)
+    return Season(
+        season.values[rows], season.mask[rows], season.teams, season.matches[rows]
+    )
+
+
+def _time(fn, iterations=20):
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def _time_sync(state, before, after):
+    """Mean µs for state.sync(after), starting from a state synced to before."""
+    total = 0.0
+    for _ in range(ITERATIONS):
+        state.sync(before)
+        start = time.perf_counter()
+        state.sync(after)
+        total += time.perf_counter() - start
+    return total / ITERATIONS * 1e6
+
+
+def main():
+    rng = np.random.default_rng(0)
+    values = rng.integers(50, 700, (MATCHES, TEAMS)).astype(np.float64)
+    full = _season(values)
+    state = LeaderboardState()
+
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        LeaderboardState().sync(full)
+    rebuild = (time.perf_counter() - start) / ITERATIONS * 1e6
+
+    versioned = dataclasses.replace(full, version=(("scores", 1),))
+    cases = (
+        ("same data version", versioned, dataclasses.replace(versioned)),
+        ("append match 74", _season(values[:-1]), full),
+        ("edit match 70", full, _edited(values, 70)),
+        ("edit match 1", full, _edited(values, 1)),
+    )
+    print(f"{TEAMS} teams × {MATCHES} matches")
+    print(f"  full rebuild (new state): {rebuild:8.1f} µs   ({MATCHES} rows)")
+    for label, before, after in cases:
+        cost = _time_sync(state, before, after)
+        print(f"  sync {label:<19}: {cost:8.1f} µs   "
+              f"({state.recomputed_rows} rows recomputed)")
+        pd.testing.assert_frame_equal(
+            state.leaderboard(), compute_leaderboard(after), check_exact=True
+        )
+
+    state.sync(full)
+    pairs = (
+        ("slider to match 37", lambda: compute_leaderboard(full.upto(37)),
+         lambda: state.leaderboard(37)),
+        ("matches 20..50", lambda: compute_leaderboard(_between(full, 20, 50)),
+         lambda: state.leaderboard_between(20, 50)),
+        ("power rankings", lambda: compute_power_rankings(full),
+         lambda: state.power_rankings()),
+        ("power history", lambda: compute_power_history(full),
+         lambda: state.power_history()),
+    )
+    pd.testing.assert_frame_equal(
+        state.power_rankings(), compute_power_rankings(full), check_exact=True
+    )
+    for first, last in ((1, 1), (1, MATCHES), (20, 50), (37, 38), (74, 74)):
+        pd.testing.assert_frame_equal(
+            state.leaderboard_between(first, last),
+            compute_leaderboard(_between(full, first, last)),
+            check_exact=True,
+        )
+    for label, recompute_fn, lookup_fn in pairs:
+        print(f"  {label:<24}: recompute {_time(recompute_fn):8.1f} µs"
+              f"   lookup {_time(lookup_fn):8.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Idle cost and delivery time of the server-sent events channel.
+
+Run from the repo root:  python -m benchmarks.live_streams
+Seeds a throwaway database and opens STREAMS /data-version/stream
+connections to one app (Flask test client, one reader thread per stream;
+gunicorn's gevent workers run them as greenlets). Reports the data version
+reads the worker makes while they sit idle (the clients' fallback polls are
+paused while their stream is up), then how long a saved match
+takes to reach every stream: through publish_data_version() as the admin
+callbacks do, and through the watcher alone as a write from another worker
+would. Finally closes every stream and exits non-zero if the worker's
+watcher keeps running without them.
+"""
+
+import os
+import tempfile
+import threading
+import time
+
+_tmp = tempfile.mkdtemp()
+os.environ["FANTASY_DB_PATH"] = os.path.join(_tmp, "bench.db")
+os.environ["FANTASY_CACHE_DIR"] = os.path.join(_tmp, "cache")
+
+import app
+import utils.live as live
+from utils.constants import LIVE_CHECK_INTERVAL, VERSION_POLL_INTERVAL
+from utils.models import add_team, save_match_results
+
+TEAMS = 10
+STREAMS = 300
+IDLE_SECONDS = 5
+
+_reads = 0
+_get_version_key = live.get_version_key
+
+
+def _counted_version_key():
+    global _reads
+    _reads += 1
+    return _get_version_key()
+
+
+def _listen(response, received, closing):
+    """Append (time, version) for every version event on the stream.
+
+    Closes the stream, as a departing client would, at the first event after
+    closing is set.
+    """
+    for chunk in response.response:
+        if chunk.startswith(b"event: version"):
+            received.append((time.perf_counter(), chunk))
+            if closing.is_set():
+                response.close()
+                return
+
+
+def _delivery(streams, before, write):
+    """Seconds from write() until every stream received one more version."""
+    start = time.perf_counter()
+    write()
+    while any(len(received) <= before for _, received in streams):
+        time.sleep(0.001)
+    return max(received[before][0] for _, received in streams) - start
+
+
+def main():
+    global _reads
+    live.get_version_key = _counted_version_key
+    names = [f"Team {i:02d}" for i in range(TEAMS)]
+    with app.server.app_context():
+        for name in names:
+            add_team(name, "#FF6B35", name[-2:])
+
+    client = app.server.test_client()
+    closing = threading.Event()
+    streams = []
+    for _ in range(STREAMS):
+        response = client.get("/data-version/stream", buffered=False)
+        received = []
+        threading.Thread(target=_listen, args=(response, received, closing), daemon=True).start()
+        streams.append((response, received))
+    while any(not received for _, received in streams):
+        time.sleep(0.01)
+
+    _reads = 0
+    time.sleep(IDLE_SECONDS)
+    polls = STREAMS / (VERSION_POLL_INTERVAL / 1000) * IDLE_SECONDS
+    print(f"{STREAMS} idle streams, {IDLE_SECONDS} s")
+    print(f"  data version reads: {_reads} (check every {LIVE_CHECK_INTERVAL:g} s);"
+          f" the same clients polling instead: {polls:.0f}")
+
+    def published(match_number=1):
+        with app.server.app_context():
+            save_match_results(match_number, {names[0]: 100.0}, {})
+        live.publish_data_version()
+
+    def watched():
+        with app.server.app_context():
+            save_match_results(2, {names[0]: 100.0}, {})
+
+    print("  saved match reaches every stream in")
+    print(f"    published by the admin callback: {_delivery(streams, 1, published) * 1000:7.1f} ms")
+    print(f"    found by the watcher:            {_delivery(streams, 2, watched) * 1000:7.1f} ms")
+    print(f"    polling fallback:            up to {VERSION_POLL_INTERVAL / 1000:.0f} s")
+
+    closing.set()
+    _delivery(streams, 3, lambda: published(3))
+    start = time.perf_counter()
+    while live._watcher_pid is not None and time.perf_counter() - start < 3 * LIVE_CHECK_INTERVAL:
+        time.sleep(0.01)
+    if live._watcher_pid is not None or live._streams:
+        print(f"FAIL: watcher still running with {live._streams} open streams")
+        raise SystemExit(1)
+    print(f"  all streams closed: watcher stopped within {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
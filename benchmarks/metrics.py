@@ -0,0 +1,117 @@
+"""Shared metric snapshot vs each page computing its own stats.
+
+Run from the repo root:  python -m benchmarks.metrics
+Seeds 74 matches for 100 teams into a throwaway database, then times one
+refresh of the Stats, Power Rankings and Head-to-Head callbacks' data work:
+each page computing its metrics separately (the old callbacks) against all
+three reading one MetricSnapshot.
+"""
+
+import os
+import tempfile
+import time
+
+_tmp = tempfile.mkdtemp()
+os.environ["FANTASY_DB_PATH"] = os.path.join(_tmp, "bench.db")
+os.environ["FANTASY_CACHE_DIR"] = os.path.join(_tmp, "cache")
+
+import numpy as np
+
+import app
+from utils.calculations import (
+    compute_awards,
+    compute_consistency,
+    compute_cumulative_points,
+    compute_form_guide,
+    compute_power_rankings,
+    compute_rolling_average,
+    compute_streak_history,
+    compute_transfer_efficiency,
+)
+from utils.metrics import MetricSnapshot, get_metrics
+from utils.models import add_team, get_season, get_transfers_season, save_match_results
+
+TEAMS = 100
+MATCHES = 74
+ITERATIONS = 20
+
+PAGE_METRICS = {
+    "stats": ("scores_frame", "transfers_frame", "consistency", "rolling_average",
+              "transfer_efficiency"),
+    "power rankings": ("power_rankings", "form_guide", "streak_history",
+                       "rolling_average", "power_history", "awards"),
+    "head-to-head": ("consistency", "cumulative_points", "power_rankings",
+                     "transfer_efficiency"),
+}
+
+
+def _seed():
+    rng = np.random.default_rng(0)
+    names = [f"Team {i:03d}" for i in range(TEAMS)]
+    for name in names:
+        add_team(name, "#FF6B35", name[-3:])
+    for match in range(1, MATCHES + 1):
+        points = rng.integers(100, 1400, TEAMS) / 2
+        counts = rng.integers(0, 5, TEAMS)
+        save_match_results(
+            match,
+            dict(zip(names, points.tolist())),
+            dict(zip(names, counts.tolist())),
+        )
+
+
+def _separate():
+    """What the callbacks computed before the registry: every page on its own."""
+    season, transfers = get_season(), get_transfers_season()
+    season.to_frame(), transfers.to_frame()
+    compute_consistency(season)
+    compute_rolling_average(season)
+    compute_transfer_efficiency(season, transfers)
+
+    season, transfers = get_season(), get_transfers_season()
+    compute_power_rankings(season)
+    compute_form_guide(season)
+    compute_streak_history(season)
+    compute_rolling_average(season)
+    compute_awards(season, transfers)
+
+    season, transfers = get_season(), get_transfers_season()
+    compute_consistency(season)
+    compute_cumulative_points(season)
+    compute_power_rankings(season)
+    compute_transfer_efficiency(season, transfers)
+
+
+def _shared(snapshot):
+    for names in PAGE_METRICS.values():
+        snapshot.get(*names)
+
+
+def _time(fn):
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        fn()
+    return (time.perf_counter() - start) / ITERATIONS * 1e3
+
+
+def main():
+    with app.server.app_context():
+        _seed()
+        versions = get_metrics().versions
+        separate = _time(_separate)
+        cold = _time(lambda: _shared(MetricSnapshot(versions)))
+        warm_snapshot = get_metrics()
+        warm = _time(lambda: _shared(warm_snapshot))
+        computed = len(warm_snapshot.computed)
+        requested = sum(len(names) for names in PAGE_METRICS.values())
+
+    print(f"{TEAMS} teams × {MATCHES} matches, one refresh of three pages")
+    print(f"  separate per page       : {separate:8.2f} ms")
+    print(f"  shared snapshot (cold)  : {cold:8.2f} ms"
+          f"   ({computed} metrics computed once for {requested} page reads)")
+    print(f"  shared snapshot (warm)  : {warm:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Startup cost of init_db() and a check that fixtures survive a delete.
+
+Run from the repo root:  python -m benchmarks.migrations
+Uses a throwaway database. Times the first boot (every migration and the
+fixture seed) against an up-to-date boot (one PRAGMA read), then deletes a
+scheduled match and boots again. Exits non-zero if the match's fixture row
+(teams, stadium, date) did not come back.
+"""
+
+import os
+import tempfile
+import time
+
+os.environ["FANTASY_DB_PATH"] = os.path.join(tempfile.mkdtemp(), "bench.db")
+
+from utils.db import init_db, read_connection
+from utils.fixtures import IPL_2026_MATCHES
+from utils.models import add_team, delete_match_data, save_match_results
+
+ITERATIONS = 1_000
+MATCH = 47
+
+
+def _fixture_row(match_number):
+    with read_connection() as conn:
+        row = conn.execute(
+            "SELECT match_number, team_1, team_2, stadium, date_played"
+            " FROM matches WHERE match_number=?",
+            (match_number,),
+        ).fetchone()
+    return dict(row) if row else None
+
+
+def main():
+    start = time.perf_counter()
+    init_db()
+    first = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        init_db()
+    warm = (time.perf_counter() - start) / ITERATIONS
+    print(f"first boot    : {first * 1e3:8.2f} ms")
+    print(f"up-to-date    : {warm * 1e6:8.1f} µs")
+
+    add_team("Team 0", "#FF6B35", "T0")
+    save_match_results(MATCH, {"Team 0": 100})
+    delete_match_data(MATCH)
+    init_db()
+    expected = next(m for m in IPL_2026_MATCHES if m["match_number"] == MATCH)
+    row = _fixture_row(MATCH)
+    if row != expected:
+        print(f"FAIL: match {MATCH} after delete + init_db: {row}, expected {expected}")
+        raise SystemExit(1)
+    print(f"match {MATCH} fixture row restored after delete + init_db")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""Bytes per refresh tick: full outputs vs Dash Patch updates.
+
+Run from the repo root:  python -m benchmarks.patches
+Seeds MATCHES - 1 matches for TEAMS teams into a throwaway database, loads
+the Overview, Stats and Power Rankings refresh callbacks once, saves one
+more match and measures what the next tick sends to a client still on the
+previous data version: the full outputs as the callbacks sent them before
+Patches existed, the full outputs now (both with typed arrays), and the
+Patches. Every Patch is applied to the
+client's previous outputs and checked against a fresh full load. Then an
+edit of an early match must fall back to full outputs.
+"""
+
+import copy
+import json
+import os
+import tempfile
+
+_tmp = tempfile.mkdtemp()
+os.environ["FANTASY_DB_PATH"] = os.path.join(_tmp, "bench.db")
+os.environ["FANTASY_CACHE_DIR"] = os.path.join(_tmp, "cache")
+
+import numpy as np
+from dash._utils import to_json
+from plotly.io.json import to_json_plotly
+
+import app
+from pages import overview, power_rankings, stats
+from utils.metrics import get_metrics
+from utils.models import add_team, save_match_results
+
+TEAMS = 10
+MATCHES = 40
+
+# callback, function building its full outputs the way the callback used to
+CALLBACKS = {
+    "overview": (
+        overview.update_overview_season,
+        lambda metrics: [overview._season_payload(metrics)],
+    ),
+    "stats": (stats.update_stats, stats._stats_outputs),
+    "power_rankings": (
+        power_rankings.update_power_rankings,
+        power_rankings._power_rankings_outputs,
+    ),
+}
+
+_rng = np.random.default_rng(0)
+_names = [f"Team {i:02d}" for i in range(TEAMS)]
+
+
+def _save(match):
+    points = _rng.integers(100, 1400, TEAMS) / 2
+    counts = _rng.integers(0, 3, TEAMS)
+    save_match_results(
+        match, dict(zip(_names, points.tolist())), dict(zip(_names, counts.tolist()))
+    )
+
+
+def _apply(value, patch):
+    """What the Dash renderer does with a Patch (the operations used here)."""
+    value = copy.deepcopy(value)
+    for op in patch["operations"]:
+        *path, last = op["location"]
+        parent = value
+        for key in path:
+            parent = parent[key]
+        if op["operation"] == "Assign":
+            parent[last] = op["params"]["value"]
+        elif op["operation"] == "Extend":
+            parent[last].extend(op["params"]["value"])
+        elif op["operation"] == "Delete":
+            del parent[last]
+        else:
+            raise ValueError(f"unexpected operation {op['operation']}")
+    return value
+
+
+def _is_patch(value):
+    return isinstance(value, dict) and "__dash_patch_update" in value
+
+
+def _tick(callback, client_version):
+    """(outputs as the client receives them, response bytes)."""
+    payload = to_json(callback(None, client_version))
+    return json.loads(payload), len(payload)
+
+
+def main():
+    with app.server.app_context():
+        for name in _names:
+            add_team(name, "#FF6B35", name[-2:])
+        for match in range(1, MATCHES):
+            _save(match)
+
+        loaded = {name: _tick(cb, None)[0] for name, (cb, _) in CALLBACKS.items()}
+        _save(MATCHES)
+        print(f"{TEAMS} teams, tick after saving match {MATCHES} (KiB sent per client)")
+        print(f"  {'callback':<16}{'before':>9}{'full':>9}{'patch':>9}{'unchanged':>11}")
+        for name, (callback, build) in CALLBACKS.items():
+            before = len(to_json_plotly(build(get_metrics())))
+            old = loaded[name]
+            outputs, patched = _tick(callback, old[-1])
+            fresh, full = _tick(callback, None)
+            applied = [
+                _apply(o, n) if _is_patch(n) else n for o, n in zip(old[:-1], outputs[:-1])
+            ]
+            assert applied == fresh[:-1], name
+            assert any(_is_patch(o) for o in outputs), name
+            _, unchanged = _tick(callback, fresh[-1])
+            print(f"  {name:<16}{before / 1024:9.1f}{full / 1024:9.1f}"
+                  f"{patched / 1024:9.1f}{unchanged / 1024:11.2f}")
+            loaded[name] = fresh
+
+        save_match_results(3, {_names[0]: 1.5}, {})
+        for name, (callback, _) in CALLBACKS.items():
+            outputs, _ = _tick(callback, loaded[name][-1])
+            assert not any(_is_patch(o) for o in outputs), name
+        print("  edit of match 3: every callback sent full outputs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Monte Carlo season projections: simulated seasons per second.
+
+Run from the repo root:  python -m benchmarks.projections
+Works on synthetic in-memory Seasons (30 matches played of 74); no database.
+Times simulate_season() in-process and spread over a process pool, and checks
+that both give identical results.
+"""
+
+import os
+import time
+
+import numpy as np
+
+from utils.constants import PROJECTION_SIMULATIONS
+from utils.projections import simulate_season
+from utils.season import Season
+
+PLAYED = 30
+TEAM_COUNTS = (10, 100)
+POOL_WORKERS = max(2, min(4, os.cpu_count() or 1))
+
+
+def _season(n_teams):
+    rng = np.random.default_rng(n_teams)
+    values = (rng.integers(100, 1400, (PLAYED, n_teams)) / 2).astype(np.float32)
+    return Season(
+        values=values,
+        mask=np.ones(values.shape, dtype=bool),
+        teams=tuple(f"Team {i:03d}" for i in range(n_teams)),
+        matches=np.arange(1, PLAYED + 1, dtype=np.int32),
+    )
+
+
+def _run(season, workers):
+    start = time.perf_counter()
+    projection = simulate_season(season, workers=workers)
+    return projection, time.perf_counter() - start
+
+
+def main():
+    print(f"{PROJECTION_SIMULATIONS:,} simulated seasons, {PLAYED} of 74 matches played")
+    for n_teams in TEAM_COUNTS:
+        season = _season(n_teams)
+        simulate_season(season, simulations=100)  # warm-up
+        serial, serial_s = _run(season, workers=0)
+        pooled, pooled_s = _run(season, workers=POOL_WORKERS)
+        assert np.array_equal(
+            serial["rank_probabilities"], pooled["rank_probabilities"]
+        )
+        print(f"  {n_teams:>4} teams   in-process {PROJECTION_SIMULATIONS / serial_s:>10,.0f} sims/s"
+              f"   {POOL_WORKERS} workers {PROJECTION_SIMULATIONS / pooled_s:>10,.0f} sims/s")
+
+
+if __name__ == "__main__":
+    main()
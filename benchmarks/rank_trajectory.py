@@ -0,0 +1,39 @@
+"""Time compute_rank_trajectory() (every team's rank after every match).
+
+Run from the repo root:  python -m benchmarks.rank_trajectory
+Works on synthetic 74-match Seasons; no database.
+"""
+
+import time
+
+import numpy as np
+
+from utils.calculations import compute_rank_trajectory
+from utils.season import Season
+
+MATCHES = 74
+TEAM_COUNTS = (10, 100, 250, 1_000)
+ITERATIONS = 50
+
+
+def main():
+    rng = np.random.default_rng(0)
+    for n_teams in TEAM_COUNTS:
+        # Multiples of 10 so tied totals actually occur
+        values = rng.integers(5, 70, (MATCHES, n_teams)).astype(np.float32) * 10
+        season = Season(
+            values=values,
+            mask=np.ones(values.shape, dtype=bool),
+            teams=tuple(f"Team {i:04d}" for i in range(n_teams)),
+            matches=np.arange(1, MATCHES + 1, dtype=np.int32),
+        )
+        compute_rank_trajectory(season)  # warm-up
+        start = time.perf_counter()
+        for _ in range(ITERATIONS):
+            compute_rank_trajectory(season)
+        elapsed = (time.perf_counter() - start) / ITERATIONS * 1e3
+        print(f"{n_teams:>5} teams × {MATCHES} matches : {elapsed:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""Columnar Season store vs the pivoted DataFrame path: memory and time.
+
+Run from the repo root:  python -m benchmarks.season_store
+Seeds 74 matches for 10 and 1,000 teams into a throwaway database, then
+compares load time, resident size and the core calculations.
+"""
+
+import os
+import tempfile
+import time
+import warnings
+
+os.environ["FANTASY_DB_PATH"] = os.path.join(tempfile.mkdtemp(), "bench.db")
+
+import numpy as np
+import pandas as pd
+
+from utils.constants import POWER_RANKING_DECAY, ROLLING_WINDOW
+from utils.db import init_db, read_connection, write_connection
+from utils.models import _load_season
+from utils.calculations import (
+    compute_leaderboard,
+    compute_cumulative_points,
+    compute_consistency,
+    compute_power_rankings,
+    compute_rolling_average,
+)
+
+MATCHES = 74
+TEAM_COUNTS = (10, 1_000)
+ITERATIONS = 20
+
+
+# ─── Legacy DataFrame path (pre-Season implementations) ─────────────────────
+
+
+def _legacy_load():
+    with read_connection() as conn:
+        df = pd.read_sql_query(
+            """SELECT m.match_number AS Match, t.name AS team, s.points
+               FROM scores s
+               JOIN matches m ON s.match_id = m.id
+               JOIN teams t   ON s.team_id  = t.id
+               WHERE t.active = 1
+               ORDER BY m.match_number""",
+            conn,
+        )
+    return df.pivot(index="Match", columns="team", values="points").reset_index()
+
+
+def _teams(df):
+    return [c for c in df.columns if c != "Match"]
+
+
+def _legacy_calculations(df):
+    teams = _teams(df)
+    totals = df[teams].sum().sort_values(ascending=False)
+    prev = df.iloc[:-1][teams].sum().sort_values(ascending=False)
+    cum = df[["Match"]].copy()
+    for t in teams:
+        cum[t] = df[t].cumsum()
+    cons = []
+    for t in teams:
+        s = df[t].dropna()
+        cons.append((t, s.mean(), s.std(), s.min(), s.max()))
+    n = len(df)
+    weights = np.array([POWER_RANKING_DECAY ** (n - 1 - i) for i in range(n)])
+    weights = weights / weights.sum() * n
+    power = {t: float(np.dot(df[t].fillna(0).values, weights)) for t in teams}
+    rolling = df[["Match"]].copy()
+    for t in teams:
+        rolling[t] = df[t].rolling(window=ROLLING_WINDOW, min_periods=1).mean()
+    return totals, prev, cum, cons, power, rolling
+
+
+def _season_load():
+    return _load_season("scores", "points")
+
+
+def _season_calculations(season):
+    return (
+        compute_leaderboard(season),
+        compute_cumulative_points(season),
+        compute_consistency(season),
+        compute_power_rankings(season),
+        compute_rolling_average(season),
+    )
+
+
+# ─── Harness ────────────────────────────────────────────────────────────────
+
+
+def _seed(n_teams):
+    rng = np.random.default_rng(n_teams)
+    with write_connection() as conn:
+        conn.execute("DELETE FROM scores")
+        conn.execute("DELETE FROM teams")
+        conn.executemany(
+            "INSERT INTO teams (name, color, abbreviation) VALUES (?, ?, ?)",
+            [(f"Team {i:04d}", "#FF6B35", f"T{i}") for i in range(n_teams)],
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO matches (match_number) VALUES (?)",
+            [(m,) for m in range(1, MATCHES + 1)],
+        )
+        conn.executemany(
+            """INSERT INTO scores (match_id, team_id, points)
+               SELECT m.id, t.id, ? FROM matches m, teams t
+               WHERE m.match_number = ? AND t.name = ?""",
+            [
+                (float(rng.integers(50, 700)), m, f"Team {i:04d}")
+                for m in range(1, MATCHES + 1)
+                for i in range(n_teams)
+            ],
+        )
+
+
+def _time(fn, iterations=ITERATIONS):
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e3
+
+
+def main():
+    # The legacy column-by-column frames are fragmented by design.
+    warnings.simplefilter("ignore", pd.errors.PerformanceWarning)
+    init_db()
+    for n_teams in TEAM_COUNTS:
+        _seed(n_teams)
+        df = _legacy_load()
+        season = _season_load()
+        assert np.allclose(
+            season.masked(), df[list(season.teams)].to_numpy(), equal_nan=True
+        )
+
+        df_bytes = df.memory_usage(deep=True).sum()
+        print(f"\n{n_teams} teams × {MATCHES} matches")
+        print(f"  memory   DataFrame {df_bytes / 1024:9.1f} KiB"
+              f"   Season {season.nbytes / 1024:9.1f} KiB"
+              f"   ({df_bytes / season.nbytes:.1f}× smaller)")
+        for label, legacy, columnar in (
+            ("load", _legacy_load, _season_load),
+            ("calcs", lambda: _legacy_calculations(df),
+             lambda: _season_calculations(season)),
+        ):
+            old, new = _time(legacy), _time(columnar)
+            print(f"  {label:<8} DataFrame {old:9.2f} ms"
+                  f"    Season {new:9.2f} ms   ({old / new:.1f}× faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""SVG vs WebGL traces for the dense line/scatter charts, 200 teams.
+
+Run from the repo root:  python -m benchmarks.webgl [output.html]
+Builds a synthetic 200-team, 74-match season and renders each chart that
+switches to scattergl twice: forced to SVG (threshold = inf) and with the
+WebGL choice. Prints the build time and payload size of both, and writes a
+self-contained HTML page (plotly.js inlined) that times Plotly.newPlot and a
+relayout (zoom) for each figure in the browser: open it and read the table.
+"""
+
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+from plotly.io.json import to_json_plotly
+from plotly.offline import get_plotlyjs
+
+from utils.calculations import (
+    compute_cumulative_points,
+    compute_rolling_average,
+    compute_transfer_efficiency,
+)
+from utils.chart_helpers import (
+    fig_momentum,
+    fig_points_earned,
+    fig_points_race,
+    fig_transfer_efficiency,
+    fig_transfers_per_match,
+)
+from utils.constants import WEBGL_POINT_THRESHOLD
+from utils.season import Season
+
+TEAMS = 200
+MATCHES = 74
+RENDERS = 3
+
+PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>SVG vs WebGL render times</title>
+<script>{plotlyjs}</script></head>
+<body style="font-family: sans-serif">
+<h3>{teams} teams × {matches} matches: ms per render (median of {renders})</h3>
+<table id="results" border="1" cellpadding="4">
+<tr><th>figure</th><th>SVG newPlot</th><th>WebGL newPlot</th>
+<th>SVG zoom</th><th>WebGL zoom</th></tr></table>
+<div id="chart" style="width: 1000px; height: 420px"></div>
+<script>
+const figures = {figures};
+const median = (xs) => xs.slice().sort((a, b) => a - b)[Math.floor(xs.length / 2)];
+async function time(fig) {{
+    const chart = document.getElementById("chart");
+    const plot = [], zoom = [];
+    for (let i = 0; i < {renders}; i++) {{
+        Plotly.purge(chart);
+        let start = performance.now();
+        await Plotly.newPlot(chart, fig.data, fig.layout);
+        plot.push(performance.now() - start);
+        start = performance.now();
+        await Plotly.relayout(chart, {{"xaxis.range": [10, 40]}});
+        zoom.push(performance.now() - start);
+    }}
+    return [median(plot), median(zoom)];
+}}
+(async () => {{
+    const table = document.getElementById("results");
+    for (const [name, pair] of Object.entries(figures)) {{
+        const [svgPlot, svgZoom] = await time(pair.svg);
+        const [glPlot, glZoom] = await time(pair.webgl);
+        const row = table.insertRow();
+        for (const v of [name, svgPlot, glPlot, svgZoom, glZoom]) {{
+            row.insertCell().textContent = typeof v === "number" ? v.toFixed(1) : v;
+        }}
+    }}
+    Plotly.purge(document.getElementById("chart"));
+}})();
+</script></body></html>
+"""
+
+
+def _season(low, high, seed):
+    rng = np.random.default_rng(seed)
+    values = (rng.integers(low, high, (MATCHES, TEAMS)) / 2).astype(np.float32)
+    return Season(
+        values=values,
+        mask=np.ones(values.shape, dtype=bool),
+        teams=tuple(f"Team {i:03d}" for i in range(TEAMS)),
+        matches=np.arange(1, MATCHES + 1, dtype=np.int32),
+    )
+
+
+def _charts():
+    scores = _season(100, 1400, 0)
+    transfers = _season(0, 8, 1)
+    colors = {t: f"#{(i * 2654435761) % 0xFFFFFF:06X}" for i, t in enumerate(scores.teams)}
+    return {
+        "fig_points_race": (fig_points_race, compute_cumulative_points(scores), colors),
+        "fig_points_earned": (fig_points_earned, scores.to_frame(), colors),
+        "fig_momentum": (fig_momentum, compute_rolling_average(scores), colors),
+        "fig_transfer_efficiency": (
+            fig_transfer_efficiency,
+            compute_transfer_efficiency(scores, transfers),
+            colors,
+        ),
+        "fig_transfers_per_match": (fig_transfers_per_match, transfers.to_frame(), colors),
+    }
+
+
+def _build(factory, args, threshold):
+    start = time.perf_counter()
+    fig = factory(*args, webgl_threshold=threshold)
+    return fig, (time.perf_counter() - start) * 1e3
+
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(tempfile.gettempdir(), "webgl_render.html")
+    print(f"{TEAMS} teams × {MATCHES} matches = {TEAMS * MATCHES:,} points per chart"
+          f" (WEBGL_POINT_THRESHOLD = {WEBGL_POINT_THRESHOLD:,})")
+    print(f"  {'figure':<26}{'trace':>11}{'build ms':>10}{'JSON KiB':>10}")
+    figures = {}
+    for name, (factory, *args) in _charts().items():
+        pair = {}
+        for mode, threshold in (("svg", math.inf), ("webgl", WEBGL_POINT_THRESHOLD)):
+            fig, build_ms = _build(factory, args, threshold)
+            payload = to_json_plotly(fig)
+            pair[mode] = json.loads(payload)
+            print(f"  {name if mode == 'svg' else '':<26}{fig['data'][0]['type']:>11}"
+                  f"{build_ms:10.2f}{len(payload) / 1024:10.1f}")
+        figures[name] = pair
+
+    with open(path, "w") as f:
+        f.write(
+            PAGE.format(
+                plotlyjs=get_plotlyjs(),
+                figures=json.dumps(figures),
+                teams=TEAMS,
+                matches=MATCHES,
+                renders=RENDERS,
+            )
+        )
+    print(f"Browser render times: open {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+# Gunicorn settings, read from the working directory by `gunicorn app:server`.
+#
+# gevent workers keep the /data-version/stream server-sent event connections
+# as idle greenlets instead of each one holding a sync worker.
+#
+# The trade-off: a gevent worker runs one greenlet at a time, and sqlite3
+# queries and the CPU work of a callback (figure builds, tens of ms for a
+# page refresh; a projection cache miss, about 160 ms for 10 teams) do not
+# yield to it. While one runs, every other request and stream in that worker
+# waits, so a stream's next event can be late by that long. Only the streams
+# of the busy worker wait, so run more than one worker; the callback caches
+# are shared between them (FileSystemCache), each keeps its own per-process
+# state (LeaderboardState, metric snapshots, one watcher while it has
+# streams). If callbacks ever take seconds, keep sync workers for the app
+# and serve /data-version/stream from a separate gevent process instead.
+
+import os
+
+worker_class = "gevent"
+worker_connections = 1000
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
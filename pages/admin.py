@@ -10,8 +10,7 @@ from utils.models import (
     add_team,
     deactivate_team,
     reactivate_team,
-    upsert_scores,
-    upsert_transfers,
+    save_match_results,
     get_match_scores_for_edit,
     get_match_transfers_for_edit,
     delete_match_data,
@@ -20,7 +19,7 @@ from utils.models import (
     get_match_details,
 )
 from utils.components import section_header, form_field
-from utils.cache import clear_data_cache
+from utils.live import publish_data_version
 
 dash.register_page(__name__, path="/admin", name="Admin", order=4)
 
@@ -519,7 +518,6 @@ def manage_teams(add_clicks, deactivate_clicks, reactivate_clicks, name, abbr, c
         else:
             try:
                 add_team(name, color, abbr)
-                clear_data_cache()
                 msg = f"✅ Added {name}"
                 name, abbr = "", ""
             except Exception as e:
@@ -528,13 +526,11 @@ def manage_teams(add_clicks, deactivate_clicks, reactivate_clicks, name, abbr, c
     elif isinstance(triggered, dict) and triggered.get("type") == "deactivate-team":
         team_id = triggered["index"]
         deactivate_team(team_id)
-        clear_data_cache()
         msg = "Team deactivated"
 
     elif isinstance(triggered, dict) and triggered.get("type") == "reactivate-team":
         team_id = triggered["index"]
         reactivate_team(team_id)
-        clear_data_cache()
         msg = "Team reactivated"
 
     # Rebuild teams list
@@ -688,20 +684,17 @@ def save_match_data(
     if not scores and not transfers:
         return "⚠️ Enter at least one score or transfer value"
 
-    details = get_match_details(int(match_number))
-    if scores:
-        upsert_scores(
-            int(match_number),
-            scores,
-            team_1=details.get("team_1", ""),
-            team_2=details.get("team_2", ""),
-            stadium=details.get("stadium", ""),
-            date_played=details.get("date_played", ""),
-        )
-    if transfers:
-        upsert_transfers(int(match_number), transfers)
-
-    clear_data_cache()
+    details = get_match_details(int(match_number)) if scores else {}
+    save_match_results(
+        int(match_number),
+        scores_dict=scores,
+        transfers_dict=transfers,
+        team_1=details.get("team_1"),
+        team_2=details.get("team_2"),
+        stadium=details.get("stadium"),
+        date_played=details.get("date_played"),
+    )
+    publish_data_version()
 
     saved_parts = []
     if scores:
@@ -725,7 +718,7 @@ def delete_match(n_clicks, match_number):
     if not match_number:
         return "⚠️ Enter a match number to delete"
     delete_match_data(int(match_number))
-    clear_data_cache()
+    publish_data_version()
     return f"🗑️ Deleted all data for Match {match_number}"
 
 
@@ -1,24 +1,17 @@
 import dash
-from dash import html, dcc, callback, Input, Output
+from dash import html, dcc, callback, Input, Output, no_update
 import dash_mantine_components as dmc
+import numpy as np
 
-from utils.models import (
-    get_scores_dataframe,
-    get_transfers_dataframe,
-    get_team_color_map,
-    get_all_teams,
-)
-from utils.calculations import (
-    compute_head_to_head,
-    compute_consistency,
-    compute_cumulative_points,
-    compute_transfer_efficiency,
-    compute_power_rankings,
-)
+from utils.models import get_team_color_map, get_all_teams
+from utils.cache import memoize_callback
+from utils.metrics import METRIC_TABLES, get_metrics
+from utils.calculations import compute_head_to_head, head_to_head_lookup
 from utils.chart_helpers import (
     fig_head_to_head_bars,
     fig_radar_comparison,
     fig_differential,
+    fig_head_to_head_matrix,
     empty_fig,
 )
 from utils.components import section_header, chart_card, create_stat_card, empty_state
@@ -85,6 +78,17 @@ layout = html.Div(
             ],
             className="page-single-column",
         ),
+        # League-wide matrix
+        section_header(
+            "League Head-to-Head",
+            "Every pairing at a glance — click a cell to compare those two teams",
+        ),
+        html.Div(
+            [
+                html.Div([chart_card("h2h-matrix")], className="mb-4"),
+            ],
+            className="page-single-column",
+        ),
     ],
     className="page-content",
 )
@@ -104,6 +108,34 @@ def populate_dropdowns(_):
     return opts, opts
 
 
+# ─── League matrix ──────────────────────────────────────────────────────────
+
+
+@callback(
+    Output("h2h-matrix", "figure"),
+    Input("data-version", "data"),
+)
+@memoize_callback(*METRIC_TABLES)
+def update_h2h_matrix(_data_version):
+    metrics = get_metrics()
+    matrix, lb = metrics.get("head_to_head_matrix", "leaderboard")
+    return fig_head_to_head_matrix(matrix, lb["Team"].tolist())
+
+
+@callback(
+    Output("h2h-team-a", "value"),
+    Output("h2h-team-b", "value"),
+    Input("h2h-matrix", "clickData"),
+    prevent_initial_call=True,
+)
+def select_pair_from_matrix(click_data):
+    point = (click_data or {}).get("points", [{}])[0]
+    team_a, team_b = point.get("y"), point.get("x")
+    if not team_a or not team_b or team_a == team_b:
+        return no_update, no_update
+    return team_a, team_b
+
+
 # ─── Main update ─────────────────────────────────────────────────────────────
 
 
@@ -121,19 +153,16 @@ def update_h2h(team_a, team_b):
         msg = "Please select two different teams" if team_a == team_b and team_a else ""
         return [], placeholder, placeholder, placeholder
 
-    scores_df = get_scores_dataframe()
-    transfers_df = get_transfers_dataframe()
+    metrics = get_metrics()
+    season = metrics["season"]
     colors = get_team_color_map()
 
-    if (
-        scores_df.empty
-        or team_a not in scores_df.columns
-        or team_b not in scores_df.columns
-    ):
+    ia, ib = season.team_index(team_a), season.team_index(team_b)
+    if season.is_empty or ia is None or ib is None:
         return [], placeholder, placeholder, placeholder
 
-    # Head-to-head stats
-    h2h = compute_head_to_head(scores_df, team_a, team_b)
+    # Head-to-head record: O(1) reads from the league matrix
+    h2h = head_to_head_lookup(metrics["head_to_head_matrix"], team_a, team_b)
 
     # Win record cards
     win_cards = [
@@ -148,11 +177,10 @@ def update_h2h(team_a, team_b):
     ]
 
     # Radar chart data
-    teams_cols = [c for c in scores_df.columns if c != "Match"]
-    cons = compute_consistency(scores_df)
+    cons = metrics["consistency"]
     cons_map = {r["Team"]: r for _, r in cons.iterrows()}
 
-    cum = compute_cumulative_points(scores_df)
+    cum = metrics["cumulative_points"]
     total_a = cum[team_a].iloc[-1] if team_a in cum.columns else 0
     total_b = cum[team_b].iloc[-1] if team_b in cum.columns else 0
 
@@ -168,15 +196,16 @@ def update_h2h(team_a, team_b):
     consistency_a = max_std - cons_map.get(team_a, {}).get("Std Dev", 0)
     consistency_b = max_std - cons_map.get(team_b, {}).get("Std Dev", 0)
 
-    best_a = scores_df[team_a].max()
-    best_b = scores_df[team_b].max()
+    best = season.masked()
+    best_a = np.nanmax(best[:, ia])
+    best_b = np.nanmax(best[:, ib])
 
-    pr = compute_power_rankings(scores_df)
+    pr = metrics["power_rankings"]
     pr_map = {r["Team"]: r["Power Score"] for _, r in pr.iterrows()}
     power_a = pr_map.get(team_a, 0)
     power_b = pr_map.get(team_b, 0)
 
-    eff_df = compute_transfer_efficiency(scores_df, transfers_df)
+    eff_df = metrics["transfer_efficiency"]
     eff_a = (
         eff_df[team_a].dropna().iloc[-1]
         if team_a in eff_df.columns and not eff_df[team_a].dropna().empty
@@ -206,7 +235,9 @@ def update_h2h(team_a, team_b):
     }
 
     radar_fig = fig_radar_comparison(stats_a, stats_b, team_a, team_b, colors)
+    scores_df = metrics["scores_frame"]
     bars_fig = fig_head_to_head_bars(scores_df, team_a, team_b, colors)
-    diff_fig = fig_differential(scores_df, team_a, team_b, h2h["diff_series"], colors)
+    diff_series = compute_head_to_head(season, team_a, team_b)["diff_series"]
+    diff_fig = fig_differential(scores_df, team_a, team_b, diff_series, colors)
 
     return win_cards, radar_fig, bars_fig, diff_fig
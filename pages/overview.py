@@ -1,25 +1,32 @@
-import dash
-from dash import html, dcc, callback, Input, Output
-import dash_mantine_components as dmc
+import math
 
-from utils.constants import TOTAL_MATCHES, TOTAL_TRANSFERS
-from utils.models import (
-    get_scores_dataframe,
-    get_transfers_dataframe,
-    get_team_color_map,
-    get_max_match_number,
-    get_match_details,
+import dash
+from dash import (
+    html,
+    dcc,
+    callback,
+    clientside_callback,
+    ClientsideFunction,
+    Input,
+    Output,
+    State,
+    no_update,
 )
-from utils.calculations import compute_leaderboard, compute_cumulative_points
-from utils.chart_helpers import fig_points_race, fig_points_earned, empty_fig
-from utils.components import (
-    create_stat_card,
-    section_header,
-    chart_card,
-    season_progress,
-    create_leaderboard,
-    empty_state,
+import dash_mantine_components as dmc
+import numpy as np
+
+from utils.constants import TOTAL_MATCHES, TOTAL_TRANSFERS, WEBGL_POINT_THRESHOLD
+from utils.models import get_all_matches, get_team_color_map, get_max_match_number
+from utils.cache import memoize_callback
+from utils.metrics import METRIC_TABLES, get_metrics
+from utils.patches import patch_outputs
+from utils.chart_helpers import (
+    fig_points_race,
+    fig_points_earned,
+    fig_rank_trajectory,
+    empty_fig,
 )
+from utils.components import section_header, chart_card, empty_state
 
 dash.register_page(__name__, path="/", name="Overview", order=0)
 
@@ -77,53 +84,22 @@ def _team_logo_src(team_abbr):
     return dash.get_asset_url(f"images/ipl-teams/{abbreviation.strip().lower()}.png")
 
 
-def _build_overview_fixture(match_number):
-    """Admin-style fixture card with logos, match info, date and stadium."""
-    details = get_match_details(int(match_number))
-    t1_name, t1_abbr = _normalize_ipl_team(details.get("team_1"))
-    t2_name, t2_abbr = _normalize_ipl_team(details.get("team_2"))
-    stadium = details.get("stadium") or "Stadium TBD"
-    match_date = _format_match_date(details.get("date_played"))
-
-    def team_badge(name, abbr):
-        logo_src = _team_logo_src(abbr)
-        logo = (
-            html.Img(src=logo_src, alt=name, className="ov-fix-logo")
-            if logo_src
-            else html.Div(abbr[:3], className="ov-fix-logo ov-fix-logo-fallback")
-        )
-        return html.Div(
-            [logo, html.Span(abbr, className="ov-fix-code")],
-            className="ov-fix-badge",
-        )
+NO_MATCH_DETAILS = {"team_1": "", "team_2": "", "stadium": "", "date_played": ""}
 
-    return html.Div(
-        [
-            # Header row: match pill + date
-            html.Div(
-                [
-                    html.Span(
-                        f"Match {int(match_number)}",
-                        className="admin-match-number-pill",
-                    ),
-                    html.Span(match_date, className="ov-fix-date"),
-                ],
-                className="ov-fix-header",
-            ),
-            # Team badges
-            html.Div(
-                [
-                    team_badge(t1_name, t1_abbr),
-                    html.Span("vs", className="ov-fix-vs"),
-                    team_badge(t2_name, t2_abbr),
-                ],
-                className="ov-fix-matchup",
-            ),
-            # Stadium
-            html.Span(stadium, className="ov-fix-stadium"),
-        ],
-        className="ov-fix-card",
-    )
+
+def _overview_fixture(match_number, details):
+    """What the fixture card shows for one match; overview.js builds the card
+    (logos, match pill, date and stadium)."""
+    teams = []
+    for team in (details.get("team_1"), details.get("team_2")):
+        name, abbr = _normalize_ipl_team(team)
+        teams.append({"name": name, "abbr": abbr, "logo": _team_logo_src(abbr)})
+    return {
+        "match": int(match_number),
+        "date": _format_match_date(details.get("date_played")),
+        "stadium": details.get("stadium") or "Stadium TBD",
+        "teams": teams,
+    }
 
 
 def _slider_marks():
@@ -142,7 +118,8 @@ def layout():
 
     return html.Div(
         [
-            dcc.Interval(id="overview-interval", interval=60_000, n_intervals=0),
+            dcc.Store(id="overview-season-store"),
+            dcc.Store(id="overview-season-version"),
             # ── Hero: fixture (left) + slider & stat cards (right) ─────────
             html.Div(
                 [
@@ -194,6 +171,7 @@ def layout():
                                     [
                                         dmc.TabsTab("Points Race", value="race"),
                                         dmc.TabsTab("Points Per Match", value="earned"),
+                                        dmc.TabsTab("Rank Over Time", value="rank"),
                                     ],
                                     className="ov-chart-tabs-list",
                                 ),
@@ -205,6 +183,10 @@ def layout():
                                     chart_card("overview-earned-chart"),
                                     value="earned",
                                 ),
+                                dmc.TabsPanel(
+                                    chart_card("overview-rank-chart"),
+                                    value="rank",
+                                ),
                             ],
                             value="race",
                             color="orange",
@@ -225,166 +207,118 @@ def layout():
 
 
 @callback(
+    Output("overview-season-store", "data"),
+    Output("overview-season-version", "data"),
+    Input("data-version", "data"),
+    State("overview-season-version", "data"),
+)
+@memoize_callback(*METRIC_TABLES)
+def update_overview_season(_data_version, client_version):
+    """Send the season payload once per data version (a Patch extending it
+    after a new match); no_update while the browser holds the current one."""
+    metrics = get_metrics()
+    version = metrics.version_key
+    if version == client_version:
+        return no_update, no_update
+    [payload] = patch_outputs(
+        "overview", metrics, client_version, [_season_payload(metrics)]
+    )
+    return payload, version
+
+
+# The slider is handled in the browser (assets/overview.js): it slices the
+# season payload and rebuilds the cards, leaderboard and figures locally.
+clientside_callback(
+    ClientsideFunction(namespace="overview", function_name="matchView"),
     Output("overview-progress", "children"),
     Output("overview-stat-cards", "children"),
     Output("overview-leaderboard", "children"),
     Output("overview-race-chart", "figure"),
     Output("overview-earned-chart", "figure"),
-    Input("overview-interval", "n_intervals"),
+    Output("overview-rank-chart", "figure"),
+    Input("overview-season-store", "data"),
     Input("overview-match-slider", "value"),
 )
-def update_overview(_n, selected_match):
-    scores_df = get_scores_dataframe()
-    colors = get_team_color_map()
-    max_match = get_max_match_number()
-
-    selected_match = int(selected_match) if selected_match else (max_match or 1)
-
-    # Filter scores up to the selected match
-    if not scores_df.empty and "Match" in scores_df.columns:
-        scores_df = scores_df[scores_df["Match"] <= selected_match]
 
-    # Progress header
-    display_match = selected_match if selected_match > 0 else max_match
-    progress = (
-        season_progress(display_match, TOTAL_MATCHES) if display_match > 0 else ""
-    )
-
-    if scores_df.empty or len(scores_df.columns) <= 1:
-        return (
-            progress,
-            [],
-            empty_state(),
-            empty_fig("Enter match scores from the Admin page to see the points race!"),
-            empty_fig(),
-        )
-
-    # Leaderboard
-    lb = compute_leaderboard(scores_df)
-    transfers_df = get_transfers_dataframe()
-    # Filter transfers to match selection window
-    if not transfers_df.empty and "Match" in transfers_df.columns:
-        transfers_df = transfers_df[transfers_df["Match"] <= selected_match]
-    team_cols = (
-        [c for c in transfers_df.columns if c != "Match"]
-        if not transfers_df.empty
-        else []
-    )
-    transfers_map = (
-        {t: int(transfers_df[t].fillna(0).sum()) for t in team_cols}
-        if team_cols
-        else None
-    )
-    # Build match scores dict for the last visible match
-    teams = [c for c in scores_df.columns if c != "Match"]
-    last_row = scores_df.iloc[-1]
-    match_scores = {
-        t: last_row[t] if last_row[t] == last_row[t] else None for t in teams
-    }
-    leaderboard = create_leaderboard(
-        lb,
-        colors,
-        transfers_map=transfers_map,
-        total_transfers=TOTAL_TRANSFERS,
-        match_scores=match_scores,
-    )
-
-    # Stat cards
-    leader = lb.iloc[0]
-    second = lb.iloc[1] if len(lb) > 1 else None
-    gap = second["Gap to Leader"] if second is not None else 0
-
-    # Biggest mover
-    biggest_mover = lb.loc[lb["Rank Change"].abs().idxmax()]
-    mover_dir = (
-        "▲"
-        if biggest_mover["Rank Change"] > 0
-        else "▼" if biggest_mover["Rank Change"] < 0 else "—"
-    )
-
-    # Latest match MVP (from match_scores)
-    mvp_team = max(
-        (t for t in match_scores if match_scores[t] is not None),
-        key=lambda t: match_scores[t],
-        default=None,
-    )
-    mvp_pts = match_scores[mvp_team] if mvp_team else 0
-
-    cards = [
-        create_stat_card(
-            "👑 Leader",
-            leader["Team"],
-            f"{leader['Total Points']:,.0f} pts",
-            "#FFD23F",
-            "",
-        ),
-        create_stat_card(
-            "📏 Gap", f"{gap:,.0f}", f"pts between 1st & 2nd", "#EF476F", ""
-        ),
-        create_stat_card(
-            "🚀 Biggest Mover",
-            biggest_mover["Team"],
-            f"{mover_dir} {abs(int(biggest_mover['Rank Change']))} spots",
-            "#06D6A0",
-            "",
-        ),
-        create_stat_card(
-            "⭐ Last MVP",
-            mvp_team,
-            f"Match {int(last_row['Match'])} — {mvp_pts:,.0f} pts",
-            "#4CC9F0",
-            "",
-        ),
-    ]
-
-    # Charts
-    cum_df = compute_cumulative_points(scores_df)
-    race_fig = fig_points_race(cum_df, colors)
-    earned_fig = fig_points_earned(scores_df, colors)
-
-    return progress, cards, leaderboard, race_fig, earned_fig
-
-
-@callback(
+clientside_callback(
+    ClientsideFunction(namespace="overview", function_name="fixture"),
     Output("overview-match-fixture", "children"),
+    Input("overview-season-store", "data"),
     Input("overview-match-slider", "value"),
 )
-def update_overview_fixture(selected_match):
-    if not selected_match:
-        return ""
-    return _build_overview_fixture(int(selected_match))
-    """Build a card showing all scores for the latest match."""
-    match_num = int(last_row["Match"])
-    sorted_teams = sorted(
-        teams,
-        key=lambda t: last_row[t] if last_row[t] == last_row[t] else 0,
-        reverse=True,
-    )
-    mvp = sorted_teams[0]
 
-    rows = []
-    for i, t in enumerate(sorted_teams):
-        pts = last_row[t]
-        is_mvp = i == 0
-        rows.append(
-            html.Div(
-                [
-                    html.Span(
-                        f"{'⭐ ' if is_mvp else ''}{t}",
-                        className="latest-team",
-                        style={"color": colors.get(t, "#ccc")},
-                    ),
-                    html.Span(f"{pts:,.1f}", className="latest-pts"),
-                ],
-                className=f"latest-row {'latest-mvp' if is_mvp else ''}",
-            )
-        )
 
-    return dmc.Paper(
-        [
-            html.H5(f"Match {match_num} Results", className="latest-title"),
-            html.Div(rows, className="latest-results"),
-        ],
-        className="latest-match-card mb-4",
-        p="lg",
-    )
+def _trace_styles(fig):
+    """fig without its per-point arrays (trace x, y and marker sizes)."""
+    data = []
+    for trace in fig["data"]:
+        trace = {k: v for k, v in trace.items() if k not in ("x", "y")}
+        marker = trace.get("marker", {})
+        if isinstance(marker.get("size"), dict):  # a typed array
+            trace["marker"] = {k: v for k, v in marker.items() if k != "size"}
+        data.append(trace)
+    return {"data": data, "layout": fig["layout"]}
+
+
+def _season_payload(metrics):
+    """Everything the Overview shows at any slider position.
+
+    series[name] holds one list per team (season.teams order) with a value per
+    score row; standings rows are the per-match leaderboards (totals, teams by
+    rank, rank and previous rank); transfer totals are per transfer row. The
+    figures carry trace styling only: overview.js fills in the points.
+    """
+    season = metrics["season"]
+    colors = get_team_color_map()
+    details = {m["match_number"]: m for m in get_all_matches()}
+    payload = {
+        "total_matches": TOTAL_MATCHES,
+        "total_transfers": TOTAL_TRANSFERS,
+        "max_match": get_max_match_number(),
+        "webgl_threshold": WEBGL_POINT_THRESHOLD,
+        "fixtures": {
+            m: _overview_fixture(m, details.get(m, NO_MATCH_DETAILS))
+            for m in range(1, TOTAL_MATCHES + 1)
+        },
+        "empty": {
+            "leaderboard": empty_state(),
+            "race": empty_fig(
+                "Enter match scores from the Admin page to see the points race!"
+            ),
+            "chart": empty_fig(),
+        },
+        "matches": season.matches,
+        "teams": list(season.teams),
+    }
+    if season.is_empty:
+        return payload
+
+    cum_df, rank_df = metrics.get("cumulative_points", "rank_trajectory")
+    standings = metrics["standings_history"]
+    transfer_matches, transfer_teams, transfer_totals = metrics["transfer_history"]
+    teams = list(season.teams)
+    return {
+        **payload,
+        "colors": [colors.get(t, "#888") for t in teams],
+        "series": {
+            "scores": np.where(season.mask, season.values, np.nan).T,
+            "cumulative": cum_df[teams].to_numpy().T,
+            "rank": rank_df[teams].to_numpy().T,
+        },
+        "standings": {
+            name: standings[name] for name in ("totals", "order", "rank", "prev_rank")
+        },
+        "transfers": {
+            "matches": transfer_matches,
+            "teams": list(transfer_teams),
+            "totals": transfer_totals,
+        },
+        # Built as SVG traces; overview.js switches to WebGL per slice.
+        "figures": {
+            "race": _trace_styles(fig_points_race(cum_df, colors, webgl_threshold=math.inf)),
+            "earned": _trace_styles(
+                fig_points_earned(season.to_frame(), colors, webgl_threshold=math.inf)
+            ),
+            "rank": _trace_styles(fig_rank_trajectory(rank_df, colors)),
+        },
+    }
@@ -1,19 +1,17 @@
 import dash
-from dash import html, dcc, callback, Input, Output
+from dash import html, dcc, callback, Input, Output, State, no_update
 
-from utils.models import (
-    get_scores_dataframe,
-    get_transfers_dataframe,
-    get_team_color_map,
+from utils.models import get_team_color_map, get_projections
+from utils.cache import memoize_callback
+from utils.metrics import METRIC_TABLES, get_metrics
+from utils.patches import patch_outputs
+from utils.constants import STREAK_MIN_LENGTH
+from utils.chart_helpers import (
+    fig_momentum,
+    fig_rank_trajectory,
+    fig_rank_probabilities,
+    empty_fig,
 )
-from utils.calculations import (
-    compute_power_rankings,
-    compute_streaks,
-    compute_form_guide,
-    compute_rolling_average,
-    compute_awards,
-)
-from utils.chart_helpers import fig_momentum, empty_fig
 from utils.components import section_header, chart_card, create_badge, empty_state
 
 dash.register_page(__name__, path="/power-rankings", name="Power Rankings", order=3)
@@ -22,7 +20,7 @@ dash.register_page(__name__, path="/power-rankings", name="Power Rankings", orde
 
 layout = html.Div(
     [
-        dcc.Interval(id="pr-interval", interval=60_000, n_intervals=0),
+        dcc.Store(id="pr-version"),
         section_header(
             "Power Rankings",
             "Weighted by recent form — who's peaking at the right time?",
@@ -44,7 +42,7 @@ layout = html.Div(
                 ),
                 html.Div(
                     [
-                        section_header("Current Streaks", "Hot and cold runs"),
+                        section_header("Current Streaks", "Hot and cold runs, plus the season's longest"),
                         html.Div(id="pr-streaks"),
                     ],
                     className="mb-4",
@@ -56,6 +54,20 @@ layout = html.Div(
         section_header("Momentum", "5-match rolling average — see who's trending up"),
         chart_card("pr-momentum"),
         html.Div(className="mb-4"),
+        # Power rank history
+        section_header(
+            "Power Rank Over Time", "Where recent form placed each team, match by match"
+        ),
+        chart_card("pr-power-history"),
+        html.Div(className="mb-4"),
+        # Projections
+        section_header(
+            "Season Projections",
+            "Simulated finishes, drawing each team's remaining scores from its own season",
+        ),
+        html.Div(id="pr-projection-table", className="mb-4"),
+        chart_card("pr-projections"),
+        html.Div(className="mb-4"),
         # Awards
         section_header("Season Awards 🏆", "Bragging rights earned on the field"),
         html.Div(id="pr-awards", className="mb-4"),
@@ -72,44 +84,84 @@ layout = html.Div(
     Output("pr-form-guide", "children"),
     Output("pr-streaks", "children"),
     Output("pr-momentum", "figure"),
+    Output("pr-power-history", "figure"),
+    Output("pr-projection-table", "children"),
+    Output("pr-projections", "figure"),
     Output("pr-awards", "children"),
-    Input("pr-interval", "n_intervals"),
+    Output("pr-version", "data"),
+    Input("data-version", "data"),
+    State("pr-version", "data"),
 )
-def update_power_rankings(_n):
-    scores_df = get_scores_dataframe()
-    transfers_df = get_transfers_dataframe()
+@memoize_callback(*METRIC_TABLES)
+def update_power_rankings(_data_version, client_version):
+    """Full outputs on a page load, Patches after a new match, nothing while
+    the data version is the one the page already shows."""
+    metrics = get_metrics()
+    if metrics.version_key == client_version:
+        return (no_update,) * 9
+    outputs = _power_rankings_outputs(metrics)
+    return (
+        *patch_outputs("power_rankings", metrics, client_version, outputs),
+        metrics.version_key,
+    )
+
+
+def _power_rankings_outputs(metrics):
     colors = get_team_color_map()
 
-    if scores_df.empty or len(scores_df.columns) <= 1:
+    if metrics["season"].is_empty:
         return (
             empty_state(),
             empty_state("Not enough data for form guide"),
             empty_state("Not enough data for streaks"),
             empty_fig("Enter match scores to see momentum trends!"),
+            empty_fig("Power ranks appear once scores are entered"),
+            empty_state("Projections appear once scores are entered"),
+            empty_fig("Projections appear once scores are entered"),
             empty_state("Awards will appear as the season progresses"),
         )
 
     # Power rankings table
-    pr = compute_power_rankings(scores_df)
+    pr = metrics["power_rankings"]
     pr_table = _build_power_table(pr, colors)
 
     # Form guide
-    form = compute_form_guide(scores_df)
+    form = metrics["form_guide"]
     form_guide = _build_form_guide(form, colors)
 
     # Streaks
-    streaks = compute_streaks(scores_df)
+    streaks = metrics["streak_history"]
     streaks_ui = _build_streaks(streaks, colors)
 
     # Momentum chart
-    rolling_df = compute_rolling_average(scores_df)
+    rolling_df = metrics["rolling_average"]
     momentum_fig = fig_momentum(rolling_df, colors)
 
+    # Power rank history (kept by the incremental power state)
+    _, power_rank_df = metrics["power_history"]
+    power_history_fig = fig_rank_trajectory(
+        power_rank_df, colors, axis_title="Power Rank"
+    )
+
+    # Season projections (Monte Carlo, cached per data version)
+    projection = get_projections()
+    projection_table = _build_projection_table(projection, colors)
+    projection_fig = fig_rank_probabilities(projection)
+
     # Awards
-    awards = compute_awards(scores_df, transfers_df)
+    awards = metrics["awards"]
     awards_ui = _build_awards(awards, colors)
 
-    return pr_table, form_guide, streaks_ui, momentum_fig, awards_ui
+    return (
+        pr_table,
+        form_guide,
+        streaks_ui,
+        momentum_fig,
+        power_history_fig,
+        projection_table,
+        projection_fig,
+        awards_ui,
+    )
 
 
 # ─── Helper builders ────────────────────────────────────────────────────────
@@ -160,6 +212,49 @@ def _build_power_table(pr_df, colors):
     return html.Div(rows, className="power-table")
 
 
+def _build_projection_table(projection, colors):
+    summary = projection["summary"]
+    if summary.empty:
+        return empty_state("Projections appear once scores are entered")
+    header = html.Div(
+        [
+            html.Span("#", className="pr-rank-h"),
+            html.Span("Team", className="pr-team-h"),
+            html.Span("Now", className="pr-val-h"),
+            html.Span("Projected", className="pr-val-h"),
+            html.Span("Avg Finish", className="pr-val-h"),
+            html.Span("Title", className="pr-val-h"),
+        ],
+        className="pr-header",
+    )
+    rows = [header]
+    for i, (_, r) in enumerate(summary.iterrows(), start=1):
+        rows.append(
+            html.Div(
+                [
+                    html.Span(f"{i}", className="pr-rank"),
+                    html.Span(
+                        r["Team"],
+                        className="pr-team",
+                        style={"color": colors.get(r["Team"], "#ccc")},
+                    ),
+                    html.Span(f"{r['Current Points']:,.0f}", className="pr-val"),
+                    html.Span(f"{r['Expected Points']:,.0f}", className="pr-val"),
+                    html.Span(f"{r['Expected Rank']:.1f}", className="pr-val"),
+                    html.Span(f"{r['Win Probability']:.0%}", className="pr-val"),
+                ],
+                className="pr-row",
+            )
+        )
+    remaining = projection["remaining"]
+    note = html.P(
+        f"{projection['simulations']:,} simulated seasons · "
+        f"{remaining} match{'es' if remaining != 1 else ''} left to play",
+        className="text-muted",
+    )
+    return html.Div([html.Div(rows, className="power-table projection-table"), note])
+
+
 def _build_form_guide(form_dict, colors):
     if not form_dict:
         return empty_state("Not enough data")
@@ -191,8 +286,12 @@ def _build_streaks(streaks_df, colors):
     active = streaks_df[streaks_df["Streak Type"] != "—"].sort_values(
         "Streak Length", ascending=False
     )
+    season_best = _build_season_best_streaks(streaks_df, colors)
     if active.empty:
-        return html.P("No active streaks right now", className="text-muted")
+        return html.Div(
+            [html.P("No active streaks right now", className="text-muted")]
+            + season_best
+        )
     rows = []
     for _, r in active.iterrows():
         rows.append(
@@ -209,7 +308,35 @@ def _build_streaks(streaks_df, colors):
                 className="streak-row",
             )
         )
-    return html.Div(rows, className="streaks-list")
+    return html.Div(rows + season_best, className="streaks-list")
+
+
+def _build_season_best_streaks(streaks_df, colors):
+    """Longest hot and cold runs of the season, with the matches they spanned."""
+    rows = []
+    for icon, label in (("🔥", "Hot"), ("❄️", "Cold")):
+        best = streaks_df.loc[streaks_df[f"Longest {label}"].idxmax()]
+        length = int(best[f"Longest {label}"])
+        if length < STREAK_MIN_LENGTH:
+            continue
+        start, end = int(best[f"{label} Start"]), int(best[f"{label} End"])
+        rows.append(
+            html.Div(
+                [
+                    html.Span(f"{icon} Best", className="streak-type"),
+                    html.Span(
+                        best["Team"],
+                        className="streak-team",
+                        style={"color": colors.get(best["Team"], "#ccc")},
+                    ),
+                    html.Span(
+                        f"{length} matches (M{start}–M{end})", className="streak-len"
+                    ),
+                ],
+                className="streak-row streak-season-best",
+            )
+        )
+    return rows
 
 
 def _build_awards(awards_dict, colors):
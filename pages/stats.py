@@ -1,21 +1,32 @@
-import dash
-from dash import html, dcc, callback, Input, Output
+import math
+from datetime import date
 
-from utils.models import (
-    get_scores_dataframe,
-    get_transfers_dataframe,
-    get_team_color_map,
-)
-from utils.calculations import (
-    compute_consistency,
-    compute_rolling_average,
-    compute_transfer_efficiency,
+import dash
+from dash import (
+    html,
+    dcc,
+    callback,
+    clientside_callback,
+    ClientsideFunction,
+    Input,
+    Output,
+    State,
+    no_update,
 )
+import dash_mantine_components as dmc
+
+from utils.models import get_all_matches, get_team_color_map
+from utils.cache import memoize_callback
+from utils.metrics import METRIC_TABLES, get_metrics
+from utils.patches import patch_outputs
+from utils.calculations import ROLLING_STATS
+from utils.constants import ROLLING_WINDOW, ROLLING_WINDOWS, TOTAL_MATCHES
 from utils.chart_helpers import (
     fig_points_distribution,
     fig_scoring_heatmap,
     fig_momentum,
     fig_transfer_efficiency,
+    fig_transfer_pacing,
     fig_transfers_accumulated,
     fig_transfers_per_match,
     empty_fig,
@@ -24,11 +35,22 @@ from utils.components import section_header, chart_card, empty_state
 
 dash.register_page(__name__, path="/stats", name="Stats", order=1)
 
+ROLLING_STAT_LABELS = {"mean": "Avg", "std": "Std Dev", "min": "Min", "max": "Max"}
+
+
+def _window_key(window):
+    return "all" if window is None else str(window)
+
+
+def _window_label(window):
+    return "Season" if window is None else f"{window} matches"
+
+
 # ─── Layout ──────────────────────────────────────────────────────────────────
 
 layout = html.Div(
     [
-        dcc.Interval(id="stats-interval", interval=60_000, n_intervals=0),
+        dcc.Store(id="stats-version"),
         section_header(
             "Stats & Analytics", "Deep dive into scoring patterns and team performance"
         ),
@@ -47,9 +69,41 @@ layout = html.Div(
         ),
         html.Div(id="stats-consistency-table", className="mb-4"),
         # Rolling average + Transfer efficiency
+        dcc.Store(id="stats-rolling-store"),
         html.Div(
             [
-                html.Div([chart_card("stats-rolling-avg")], className="mb-4"),
+                html.Div(
+                    [
+                        html.Div(
+                            [
+                                dmc.SegmentedControl(
+                                    id="stats-rolling-window",
+                                    data=[
+                                        {
+                                            "label": _window_label(w),
+                                            "value": _window_key(w),
+                                        }
+                                        for w in ROLLING_WINDOWS
+                                    ],
+                                    value=_window_key(ROLLING_WINDOW),
+                                    size="xs",
+                                ),
+                                dmc.SegmentedControl(
+                                    id="stats-rolling-stat",
+                                    data=[
+                                        {"label": ROLLING_STAT_LABELS[s], "value": s}
+                                        for s in ROLLING_STATS
+                                    ],
+                                    value="mean",
+                                    size="xs",
+                                ),
+                            ],
+                            className="stats-rolling-controls",
+                        ),
+                        chart_card("stats-rolling-avg"),
+                    ],
+                    className="mb-4",
+                ),
                 html.Div([chart_card("stats-transfer-eff")], className="mb-4"),
             ],
             className="page-two-column-grid",
@@ -68,6 +122,18 @@ layout = html.Div(
             ],
             className="page-two-column-grid",
         ),
+        # Transfer pacing
+        section_header(
+            "Transfer Pacing",
+            "Burn rate against the transfer budget and when it runs out",
+        ),
+        html.Div(
+            [
+                html.Div(id="stats-pacing-table", className="mb-4"),
+                html.Div([chart_card("stats-pacing")], className="mb-4"),
+            ],
+            className="page-two-column-grid",
+        ),
     ],
     className="page-content",
 )
@@ -80,20 +146,38 @@ layout = html.Div(
     Output("stats-distribution", "figure"),
     Output("stats-heatmap", "figure"),
     Output("stats-consistency-table", "children"),
-    Output("stats-rolling-avg", "figure"),
+    Output("stats-rolling-store", "data"),
     Output("stats-transfer-eff", "figure"),
     Output("stats-transfers-per-match", "figure"),
     Output("stats-transfers-accumulated", "figure"),
-    Input("stats-interval", "n_intervals"),
+    Output("stats-pacing-table", "children"),
+    Output("stats-pacing", "figure"),
+    Output("stats-version", "data"),
+    Input("data-version", "data"),
+    State("stats-version", "data"),
 )
-def update_stats(_n):
-    scores_df = get_scores_dataframe()
-    transfers_df = get_transfers_dataframe()
+@memoize_callback(*METRIC_TABLES)
+def update_stats(_data_version, client_version):
+    """Full outputs on a page load, Patches after a new match, nothing while
+    the data version is the one the page already shows."""
+    metrics = get_metrics()
+    if metrics.version_key == client_version:
+        return (no_update,) * 10
+    outputs = _stats_outputs(metrics)
+    return (
+        *patch_outputs("stats", metrics, client_version, outputs),
+        metrics.version_key,
+    )
+
+
+def _stats_outputs(metrics):
     colors = get_team_color_map()
 
-    if scores_df.empty or len(scores_df.columns) <= 1:
+    if metrics["season"].is_empty:
         e = empty_fig("Enter match scores from the Admin page to see stats!")
-        return e, e, empty_state(), e, e, e, e
+        return e, e, empty_state(), {"figure": e}, e, e, e, empty_state(), e
+
+    scores_df, transfers_df = metrics.get("scores_frame", "transfers_frame")
 
     # Distribution
     dist_fig = fig_points_distribution(scores_df, colors)
@@ -102,15 +186,15 @@ def update_stats(_n):
     heatmap_fig = fig_scoring_heatmap(scores_df, colors)
 
     # Consistency table
-    cons = compute_consistency(scores_df)
+    cons = metrics["consistency"]
     cons_table = _build_consistency_table(cons, colors)
 
-    # Rolling average
-    rolling_df = compute_rolling_average(scores_df)
-    rolling_fig = fig_momentum(rolling_df, colors)
+    # Rolling stats: every window and stat goes to the browser once, and the
+    # selectors switch between them client-side.
+    rolling_payload = _rolling_payload(metrics, colors)
 
     # Transfer efficiency
-    eff_df = compute_transfer_efficiency(scores_df, transfers_df)
+    eff_df = metrics["transfer_efficiency"]
     eff_fig = fig_transfer_efficiency(eff_df, colors)
 
     # Transfers
@@ -125,15 +209,142 @@ def update_stats(_n):
         else empty_fig("No transfer data")
     )
 
+    # Transfer pacing
+    pacing_df = metrics["transfer_pacing"]
+    current = _current_match(metrics)
+    pacing_table = _build_pacing_table(pacing_df, current, colors)
+    pacing_fig = (
+        fig_transfer_pacing(transfers_df, pacing_df, current, colors)
+        if not transfers_df.empty
+        else empty_fig("No transfer data")
+    )
+
     return (
         dist_fig,
         heatmap_fig,
         cons_table,
-        rolling_fig,
+        rolling_payload,
         eff_fig,
         tr_per_match,
         tr_accum,
+        pacing_table,
+        pacing_fig,
+    )
+
+
+clientside_callback(
+    ClientsideFunction(namespace="stats", function_name="rollingFigure"),
+    Output("stats-rolling-avg", "figure"),
+    Input("stats-rolling-store", "data"),
+    Input("stats-rolling-window", "value"),
+    Input("stats-rolling-stat", "value"),
+)
+
+
+def _rolling_payload(metrics, colors):
+    """Store data for the rolling chart: a themed figure plus every series.
+
+    series[window][stat] holds one list of values per figure trace (team).
+    """
+    rolling = metrics["rolling_stats"]
+    return {
+        "figure": fig_momentum(metrics["rolling_average"], colors),
+        "series": {
+            _window_key(w): {stat: values.T for stat, values in stats.items()}
+            for w, stats in rolling.items()
+        },
+        "labels": {
+            "windows": {
+                _window_key(w): (
+                    "Season-to-Date" if w is None else f"{w}-Match Rolling"
+                )
+                for w in rolling
+            },
+            "stats": ROLLING_STAT_LABELS,
+        },
+    }
+
+
+def _current_match(metrics):
+    """Latest match with scores or transfers entered."""
+    return max(
+        (int(s.matches[-1]) for s in metrics.get("season", "transfers") if len(s.matches)),
+        default=0,
+    )
+
+
+def _runs_out_label(row, fixture_dates):
+    if row["Exhausted"]:
+        return f"Out (M{row['Runs Out']:.0f})"
+    if math.isnan(row["Runs Out"]):  # lasts the season
+        return "Lasts"
+    match = int(row["Runs Out"])
+    played = fixture_dates.get(match)
+    if not played:
+        return f"M{match}"
+    try:
+        played = f"{date.fromisoformat(str(played)):%b %d}"
+    except ValueError:
+        pass
+    return f"M{match} · {played}"
+
+
+def _build_pacing_table(pacing_df, current, colors):
+    """Teams by when their transfer budget runs out, soonest first."""
+    if pacing_df.empty:
+        return empty_state("No transfer data")
+    fixture_dates = {m["match_number"]: m["date_played"] for m in get_all_matches()}
+    pacing_df = pacing_df.sort_values("Runs Out", kind="stable", na_position="last")
+
+    header = html.Div(
+        [
+            html.Span("#", className="cons-rank-h"),
+            html.Span("Team", className="cons-team-h"),
+            html.Span("Used", className="cons-val-h"),
+            html.Span("Left", className="cons-val-h"),
+            html.Span("Per Match", className="cons-val-h"),
+            html.Span("Sustainable", className="cons-val-h"),
+            html.Span("Runs Out", className="cons-val-h"),
+        ],
+        className="cons-header",
+    )
+
+    rows = [header]
+    for i, (_, r) in enumerate(pacing_df.iterrows(), start=1):
+        over_pace = r["Burn Rate"] > r["Sustainable Rate"]
+        rows.append(
+            html.Div(
+                [
+                    html.Span(f"{i}", className="cons-rank"),
+                    html.Span(
+                        r["Team"],
+                        className="cons-team",
+                        style={"color": colors.get(r["Team"], "#ccc")},
+                    ),
+                    html.Span(f"{r['Used']}", className="cons-val"),
+                    html.Span(f"{max(r['Remaining'], 0)}", className="cons-val"),
+                    html.Span(
+                        f"{r['Burn Rate']:.2f}",
+                        className="cons-val pacing-over" if over_pace else "cons-val",
+                    ),
+                    html.Span(
+                        "—"
+                        if math.isnan(r["Sustainable Rate"])
+                        else f"{r['Sustainable Rate']:.2f}",
+                        className="cons-val",
+                    ),
+                    html.Span(_runs_out_label(r, fixture_dates), className="cons-val"),
+                ],
+                className="cons-row",
+            )
+        )
+
+    left = max(0, TOTAL_MATCHES - current)
+    note = html.P(
+        f"After match {current} · {left} fixture{'s' if left != 1 else ''} left",
+        className="text-muted",
     )
+    return html.Div([html.Div(rows, className="consistency-table"), note])
 
 
 def _build_consistency_table(cons_df, colors):
@@ -1,13 +1,107 @@
+import functools
+import inspect
+import json
+import os
+import threading
+from collections import defaultdict
+
+from dash import no_update
 from flask_caching import Cache
+from plotly.io.json import to_json_plotly
+
+from utils.constants import CACHE_DIR, CACHE_TIMEOUT, CACHE_THRESHOLD
+from utils.db import get_data_versions
 
+# Shared by every worker process on the host, so an entry computed by one
+# worker is a hit for the others. Keys embed the database id and the data
+# versions read from SQLite, so a write is visible to all workers on their
+# next read without any cross-process invalidation.
 cache = Cache(
     config={
-        "CACHE_TYPE": "SimpleCache",
-        "CACHE_DEFAULT_TIMEOUT": 300,
+        "CACHE_TYPE": "FileSystemCache",
+        "CACHE_DIR": CACHE_DIR,
+        "CACHE_DEFAULT_TIMEOUT": CACHE_TIMEOUT,
+        "CACHE_THRESHOLD": CACHE_THRESHOLD,
     }
 )
 
 
+def _versioned_name(name, tables):
+    versions = get_data_versions(("database", *tables))
+    return name + "@" + ",".join(f"{t}={v}" for t, v in versions.items())
+
+
+def memoize_versioned(*tables, timeout=None):
+    """Memoize a reader on its arguments plus the data versions of tables.
+
+    Every write bumps the version of the tables it touches, so only entries
+    that depend on those tables miss on their next call; superseded entries
+    simply age out.
+    """
+
+    def make_name(fname):
+        return _versioned_name(fname, tables)
+
+    return cache.memoize(timeout=timeout, make_name=make_name)
+
+
+# ─── Callback outputs ───────────────────────────────────────────────────────
+
+# Hits and misses per callback in this worker process, for /cache-stats.
+_callback_counts = defaultdict(lambda: {"hits": 0, "misses": 0})
+_callback_counts_lock = threading.Lock()
+
+
+def _count(name, outcome):
+    with _callback_counts_lock:
+        _callback_counts[name][outcome] += 1
+
+
+def memoize_callback(*tables, timeout=None):
+    """Cache a Dash callback's serialized output on its inputs plus data versions.
+
+    Parameters named with a leading underscore (interval ticks such as _n) are
+    left out of the key, so every tick over unchanged data is a hit. A hit
+    decodes the stored JSON into plain dicts and lists, which Dash sends as
+    is: no DataFrame, figure or component is built. Outputs containing
+    no_update are not stored.
+    """
+
+    def decorator(func):
+        name = f"{func.__module__}.{func.__qualname__}"
+        keyed = [
+            i
+            for i, param in enumerate(inspect.signature(func).parameters)
+            if not param.startswith("_")
+        ]
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            inputs = json.dumps([args[i] for i in keyed if i < len(args)], default=str)
+            key = _versioned_name(f"callback:{name}:{inputs}", tables)
+            stored = cache.get(key)
+            if stored is not None:
+                _count(name, "hits")
+                return json.loads(stored)
+            _count(name, "misses")
+            output = func(*args)
+            values = output if isinstance(output, (list, tuple)) else [output]
+            if not any(v is no_update for v in values):
+                cache.set(key, to_json_plotly(output), timeout=timeout)
+            return output
+
+        return wrapper
+
+    return decorator
+
+
+def callback_cache_stats():
+    """{callback: {hits, misses}} counted by this worker process, plus its pid."""
+    with _callback_counts_lock:
+        counts = {name: dict(c) for name, c in sorted(_callback_counts.items())}
+    return {"pid": os.getpid(), "callbacks": counts}
+
+
 def clear_data_cache():
-    """Flush all cached data. Call after any DB write."""
+    """Flush every cached entry. Writes no longer need this; kept for maintenance."""
     cache.clear()
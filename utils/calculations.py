@@ -1,17 +1,22 @@
 """Pure statistical computation functions.
 
-Every function takes pandas DataFrames (pivoted: Match | Team1 | Team2 …)
-and returns computed results. No database or Dash dependencies.
+Every function takes a Season (utils/season.py) or a pivoted DataFrame
+(Match | Team1 | Team2 …) and returns computed results as vectorized NumPy
+operations over the match × team matrix. No database or Dash dependencies.
 """
 
 import numpy as np
 import pandas as pd
 from utils.constants import (
+    TOTAL_MATCHES,
+    TOTAL_TRANSFERS,
     CENTURION_THRESHOLD,
     STREAK_MIN_LENGTH,
     ROLLING_WINDOW,
+    ROLLING_WINDOWS,
     POWER_RANKING_DECAY,
 )
+from utils.season import as_season
 
 
 def _team_cols(df):
@@ -22,170 +27,382 @@ def _team_cols(df):
 # ─── Leaderboard ─────────────────────────────────────────────────────────────
 
 
-def compute_leaderboard(scores_df):
+LEADERBOARD_COLUMNS = [
+    "Rank",
+    "Team",
+    "Total Points",
+    "Prev Rank",
+    "Rank Change",
+    "Gap to Leader",
+]
+
+
+def compute_leaderboard(scores):
     """Compute current leaderboard from raw scores.
 
     Returns DataFrame with columns:
         Rank, Team, Total Points, Prev Rank, Rank Change, Gap to Leader
     """
-    if scores_df.empty or len(scores_df) == 0:
-        return pd.DataFrame(
-            columns=[
-                "Rank",
-                "Team",
-                "Total Points",
-                "Prev Rank",
-                "Rank Change",
-                "Gap to Leader",
-            ]
-        )
+    season = as_season(scores)
+    if season.is_empty:
+        return pd.DataFrame(columns=LEADERBOARD_COLUMNS)
+
+    cum = np.cumsum(season.values, axis=0, dtype=np.float64)
+    standings = pd.DataFrame({"Team": season.teams, "Total Points": cum[-1]})
+    # Previous totals (all matches except last)
+    standings["Prev Total"] = cum[-2] if len(cum) > 1 else np.nan
+    return rank_standings(standings)
+
+
+def rank_standings(standings):
+    """Rank precomputed totals into the compute_leaderboard() shape.
+
+    standings: DataFrame with Team, Total Points and Prev Total, where Prev
+    Total is NaN when there is no earlier match to compare against.
+    """
+    if standings.empty:
+        return pd.DataFrame(columns=LEADERBOARD_COLUMNS)
 
-    teams = _team_cols(scores_df)
-    totals = scores_df[teams].sum().reset_index()
-    totals.columns = ["Team", "Total Points"]
-    totals = totals.sort_values("Total Points", ascending=False).reset_index(drop=True)
+    totals = standings.sort_values(
+        "Total Points", ascending=False, kind="stable"
+    ).reset_index(drop=True)
     totals["Rank"] = range(1, len(totals) + 1)
     totals["Gap to Leader"] = totals["Total Points"].iloc[0] - totals["Total Points"]
 
-    # Previous rank (all matches except last)
-    if len(scores_df) > 1:
-        prev = scores_df.iloc[:-1]
-        prev_totals = prev[teams].sum().reset_index()
-        prev_totals.columns = ["Team", "Prev Total"]
-        prev_totals = prev_totals.sort_values(
-            "Prev Total", ascending=False
-        ).reset_index(drop=True)
-        prev_totals["Prev Rank"] = range(1, len(prev_totals) + 1)
-        totals = totals.merge(prev_totals[["Team", "Prev Rank"]], on="Team", how="left")
+    if totals["Prev Total"].notna().any():
+        prev_order = totals.sort_values("Prev Total", ascending=False, kind="stable")
+        totals.loc[prev_order.index, "Prev Rank"] = range(1, len(totals) + 1)
+        totals["Prev Rank"] = totals["Prev Rank"].astype(int)
     else:
         totals["Prev Rank"] = totals["Rank"]
 
     totals["Rank Change"] = totals["Prev Rank"] - totals["Rank"]
-    return totals[
-        ["Rank", "Team", "Total Points", "Prev Rank", "Rank Change", "Gap to Leader"]
-    ]
+    return totals[LEADERBOARD_COLUMNS]
 
 
 # ─── Cumulative Points ──────────────────────────────────────────────────────
 
 
-def compute_cumulative_points(scores_df):
+def _cumulative(season):
+    """Running totals per team, NaN where the team has no value that match."""
+    cum = np.cumsum(season.values, axis=0, dtype=np.float64)
+    cum[~season.mask] = np.nan
+    return cum
+
+
+def compute_cumulative_points(scores):
     """Return DataFrame with cumulative sums: Match | Team1_cum | Team2_cum ..."""
-    if scores_df.empty:
-        return scores_df.copy()
-    teams = _team_cols(scores_df)
-    result = scores_df[["Match"]].copy()
-    for t in teams:
-        result[t] = scores_df[t].cumsum()
-    return result
+    season = as_season(scores)
+    if season.is_empty:
+        return season.to_frame()
+    return season.to_frame(_cumulative(season))
+
+
+# ─── Rank Trajectory ────────────────────────────────────────────────────────
+
+
+def compute_rank_trajectory(scores):
+    """Rank of every team after every match: Match | Team1 | Team2 …
+
+    Ranks order the running totals of compute_cumulative_points() (a missed
+    match adds 0); tied totals share the best rank (1, 2, 2, 4). A team is
+    NaN until its first entered match and is not counted before then.
+    """
+    season = as_season(scores)
+    if season.is_empty:
+        return season.to_frame()
+    started = np.cumsum(season.mask, axis=0) > 0
+    totals = np.where(
+        started, np.cumsum(season.values, axis=0, dtype=np.float64), -np.inf
+    )
+    ranks = _competition_ranks(totals).astype(np.float64)
+    ranks[~started] = np.nan
+    return season.to_frame(ranks)
+
+
+def _competition_ranks(totals):
+    """Row-wise descending ranks of a 2-D array, ties sharing the best rank."""
+    n_rows, n_cols = totals.shape
+    order = np.argsort(-totals, axis=1, kind="stable")
+    ordered = np.take_along_axis(totals, order, axis=1)
+    positions = np.broadcast_to(np.arange(n_cols), (n_rows, n_cols))
+    # Each position takes the index where its run of equal totals began.
+    new_value = np.ones((n_rows, n_cols), dtype=bool)
+    new_value[:, 1:] = ordered[:, 1:] != ordered[:, :-1]
+    run_start = np.maximum.accumulate(np.where(new_value, positions, 0), axis=1)
+    ranks = np.empty((n_rows, n_cols), dtype=np.int32)
+    np.put_along_axis(ranks, order, run_start + 1, axis=1)
+    return ranks
 
 
 # ─── Consistency ─────────────────────────────────────────────────────────────
 
 
-def compute_consistency(scores_df):
+def _team_moments(season):
+    """Per-team count, mean, sample std, min and max over entered values."""
+    values = season.values.astype(np.float64)
+    mask = season.mask
+    count = mask.sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = values.sum(axis=0) / count
+        sq_dev = np.where(mask, values - mean, 0.0) ** 2
+        std = np.sqrt(sq_dev.sum(axis=0) / (count - 1))
+    std[count < 2] = np.nan
+    lo = np.where(mask, values, np.inf).min(axis=0, initial=np.inf)
+    hi = np.where(mask, values, -np.inf).max(axis=0, initial=-np.inf)
+    lo[count == 0] = np.nan
+    hi[count == 0] = np.nan
+    return count, mean, std, lo, hi
+
+
+def compute_consistency(scores):
     """Return DataFrame: Team, Avg, Std Dev, CV (coefficient of variation), Min, Max."""
-    if scores_df.empty:
+    season = as_season(scores)
+    if season.is_empty:
         return pd.DataFrame(columns=["Team", "Avg", "Std Dev", "CV", "Min", "Max"])
-    teams = _team_cols(scores_df)
-    rows = []
-    for t in teams:
-        s = scores_df[t].dropna()
-        avg = s.mean()
-        std = s.std()
-        rows.append(
+    _, mean, std, lo, hi = _team_moments(season)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cv = np.where(mean > 0, np.round(std / mean * 100, 1), 0)
+    return (
+        pd.DataFrame(
             {
-                "Team": t,
-                "Avg": round(avg, 1),
-                "Std Dev": round(std, 1),
-                "CV": round(std / avg * 100, 1) if avg > 0 else 0,
-                "Min": round(s.min(), 1),
-                "Max": round(s.max(), 1),
+                "Team": season.teams,
+                "Avg": np.round(mean, 1),
+                "Std Dev": np.round(std, 1),
+                "CV": cv,
+                "Min": np.round(lo, 1),
+                "Max": np.round(hi, 1),
             }
         )
-    return pd.DataFrame(rows).sort_values("Std Dev").reset_index(drop=True)
+        .sort_values("Std Dev", kind="stable")
+        .reset_index(drop=True)
+    )
 
 
 # ─── Streaks ─────────────────────────────────────────────────────────────────
 
 
-def compute_streaks(scores_df):
+def compute_streaks(scores):
     """Compute hot/cold streaks for each team.
 
     A streak is consecutive matches above (hot) or below (cold) the overall
-    match average. Returns DataFrame: Team, Streak Type, Streak Length.
+    match average, counted over the matches a team has a score for.
+    Returns DataFrame: Team, Streak Type, Streak Length.
     """
-    if scores_df.empty:
+    season = as_season(scores)
+    if season.is_empty:
         return pd.DataFrame(columns=["Team", "Streak Type", "Streak Length"])
-    teams = _team_cols(scores_df)
-    rows = []
-    for t in teams:
-        s = scores_df[t].dropna()
-        if len(s) == 0:
-            rows.append({"Team": t, "Streak Type": "—", "Streak Length": 0})
-            continue
-        match_avgs = scores_df[teams].mean(axis=1)
-        above = (s.values > match_avgs.values).astype(int)
-
-        # Walk backwards to find current streak
-        if len(above) == 0:
-            rows.append({"Team": t, "Streak Type": "—", "Streak Length": 0})
-            continue
-        streak_val = above[-1]
-        streak_len = 0
-        for i in range(len(above) - 1, -1, -1):
-            if above[i] == streak_val:
-                streak_len += 1
-            else:
-                break
-        streak_type = "🔥 Hot" if streak_val == 1 else "❄️ Cold"
-        if streak_len < STREAK_MIN_LENGTH:
-            streak_type = "—"
-        rows.append(
-            {"Team": t, "Streak Type": streak_type, "Streak Length": streak_len}
-        )
-    return pd.DataFrame(rows)
+    hot, lengths, _ = _current_streaks(season)
+    streak_type = np.where(hot, "🔥 Hot", "❄️ Cold").astype(object)
+    streak_type[lengths < STREAK_MIN_LENGTH] = "—"
+    return pd.DataFrame(
+        {
+            "Team": season.teams,
+            "Streak Type": streak_type,
+            "Streak Length": lengths,
+        }
+    )
+
+
+STREAK_HISTORY_COLUMNS = [
+    "Team",
+    "Streak Type",
+    "Streak Length",
+    "Streak Start",
+    "Longest Hot",
+    "Hot Start",
+    "Hot End",
+    "Longest Cold",
+    "Cold Start",
+    "Cold End",
+]
+
+
+def compute_streak_history(scores):
+    """Current and season-long streaks for each team, in one run-length pass.
+
+    Returns DataFrame: Team, Streak Type, Streak Length, Streak Start (match
+    the current run began), Longest Hot / Longest Cold with their start and
+    end matches (0 and NaN when a team never had such a run). Longest-run
+    ties go to the most recent run.
+    """
+    season = as_season(scores)
+    if season.is_empty:
+        return pd.DataFrame(columns=STREAK_HISTORY_COLUMNS)
+    runs = _streak_runs(season)
+    hot, lengths, starts = _current_streaks(season, runs=runs)
+    streak_type = np.where(hot, "🔥 Hot", "❄️ Cold").astype(object)
+    streak_type[lengths < STREAK_MIN_LENGTH] = "—"
+    matches = season.matches.astype(np.float64)
+
+    result = pd.DataFrame(
+        {
+            "Team": season.teams,
+            "Streak Type": streak_type,
+            "Streak Length": lengths,
+            "Streak Start": np.where(lengths > 0, matches[starts], np.nan),
+        }
+    )
+    for label, state in (("Hot", True), ("Cold", False)):
+        length, start, end = _longest_runs(runs, len(season.teams), state)
+        found = length > 0
+        result[f"Longest {label}"] = length
+        result[f"{label} Start"] = np.where(found, matches[start], np.nan)
+        result[f"{label} End"] = np.where(found, matches[end], np.nan)
+    return result
+
+
+def _streak_runs(season):
+    """Run-length encode above/below over each team's entered matches.
+
+    Returns dict of 1-D arrays, one entry per run, ordered by team then time:
+    team, hot, length, start and end (row indices into the Season).
+    """
+    team, row = np.nonzero(season.mask.T)  # team-major, rows ascending
+    state = season.above_average[row, team]
+    new_run = np.ones(len(team), dtype=bool)
+    new_run[1:] = (team[1:] != team[:-1]) | (state[1:] != state[:-1])
+    first = np.flatnonzero(new_run)
+    last = np.append(first[1:], len(team)) - 1
+    return {
+        "team": team[first],
+        "hot": state[first],
+        "length": last - first + 1,
+        "start": row[first],
+        "end": row[last],
+    }
+
+
+def _current_streaks(season, runs=None):
+    """(hot, length, start_row) per team for the run ending at its latest match.
+
+    length is 0 for teams without any scores.
+    """
+    if runs is None:
+        runs = _streak_runs(season)
+    n_teams = len(season.teams)
+    hot = np.zeros(n_teams, dtype=bool)
+    lengths = np.zeros(n_teams, dtype=int)
+    starts = np.zeros(n_teams, dtype=int)
+    # Runs are grouped by team, so a team's last run is its current one.
+    is_last = _last_in_group(runs["team"])
+    current = runs["team"][is_last]
+    hot[current] = runs["hot"][is_last]
+    lengths[current] = runs["length"][is_last]
+    starts[current] = runs["start"][is_last]
+    return hot, lengths, starts
+
+
+def _last_in_group(keys):
+    """bool mask of the last element of each run of equal, grouped keys."""
+    return np.append(keys[1:] != keys[:-1], True)[: len(keys)]
+
+
+def _longest_runs(runs, n_teams, state):
+    """(length, start_row, end_row) of each team's longest run in state."""
+    pick = np.flatnonzero(runs["hot"] == state)
+    order = pick[
+        np.lexsort((runs["end"][pick], runs["length"][pick], runs["team"][pick]))
+    ]
+    # After sorting by team, length, end: each team's best run is its last.
+    best = order[_last_in_group(runs["team"][order])]
+    length = np.zeros(n_teams, dtype=int)
+    start = np.zeros(n_teams, dtype=int)
+    end = np.zeros(n_teams, dtype=int)
+    length[runs["team"][best]] = runs["length"][best]
+    start[runs["team"][best]] = runs["start"][best]
+    end[runs["team"][best]] = runs["end"][best]
+    return length, start, end
 
 
 # ─── Power Rankings ──────────────────────────────────────────────────────────
 
 
-def compute_power_rankings(scores_df):
+POWER_RANKING_COLUMNS = [
+    "Team",
+    "Power Score",
+    "Power Rank",
+    "Leaderboard Rank",
+    "Rank Diff",
+]
+
+
+def compute_power_rankings(scores, leaderboard=None):
     """Exponentially weighted rankings — recent matches count more.
 
+    leaderboard: a precomputed compute_leaderboard() result for the same
+    scores (computed here when None).
     Returns DataFrame: Team, Power Score, Power Rank, Leaderboard Rank, Rank Diff
     """
-    if scores_df.empty:
-        return pd.DataFrame(
-            columns=[
-                "Team",
-                "Power Score",
-                "Power Rank",
-                "Leaderboard Rank",
-                "Rank Diff",
-            ]
-        )
-    teams = _team_cols(scores_df)
-    n = len(scores_df)
-    weights = np.array([POWER_RANKING_DECAY ** (n - 1 - i) for i in range(n)])
-    weights = weights / weights.sum() * n  # normalize so sum ≈ n
-
-    rows = []
-    for t in teams:
-        vals = scores_df[t].fillna(0).values
-        power = float(np.dot(vals, weights))
-        rows.append({"Team": t, "Power Score": round(power, 1)})
+    season = as_season(scores)
+    if season.is_empty:
+        return pd.DataFrame(columns=POWER_RANKING_COLUMNS)
+    sums = np.empty(season.values.shape)
+    update_power_sums(season.values, sums, 0)
+    power = power_scores(sums[-1:], len(sums) - 1)[0]
+    lb = compute_leaderboard(season) if leaderboard is None else leaderboard
+    return rank_power(season.teams, power, lb)
+
+
+def compute_power_history(scores):
+    """Power score and power rank of every team after every match.
+
+    Returns (power_df, rank_df), both Match | Team1 | Team2 …; row i holds
+    what compute_power_rankings() would report after that match.
+    """
+    season = as_season(scores)
+    if season.is_empty:
+        return season.to_frame(), season.to_frame()
+    sums = np.empty(season.values.shape)
+    update_power_sums(season.values, sums, 0)
+    power = power_scores(sums, 0)
+    return season.to_frame(power), season.to_frame(power_ranks(power))
+
+
+def update_power_sums(values, sums, start):
+    """Fill sums[start:] with decayed running sums, reusing sums[start - 1].
+
+    S[r] = POWER_RANKING_DECAY * S[r - 1] + values[r]: one O(teams) step per
+    match, so a new match only needs the previous row.
+    """
+    prev = sums[start - 1] if start > 0 else np.zeros(values.shape[1])
+    for r in range(start, len(values)):
+        prev = POWER_RANKING_DECAY * prev + values[r]
+        sums[r] = prev
+
+
+def power_scores(sums, first_row):
+    """Power scores (rounded to 1 dp) for the sum rows first_row, first_row+1, …
+
+    After n matches the weights DECAY^(n-1-i) are normalized to sum to n,
+    so power = n * S / Σ DECAY^k.
+    """
+    n = np.arange(first_row + 1, first_row + len(sums) + 1)
+    weight_sums = (1 - POWER_RANKING_DECAY**n) / (1 - POWER_RANKING_DECAY)
+    return np.round(sums * (n / weight_sums)[:, None], 1)
+
+
+def power_ranks(power):
+    """Row-wise power rank (1 = best); ties keep team order, as in the table."""
+    order = np.argsort(-power, axis=-1, kind="stable")
+    ranks = np.empty(order.shape, dtype=np.int32)
+    np.put_along_axis(ranks, order, np.arange(1, order.shape[-1] + 1), axis=-1)
+    return ranks
+
+
+def rank_power(teams, power, leaderboard):
+    """compute_power_rankings() table from one row of power scores."""
     pr = (
-        pd.DataFrame(rows)
-        .sort_values("Power Score", ascending=False)
+        pd.DataFrame({"Team": teams, "Power Score": power})
+        .sort_values("Power Score", ascending=False, kind="stable")
         .reset_index(drop=True)
     )
     pr["Power Rank"] = range(1, len(pr) + 1)
 
     # Leaderboard rank for comparison
-    lb = compute_leaderboard(scores_df)
     pr = pr.merge(
-        lb[["Team", "Rank"]].rename(columns={"Rank": "Leaderboard Rank"}), on="Team"
+        leaderboard[["Team", "Rank"]].rename(columns={"Rank": "Leaderboard Rank"}),
+        on="Team",
     )
     pr["Rank Diff"] = pr["Leaderboard Rank"] - pr["Power Rank"]
     return pr
@@ -194,18 +411,16 @@ def compute_power_rankings(scores_df):
 # ─── Head-to-Head ────────────────────────────────────────────────────────────
 
 
-def compute_head_to_head(scores_df, team_a, team_b):
+def compute_head_to_head(scores, team_a, team_b):
     """Compare two teams match-by-match.
 
     Returns dict with:
         wins_a, wins_b, draws, matches_played,
-        diff_series (pd.Series of cumulative difference A-B)
+        diff_series (pd.Series of cumulative difference A-B, indexed by row)
     """
-    if (
-        scores_df.empty
-        or team_a not in scores_df.columns
-        or team_b not in scores_df.columns
-    ):
+    season = as_season(scores)
+    ia, ib = season.team_index(team_a), season.team_index(team_b)
+    if season.is_empty or ia is None or ib is None:
         return {
             "wins_a": 0,
             "wins_b": 0,
@@ -214,172 +429,404 @@ def compute_head_to_head(scores_df, team_a, team_b):
             "diff_series": pd.Series(dtype=float),
         }
 
-    a = scores_df[team_a].dropna()
-    b = scores_df[team_b].dropna()
-    common = a.index.intersection(b.index)
-    a, b = a.loc[common], b.loc[common]
+    common = np.flatnonzero(season.mask[:, ia] & season.mask[:, ib])
+    a = season.values[common, ia].astype(np.float64)
+    b = season.values[common, ib].astype(np.float64)
 
-    wins_a = int((a > b).sum())
-    wins_b = int((b > a).sum())
-    draws = int((a == b).sum())
-    diff = (a - b).cumsum()
+    return {
+        "wins_a": int((a > b).sum()),
+        "wins_b": int((b > a).sum()),
+        "draws": int((a == b).sum()),
+        "matches_played": len(common),
+        "diff_series": pd.Series(np.cumsum(a - b), index=common),
+    }
+
+
+# Cells (matches × teams × teams) compared per broadcast chunk, which bounds
+# the temporary arrays to a few MB however large the league grows.
+_H2H_CHUNK_CELLS = 1 << 22
+
+
+def compute_head_to_head_matrix(scores):
+    """Every pair's head-to-head record at once.
+
+    Returns dict with:
+        teams, index ({team: position}),
+        wins (wins[i, j] = matches team i outscored team j),
+        draws, played (matches both teams scored in),
+        differential (points of i minus points of j over those matches)
+    Read a pair with head_to_head_lookup().
+    """
+    season = as_season(scores)
+    n_teams = len(season.teams)
+    values = season.values.astype(np.float64)
+    mask = season.mask.astype(np.float64)
+
+    # Values are 0 where missing, so these sums cover common matches only.
+    played = mask.T @ mask
+    differential = values.T @ mask - mask.T @ values
+
+    wins = np.zeros((n_teams, n_teams), dtype=np.int64)
+    draws = np.zeros((n_teams, n_teams), dtype=np.int64)
+    step = max(1, _H2H_CHUNK_CELLS // max(1, n_teams * n_teams))
+    for start in range(0, len(season.matches), step):
+        v = season.values[start : start + step]
+        m = season.mask[start : start + step]
+        both = m[:, :, None] & m[:, None, :]
+        wins += (both & (v[:, :, None] > v[:, None, :])).sum(axis=0)
+        draws += (both & (v[:, :, None] == v[:, None, :])).sum(axis=0)
+    np.fill_diagonal(draws, 0)
 
     return {
-        "wins_a": wins_a,
-        "wins_b": wins_b,
+        "teams": season.teams,
+        "index": {team: i for i, team in enumerate(season.teams)},
+        "wins": wins,
         "draws": draws,
-        "matches_played": len(common),
-        "diff_series": diff,
+        "played": played.astype(np.int64),
+        "differential": differential,
+    }
+
+
+def head_to_head_lookup(matrix, team_a, team_b):
+    """compute_head_to_head() counts for one pair, read from the matrix.
+
+    Returns dict with wins_a, wins_b, draws, matches_played and differential
+    (total points of A minus B over their common matches).
+    """
+    ia, ib = matrix["index"].get(team_a), matrix["index"].get(team_b)
+    if ia is None or ib is None:
+        return {
+            "wins_a": 0,
+            "wins_b": 0,
+            "draws": 0,
+            "matches_played": 0,
+            "differential": 0.0,
+        }
+    return {
+        "wins_a": int(matrix["wins"][ia, ib]),
+        "wins_b": int(matrix["wins"][ib, ia]),
+        "draws": int(matrix["draws"][ia, ib]),
+        "matches_played": int(matrix["played"][ia, ib]),
+        "differential": float(matrix["differential"][ia, ib]),
     }
 
 
 # ─── Rolling Average ────────────────────────────────────────────────────────
 
 
-def compute_rolling_average(scores_df, window=ROLLING_WINDOW):
-    """Return DataFrame with rolling mean: Match | Team1 | Team2 ..."""
-    if scores_df.empty:
-        return scores_df.copy()
-    teams = _team_cols(scores_df)
-    result = scores_df[["Match"]].copy()
-    for t in teams:
-        result[t] = scores_df[t].rolling(window=window, min_periods=1).mean().round(1)
-    return result
+def compute_rolling_average(scores, window=ROLLING_WINDOW):
+    """Return DataFrame with rolling mean: Match | Team1 | Team2 ...
+
+    Matches without a score are skipped inside each window; a window with no
+    scores at all is NaN.
+    """
+    season = as_season(scores)
+    if season.is_empty:
+        return season.to_frame()
+    sums, _, counts = _prefix_sums(season)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        mean = _window_diff(sums, window) / _window_diff(counts, window)
+    return season.to_frame(np.round(mean, 1))
+
+
+ROLLING_STATS = ("mean", "std", "min", "max")
+
+
+def compute_rolling_stats(scores, windows=ROLLING_WINDOWS):
+    """Rolling mean, std, min and max for several windows, all teams at once.
+
+    Returns {window: {stat: (matches, teams) float64 array}} with stats from
+    ROLLING_STATS and window None meaning the season so far. Like
+    compute_rolling_average(), matches without a score are skipped inside a
+    window; std is the sample std (NaN below two scores), and every value is
+    rounded to 1 decimal. Mean and std come from prefix sums and sums of
+    squares, so each window costs O(matches × teams).
+    """
+    season = as_season(scores)
+    n_rows = len(season.matches)
+    if season.is_empty:
+        shape = season.values.shape
+        return {w: {s: np.zeros(shape) for s in ROLLING_STATS} for w in windows}
+    sums, squares, counts = _prefix_sums(season)
+    low = np.where(season.mask, season.values.astype(np.float64), np.inf)
+    high = np.where(season.mask, season.values.astype(np.float64), -np.inf)
+
+    stats = {}
+    for window in windows:
+        width = n_rows if window is None else window
+        n = _window_diff(counts, width)
+        total = _window_diff(sums, width)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = total / n
+            var = (_window_diff(squares, width) - total * mean) / (n - 1)
+        std = np.sqrt(np.maximum(var, 0))
+        std[n < 2] = np.nan
+        if window is None:
+            lo = np.minimum.accumulate(low, axis=0)
+            hi = np.maximum.accumulate(high, axis=0)
+        else:
+            lo = _sliding(low, width, np.inf).min(axis=-1)
+            hi = _sliding(high, width, -np.inf).max(axis=-1)
+        lo[n == 0] = np.nan
+        hi[n == 0] = np.nan
+        stats[window] = {
+            "mean": np.round(mean, 1),
+            "std": np.round(std, 1),
+            "min": np.round(lo, 1),
+            "max": np.round(hi, 1),
+        }
+    return stats
+
+
+def _prefix_sums(season):
+    """Prefix sums of values, squared values and score counts; row 0 is zero."""
+    values = season.values.astype(np.float64)
+    prefix = np.zeros((3, len(season.matches) + 1, len(season.teams)))
+    np.cumsum(values, axis=0, out=prefix[0, 1:])
+    np.cumsum(values * values, axis=0, out=prefix[1, 1:])
+    np.cumsum(season.mask, axis=0, out=prefix[2, 1:])
+    return prefix[0], prefix[1], prefix[2]
+
+
+def _window_diff(prefix, window):
+    """Per-row sums over the last window rows, from a prefix-sum array."""
+    end = np.arange(1, len(prefix))
+    return prefix[end] - prefix[np.maximum(end - window, 0)]
+
+
+def _sliding(values, window, fill):
+    """(rows, teams, window) view of each row's last window rows, padded with fill."""
+    padded = np.vstack([np.full((window - 1, values.shape[1]), fill), values])
+    return np.lib.stride_tricks.sliding_window_view(padded, window, axis=0)
 
 
 # ─── Transfer Efficiency ────────────────────────────────────────────────────
 
 
-def compute_transfer_efficiency(scores_df, transfers_df):
+def compute_transfer_efficiency(scores, transfers):
     """Cumulative points / cumulative transfers over the season.
 
-    Returns DataFrame: Match | Team1 | Team2 … (efficiency values)
+    Transfers are matched to scores by match number. Returns DataFrame:
+    Match | Team1 | Team2 … (efficiency values)
     """
-    if scores_df.empty or transfers_df.empty:
+    season = as_season(scores)
+    transfer_season = as_season(transfers)
+    if season.is_empty or transfer_season.is_empty:
         return pd.DataFrame(columns=["Match"])
-    teams = _team_cols(scores_df)
-    common_teams = [t for t in teams if t in transfers_df.columns]
-    result = scores_df[["Match"]].copy()
-    for t in common_teams:
-        cum_pts = scores_df[t].cumsum()
-        cum_tr = transfers_df[t].fillna(0).cumsum()
-        eff = cum_pts / cum_tr.replace(0, np.nan)
-        result[t] = eff.round(1)
+    common = [t for t in season.teams if t in transfer_season.teams]
+    score_cols = [season.teams.index(t) for t in common]
+    transfer_cols = [transfer_season.teams.index(t) for t in common]
+
+    cum_pts = _cumulative(season)[:, score_cols]
+    cum_tr = np.cumsum(
+        transfer_season.values[:, transfer_cols], axis=0, dtype=np.float64
+    )
+    # Transfers made up to and including each scored match
+    rows = np.searchsorted(transfer_season.matches, season.matches, side="right") - 1
+    cum_tr = np.where(rows[:, None] >= 0, cum_tr[np.maximum(rows, 0)], 0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        eff = np.round(cum_pts / np.where(cum_tr == 0, np.nan, cum_tr), 1)
+
+    result = pd.DataFrame(eff, columns=common)
+    result.insert(0, "Match", season.matches.astype(np.int64))
     return result
 
 
+# ─── Transfer Pacing ────────────────────────────────────────────────────────
+
+
+TRANSFER_PACING_COLUMNS = [
+    "Team",
+    "Used",
+    "Remaining",
+    "Burn Rate",
+    "Sustainable Rate",
+    "Runs Out",
+    "Exhausted",
+]
+
+
+def transfer_pacing(
+    used,
+    elapsed,
+    exhausted_before=None,
+    total_transfers=TOTAL_TRANSFERS,
+    total_matches=TOTAL_MATCHES,
+):
+    """Budget pacing for cumulative transfers used after elapsed matches.
+
+    used: (rows, teams) running totals; elapsed: (rows,) match numbers.
+    exhausted_before seeds exhausted_at with the row before the first one, so
+    a suffix can be recomputed on its own. Returns dict of (rows, teams)
+    arrays: remaining, burn_rate (per match so far), sustainable (remaining
+    per match left; NaN when none are left), exhausted_at (match the budget
+    ran out; NaN while it lasts) and runs_out (exhausted_at, else the match
+    the budget runs out at the current burn rate; NaN when it lasts the season).
+    """
+    elapsed = np.asarray(elapsed, dtype=np.float64)[:, None]
+    remaining = total_transfers - used
+    left = total_matches - elapsed
+    with np.errstate(invalid="ignore", divide="ignore"):
+        burn_rate = used / elapsed
+        sustainable = np.where(left > 0, np.maximum(remaining, 0) / left, np.nan)
+        projected = np.ceil(elapsed + remaining / burn_rate)
+    projected[~(projected <= total_matches)] = np.nan
+
+    crossed = np.where(used >= total_transfers, elapsed, np.nan)
+    if exhausted_before is not None:
+        crossed = np.vstack([exhausted_before[None], crossed])
+    exhausted_at = np.fmin.accumulate(crossed, axis=0)[-len(used) :]
+    return {
+        "remaining": remaining,
+        "burn_rate": burn_rate,
+        "sustainable": sustainable,
+        "exhausted_at": exhausted_at,
+        "runs_out": np.where(np.isnan(exhausted_at), projected, exhausted_at),
+    }
+
+
+def pacing_frame(teams, used, pacing):
+    """TRANSFER_PACING_COLUMNS DataFrame from one row of transfer_pacing()."""
+    return pd.DataFrame(
+        {
+            "Team": teams,
+            "Used": used.astype(np.int64),
+            "Remaining": pacing["remaining"].astype(np.int64),
+            "Burn Rate": np.round(pacing["burn_rate"], 2),
+            "Sustainable Rate": np.round(pacing["sustainable"], 2),
+            "Runs Out": pacing["runs_out"],
+            "Exhausted": ~np.isnan(pacing["exhausted_at"]),
+        }
+    )
+
+
+def compute_transfer_pacing(transfers, current_match):
+    """Each team's transfer budget pacing after current_match.
+
+    Returns DataFrame: Team, Used, Remaining, Burn Rate (transfers per match
+    so far), Sustainable Rate (transfers per remaining fixture), Runs Out
+    (match the budget ran or will run out at the current rate; NaN when it
+    lasts the season), Exhausted.
+    """
+    season = as_season(transfers)
+    if season.is_empty or not current_match:
+        return pd.DataFrame(columns=TRANSFER_PACING_COLUMNS)
+    n = int(np.searchsorted(season.matches, current_match, side="right"))
+    cum = np.cumsum(season.values[:n], axis=0, dtype=np.float64)
+    history = transfer_pacing(cum, season.matches[:n])
+    used = cum[-1] if n else np.zeros(len(season.teams))
+    before = history["exhausted_at"][-1] if n else None
+    pacing = transfer_pacing(used[None], [current_match], before)
+    return pacing_frame(season.teams, used, {k: v[0] for k, v in pacing.items()})
+
+
 # ─── Awards / Badges ────────────────────────────────────────────────────────
 
 
-def compute_awards(scores_df, transfers_df=None):
+def compute_awards(scores, transfers=None):
     """Compute season awards.
 
     Returns dict:  { badge_name: [ {team, detail}, ... ] }
     """
     awards = {}
-    if scores_df.empty:
+    season = as_season(scores)
+    if season.is_empty:
         return awards
-    teams = _team_cols(scores_df)
+    teams = np.array(season.teams, dtype=object)
+    scored = season.masked()
+    totals = np.cumsum(season.values, axis=0, dtype=np.float64)[-1]
 
     # --- Match MVPs (highest scorer each match) ---
-    mvp_counts = {t: 0 for t in teams}
-    for _, row in scores_df.iterrows():
-        vals = {t: row[t] for t in teams if pd.notna(row[t])}
-        if vals:
-            mvp = max(vals, key=vals.get)
-            mvp_counts[mvp] += 1
-    most_mvps = max(mvp_counts.values()) if mvp_counts else 0
+    played = season.mask.any(axis=1)
+    mvps = np.argmax(np.where(season.mask, scored, -np.inf)[played], axis=1)
+    mvp_counts = np.bincount(mvps, minlength=len(teams))
+    leaders = mvp_counts == mvp_counts.max()
     awards["🏆 Match MVP Leader"] = [
         {"team": t, "detail": f"{c} MVPs"}
-        for t, c in sorted(mvp_counts.items(), key=lambda x: -x[1])
-        if c == most_mvps and c > 0
+        for t, c in zip(teams[leaders], mvp_counts[leaders])
+        if c > 0
     ]
 
     # --- Centurion (500+ single match) ---
-    centurions = []
-    for t in teams:
-        big = scores_df[scores_df[t] >= CENTURION_THRESHOLD]
-        if len(big) > 0:
-            centurions.append(
-                {"team": t, "detail": f"{len(big)}× ({int(scores_df[t].max())} best)"}
-            )
-    awards["💎 Centurion"] = centurions
+    big = (season.mask & (season.values >= CENTURION_THRESHOLD)).sum(axis=0)
+    best = np.max(np.where(season.mask, scored, -np.inf), axis=0)
+    awards["💎 Centurion"] = [
+        {"team": t, "detail": f"{n}× ({int(b)} best)"}
+        for t, n, b in zip(teams[big > 0], big[big > 0], best[big > 0])
+    ]
 
     # --- Consistency King (lowest CV with above-avg total) ---
-    cons = compute_consistency(scores_df)
-    totals = scores_df[teams].sum()
-    avg_total = totals.mean()
-    above_avg = cons[cons["Team"].isin(totals[totals >= avg_total].index)]
-    if not above_avg.empty:
-        best = above_avg.sort_values("CV").iloc[0]
+    _, mean, std, _, _ = _team_moments(season)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        cv = np.where(mean > 0, np.round(std / mean * 100, 1), 0)
+    # Candidates in consistency-table order (Std Dev, stable), then by CV
+    by_std = np.argsort(np.round(std, 1), kind="stable")
+    candidates = by_std[totals[by_std] >= totals.mean()]
+    if len(candidates):
+        king = candidates[np.argsort(cv[candidates], kind="stable")[0]]
         awards["🏅 Consistency King"] = [
-            {"team": best["Team"], "detail": f"CV: {best['CV']}%"}
+            {"team": teams[king], "detail": f"CV: {cv[king]}%"}
         ]
 
     # --- Most Improved (biggest rank climb first match → last) ---
-    if len(scores_df) >= 3:
-        early = scores_df.iloc[:1]
-        early_rank = early[teams].sum().rank(ascending=False)
-        final_rank = scores_df[teams].sum().rank(ascending=False)
-        improvement = early_rank - final_rank
-        best_team = improvement.idxmax()
-        climb = int(improvement[best_team])
+    if len(season.matches) >= 3:
+        improvement = _rank_desc(season.values[0]) - _rank_desc(totals)
+        best_idx = int(np.argmax(improvement))
+        climb = int(improvement[best_idx])
         if climb > 0:
             awards["📈 Most Improved"] = [
-                {"team": best_team, "detail": f"Climbed {climb} spots"}
+                {"team": teams[best_idx], "detail": f"Climbed {climb} spots"}
             ]
 
     # --- Transfer Genius (best cumulative efficiency at latest match) ---
-    if transfers_df is not None and not transfers_df.empty:
-        common = [t for t in teams if t in transfers_df.columns]
-        if common:
-            total_pts = scores_df[common].sum()
-            total_tr = transfers_df[common].fillna(0).sum()
-            eff = total_pts / total_tr.replace(0, np.nan)
-            eff = eff.dropna()
-            if not eff.empty:
-                best_t = eff.idxmax()
+    if transfers is not None:
+        transfer_season = as_season(transfers)
+        common = [i for i, t in enumerate(season.teams) if t in transfer_season.teams]
+        if common and not transfer_season.is_empty:
+            total_tr = transfer_season.values.sum(axis=0, dtype=np.float64)[
+                [transfer_season.teams.index(season.teams[i]) for i in common]
+            ]
+            with np.errstate(invalid="ignore", divide="ignore"):
+                eff = totals[common] / np.where(total_tr == 0, np.nan, total_tr)
+            if not np.isnan(eff).all():
+                best_t = int(np.nanargmax(eff))
                 awards["🎯 Transfer Genius"] = [
-                    {"team": best_t, "detail": f"{eff[best_t]:.1f} pts/transfer"}
+                    {
+                        "team": teams[common[best_t]],
+                        "detail": f"{eff[best_t]:.1f} pts/transfer",
+                    }
                 ]
 
     # --- On Fire / Ice Cold (current streaks) ---
-    streaks = compute_streaks(scores_df)
-    hot = streaks[
-        (streaks["Streak Type"] == "🔥 Hot")
-        & (streaks["Streak Length"] >= STREAK_MIN_LENGTH)
-    ]
-    cold = streaks[
-        (streaks["Streak Type"] == "❄️ Cold")
-        & (streaks["Streak Length"] >= STREAK_MIN_LENGTH)
-    ]
-    if not hot.empty:
-        awards["🔥 On Fire"] = [
-            {"team": r["Team"], "detail": f"{r['Streak Length']} match streak"}
-            for _, r in hot.iterrows()
-        ]
-    if not cold.empty:
-        awards["❄️ Ice Cold"] = [
-            {"team": r["Team"], "detail": f"{r['Streak Length']} match streak"}
-            for _, r in cold.iterrows()
-        ]
+    hot, lengths, _ = _current_streaks(season)
+    streaking = lengths >= STREAK_MIN_LENGTH
+    for badge, selected in (("🔥 On Fire", hot), ("❄️ Ice Cold", ~hot)):
+        selected = selected & streaking
+        if selected.any():
+            awards[badge] = [
+                {"team": t, "detail": f"{n} match streak"}
+                for t, n in zip(teams[selected], lengths[selected])
+            ]
 
     return awards
 
 
+def _rank_desc(values):
+    """Descending rank with ties sharing their average rank (pandas default)."""
+    distinct, inverse, counts = np.unique(
+        -values, return_inverse=True, return_counts=True
+    )
+    starts = np.cumsum(counts) - counts
+    return starts[inverse] + (counts[inverse] + 1) / 2
+
+
 # ─── Form Guide (last N matches) ────────────────────────────────────────────
 
 
-def compute_form_guide(scores_df, n=5):
+def compute_form_guide(scores, n=5):
     """Return dict of {team: list of 'above'/'below'} for last n matches."""
-    if scores_df.empty:
+    season = as_season(scores)
+    if season.is_empty:
         return {}
-    teams = _team_cols(scores_df)
-    last_n = scores_df.tail(n)
-    match_avgs = last_n[teams].mean(axis=1)
-    guide = {}
-    for t in teams:
-        vals = last_n[t].values
-        avgs = match_avgs.values
-        guide[t] = ["above" if v > a else "below" for v, a in zip(vals, avgs)]
-    return guide
+    labels = np.where(season.above_average[-n:], "above", "below")
+    return {t: labels[:, i].tolist() for i, t in enumerate(season.teams)}
@@ -1,11 +1,27 @@
 """Plotly figure factory functions.
 
-Every function returns a go.Figure with consistent theming.
+Every function returns a plain figure dict ({"data": [...], "layout": {...}})
+with consistent theming. Traces and layouts are written in the normalized form
+Plotly's validators would produce, so a figure skips go.Figure validation and
+serializes to the same JSON. NumPy arrays go straight into the traces and are
+sent as plotly.js typed arrays (base64), as go.Figure.to_dict() sends them.
+The layout template is Plotly's registered default, serialized once.
+go.Figure(fig) still accepts every figure when the object API is needed.
 """
 
+import base64
+
 import numpy as np
 import plotly.graph_objects as go
-from utils.constants import CHART_LAYOUT_DEFAULTS, CHART_HEIGHT
+import plotly.io as pio
+from utils.constants import (
+    CHART_LAYOUT_DEFAULTS,
+    CHART_HEIGHT,
+    CHART_GRID_COLOR,
+    TOTAL_MATCHES,
+    TOTAL_TRANSFERS,
+    WEBGL_POINT_THRESHOLD,
+)
 
 
 def _hex_to_rgba(hex_color, opacity=0.33):
@@ -17,8 +33,21 @@ def _hex_to_rgba(hex_color, opacity=0.33):
     return f"rgba({r},{g},{b},{opacity})"
 
 
-def _apply_theme(fig, title="", **overrides):
-    """Apply standard layout theme to a figure."""
+_TEMPLATE = pio.templates[pio.templates.default].to_plotly_json()
+# Named colorscales resolved once by the validator; plotly.js has its own,
+# different scales under some of the same names.
+_COLORSCALES = {
+    name: go.Heatmap(colorscale=name).to_plotly_json()["colorscale"]
+    for name in ("YlOrRd", "RdBu")
+}
+
+
+def _figure(data, title="", **overrides):
+    """Figure dict with the standard layout theme.
+
+    overrides replace top-level layout keys; "xaxis_title" / "yaxis_title" then
+    set the title text on that axis, as update_layout() did.
+    """
     layout = {
         **CHART_LAYOUT_DEFAULTS,
         "title": dict(
@@ -29,86 +58,202 @@ def _apply_theme(fig, title="", **overrides):
             pad=dict(l=4, t=2),
         ),
     }
-    layout.update(overrides)
-    fig.update_layout(**layout)
-    return fig
+    titles = {}
+    for key, value in overrides.items():
+        axis, _, prop = key.partition("_")
+        if prop == "title":
+            titles[axis] = value
+        else:
+            layout[key] = value
+    for axis, text in titles.items():
+        layout[axis] = {**layout.get(axis, {}), "title": dict(text=text)}
+    layout["template"] = _TEMPLATE
+    return {"data": [_typed_arrays(trace) for trace in data], "layout": layout}
+
+
+_TYPED_ARRAY_DTYPES = {
+    "int8": "i1",
+    "uint8": "u1",
+    "int16": "i2",
+    "uint16": "u2",
+    "int32": "i4",
+    "uint32": "u4",
+    "float32": "f4",
+    "float64": "f8",
+}
+
+
+def _typed_array(values):
+    """plotly.js typed array spec for a NumPy array, as go.Figure.to_dict() emits.
+
+    int64 is narrowed to the smallest integer type that holds the values;
+    empty arrays and other dtypes stay arrays (sent as JSON lists).
+    """
+    if values.size and values.dtype == np.int64:
+        for dtype in (np.int8, np.int16, np.int32):
+            info = np.iinfo(dtype)
+            if info.min <= values.min() and values.max() <= info.max:
+                values = values.astype(dtype)
+                break
+    code = _TYPED_ARRAY_DTYPES.get(str(values.dtype))
+    if not values.size or code is None:
+        return values
+    spec = {"dtype": code, "bdata": base64.b64encode(np.ascontiguousarray(values)).decode("ascii")}
+    if values.ndim > 1:
+        spec["shape"] = str(values.shape)[1:-1]
+    return spec
+
+
+def _typed_arrays(props):
+    """props with every NumPy array (also in nested dicts) as a typed array."""
+    return {
+        key: _typed_array(value)
+        if isinstance(value, np.ndarray)
+        else _typed_arrays(value)
+        if isinstance(value, dict)
+        else value
+        for key, value in props.items()
+    }
 
 
 def _team_cols(df):
     return [c for c in df.columns if c != "Match"]
 
 
+def _values(series):
+    return series.to_numpy()
+
+
+def _scatter_type(df, teams, threshold):
+    """"scattergl" when df's team columns hold more than threshold points.
+
+    SVG render time grows with every point drawn; WebGL stays flat. WebGL
+    traces only draw straight line segments, see _line_shape().
+    """
+    return "scattergl" if len(df) * len(teams) > threshold else "scatter"
+
+
+def _line_shape(trace_type, shape="spline"):
+    return {"shape": shape} if trace_type == "scatter" else {}
+
+
+def _running_totals(df, teams):
+    """{team: cumulative sum of df[team], missing values counted as 0}."""
+    teams = list(teams)
+    totals = np.nan_to_num(df[teams].to_numpy()).cumsum(axis=0)
+    return dict(zip(teams, totals.T))
+
+
 def empty_fig(message="No data available yet"):
     """Return a placeholder figure with a message."""
-    fig = go.Figure()
-    fig.add_annotation(
-        text=message,
-        xref="paper",
-        yref="paper",
-        x=0.5,
-        y=0.5,
-        showarrow=False,
-        font=dict(size=18, color="#888"),
+    return _figure(
+        [],
+        annotations=[
+            dict(
+                text=message,
+                xref="paper",
+                yref="paper",
+                x=0.5,
+                y=0.5,
+                showarrow=False,
+                font=dict(size=18, color="#888"),
+            )
+        ],
     )
-    return _apply_theme(fig)
 
 
 # ─── Points Race (Cumulative Line Chart) ────────────────────────────────────
 
 
-def fig_points_race(cumulative_df, colors):
+def fig_points_race(cumulative_df, colors, webgl_threshold=WEBGL_POINT_THRESHOLD):
     """Cumulative points line chart over matches."""
     if cumulative_df.empty:
         return empty_fig()
-    fig = go.Figure()
+    x = _values(cumulative_df["Match"])
     teams = _team_cols(cumulative_df)
-    for t in teams:
-        fig.add_trace(
-            go.Scatter(
-                x=cumulative_df["Match"],
-                y=cumulative_df[t],
-                mode="lines",
-                name=t,
-                line=dict(color=colors.get(t, "#888"), width=3, shape="spline"),
-                hovertemplate=f"<b>{t}</b><br>Match %{{x}}<br>Total: %{{y:,.0f}} pts<extra></extra>",
-            )
+    kind = _scatter_type(cumulative_df, teams, webgl_threshold)
+    data = [
+        dict(
+            type=kind,
+            x=x,
+            y=_values(cumulative_df[t]),
+            mode="lines",
+            name=t,
+            line=dict(color=colors.get(t, "#888"), width=3, **_line_shape(kind)),
+            hovertemplate=f"<b>{t}</b><br>Match %{{x}}<br>Total: %{{y:,.0f}} pts<extra></extra>",
         )
-    return _apply_theme(
-        fig, title="", xaxis_title="Match", yaxis_title="Cumulative Points"
+        for t in teams
+    ]
+    return _figure(data, title="", xaxis_title="Match", yaxis_title="Cumulative Points")
+
+
+# ─── Rank Over Time (Bump Chart) ────────────────────────────────────────────
+
+
+def fig_rank_trajectory(rank_df, colors, axis_title="Rank"):
+    """Bump chart of each team's rank after every match (1 at the top)."""
+    if rank_df.empty:
+        return empty_fig()
+    x = _values(rank_df["Match"])
+    data = [
+        dict(
+            type="scatter",
+            x=x,
+            y=_values(rank_df[t]),
+            mode="lines+markers",
+            name=t,
+            line=dict(color=colors.get(t, "#888"), width=3),
+            marker=dict(color=colors.get(t, "#888"), size=7),
+            hovertemplate=f"<b>{t}</b><br>Match %{{x}}<br>{axis_title}: #%{{y}}<extra></extra>",
+        )
+        for t in _team_cols(rank_df)
+    ]
+    return _figure(
+        data,
+        title="",
+        xaxis_title="Match",
+        yaxis=dict(
+            title=dict(text=axis_title),
+            autorange="reversed",
+            dtick=1,
+            gridcolor=CHART_GRID_COLOR,
+            zeroline=False,
+        ),
     )
 
 
 # ─── Points Earned Per Match (Scatter) ───────────────────────────────────────
 
 
-def fig_points_earned(scores_df, colors):
+def fig_points_earned(scores_df, colors, webgl_threshold=WEBGL_POINT_THRESHOLD):
     """Bubble scatter of points earned per match."""
     if scores_df.empty:
         return empty_fig()
-    fig = go.Figure()
+    x = _values(scores_df["Match"])
     teams = _team_cols(scores_df)
-    for t in teams:
-        size = (
-            scores_df[t].clip(lower=50) / scores_df[t].max() * 18
-            if scores_df[t].max() > 0
-            else 6
-        )
-        fig.add_trace(
-            go.Scatter(
-                x=scores_df["Match"],
-                y=scores_df[t],
-                mode="markers",
-                name=t,
-                marker=dict(
-                    color=colors.get(t, "#888"),
-                    size=size,
-                    opacity=0.8,
-                    line=dict(width=1, color="rgba(255,255,255,0.3)"),
-                ),
-                hovertemplate=f"<b>{t}</b><br>Match %{{x}}<br>Points: %{{y:,.1f}}<extra></extra>",
-            )
+    points = scores_df[teams].to_numpy()
+    best = np.fmax.reduce(points, axis=0)  # ignores missed matches
+    with np.errstate(invalid="ignore", divide="ignore"):
+        sizes = np.clip(points, 50, None) / best * 18
+    kind = _scatter_type(scores_df, teams, webgl_threshold)
+    data = [
+        dict(
+            type=kind,
+            x=x,
+            y=points[:, i],
+            mode="markers",
+            name=t,
+            marker=dict(
+                color=colors.get(t, "#888"),
+                size=sizes[:, i] if best[i] > 0 else 6,
+                opacity=0.8,
+                line=dict(width=1, color="rgba(255,255,255,0.3)"),
+            ),
+            hovertemplate=f"<b>{t}</b><br>Match %{{x}}<br>Points: %{{y:,.1f}}<extra></extra>",
         )
-    return _apply_theme(fig, title="", xaxis_title="Match", yaxis_title="Points")
+        for i, t in enumerate(teams)
+    ]
+    return _figure(data, title="", xaxis_title="Match", yaxis_title="Points")
 
 
 # ─── Points Distribution (Box Plot) ─────────────────────────────────────────
@@ -118,23 +263,22 @@ def fig_points_distribution(scores_df, colors):
     """Box plot showing score distribution per team."""
     if scores_df.empty:
         return empty_fig()
-    fig = go.Figure()
     teams = _team_cols(scores_df)
     totals = {t: scores_df[t].sum() for t in teams}
     sorted_teams = sorted(teams, key=lambda x: totals[x], reverse=True)
-    for t in sorted_teams:
-        fig.add_trace(
-            go.Box(
-                y=scores_df[t].dropna(),
-                name=t,
-                marker_color=colors.get(t, "#888"),
-                boxmean="sd",
-                hoverinfo="y+name",
-            )
+    points = dict(zip(teams, scores_df[teams].to_numpy().T))
+    data = [
+        dict(
+            type="box",
+            y=points[t][~np.isnan(points[t])],
+            name=t,
+            marker=dict(color=colors.get(t, "#888")),
+            boxmean="sd",
+            hoverinfo="y+name",
         )
-    return _apply_theme(
-        fig, title="Score Distribution", yaxis_title="Points", showlegend=False
-    )
+        for t in sorted_teams
+    ]
+    return _figure(data, title="Score Distribution", yaxis_title="Points", showlegend=False)
 
 
 # ─── Scoring Heatmap ────────────────────────────────────────────────────────
@@ -147,18 +291,16 @@ def fig_scoring_heatmap(scores_df, colors):
     teams = _team_cols(scores_df)
     totals = {t: scores_df[t].sum() for t in teams}
     sorted_teams = sorted(teams, key=lambda x: totals[x], reverse=True)
-    z = [scores_df[t].values for t in sorted_teams]
-    fig = go.Figure(
-        go.Heatmap(
-            z=z,
-            x=scores_df["Match"].values,
-            y=sorted_teams,
-            colorscale="YlOrRd",
-            hovertemplate="Match %{x}<br>%{y}<br>Points: %{z:,.0f}<extra></extra>",
-        )
+    heatmap = dict(
+        type="heatmap",
+        z=[scores_df[t].values for t in sorted_teams],
+        x=_values(scores_df["Match"]),
+        y=sorted_teams,
+        colorscale=_COLORSCALES["YlOrRd"],
+        hovertemplate="Match %{x}<br>%{y}<br>Points: %{z:,.0f}<extra></extra>",
     )
-    return _apply_theme(
-        fig,
+    return _figure(
+        [heatmap],
         title="Scoring Heatmap",
         xaxis_title="Match",
         height=max(CHART_HEIGHT, len(teams) * 45 + 100),
@@ -176,27 +318,20 @@ def fig_head_to_head_bars(scores_df, team_a, team_b, colors):
         or team_b not in scores_df.columns
     ):
         return empty_fig("Select two teams to compare")
-    fig = go.Figure()
-    fig.add_trace(
-        go.Bar(
-            x=scores_df["Match"],
-            y=scores_df[team_a],
-            name=team_a,
-            marker_color=colors.get(team_a, "#888"),
+    x = _values(scores_df["Match"])
+    data = [
+        dict(
+            type="bar",
+            x=x,
+            y=_values(scores_df[t]),
+            name=t,
+            marker=dict(color=colors.get(t, "#888")),
             opacity=0.9,
         )
-    )
-    fig.add_trace(
-        go.Bar(
-            x=scores_df["Match"],
-            y=scores_df[team_b],
-            name=team_b,
-            marker_color=colors.get(team_b, "#888"),
-            opacity=0.9,
-        )
-    )
-    return _apply_theme(
-        fig,
+        for t in (team_a, team_b)
+    ]
+    return _figure(
+        data,
         title=f"{team_a}  vs  {team_b}",
         barmode="group",
         xaxis_title="Match",
@@ -204,6 +339,91 @@ def fig_head_to_head_bars(scores_df, team_a, team_b, colors):
     )
 
 
+# ─── Head-to-Head Matrix ────────────────────────────────────────────────────
+
+
+def fig_head_to_head_matrix(matrix, teams):
+    """Heatmap of every pair: row team's points differential vs column team.
+
+    teams sets the row/column order (e.g. leaderboard order); hover shows the
+    row team's W-D-L record against the column team.
+    """
+    idx = [matrix["index"][t] for t in teams if t in matrix["index"]]
+    if len(idx) < 2:
+        return empty_fig("Head-to-head records appear once two teams have scores")
+    labels = [matrix["teams"][i] for i in idx]
+    grid = np.ix_(idx, idx)
+    played = matrix["played"][grid]
+    z = np.where(played > 0, matrix["differential"][grid], np.nan)
+    np.fill_diagonal(z, np.nan)
+    record = np.stack(
+        [matrix["wins"][grid], matrix["draws"][grid], matrix["wins"].T[grid], played],
+        axis=-1,
+    )
+    heatmap = dict(
+        type="heatmap",
+        z=z,
+        x=labels,
+        y=labels,
+        customdata=record,
+        colorscale=_COLORSCALES["RdBu"],
+        zmid=0,
+        hoverongaps=False,
+        colorbar=dict(title=dict(text="Diff")),
+        hovertemplate=(
+            "<b>%{y}</b> vs %{x}<br>"
+            "W-D-L: %{customdata[0]}-%{customdata[1]}-%{customdata[2]}"
+            " in %{customdata[3]} matches<br>"
+            "Points diff: %{z:+,.1f}<extra></extra>"
+        ),
+    )
+    return _figure(
+        [heatmap],
+        title="League Head-to-Head",
+        xaxis=dict(side="top", tickangle=-45),
+        yaxis=dict(autorange="reversed"),
+        height=max(CHART_HEIGHT, len(labels) * 40 + 160),
+    )
+
+
+# ─── Final Rank Probabilities ───────────────────────────────────────────────
+
+
+def fig_rank_probabilities(projection):
+    """Heatmap of each team's chance of finishing in each place (simulate_season())."""
+    summary = projection["summary"]
+    if summary.empty:
+        return empty_fig("Projections appear once scores are entered")
+    teams = summary["Team"].tolist()
+    places = [f"#{p}" for p in range(1, len(teams) + 1)]
+    heatmap = dict(
+        type="heatmap",
+        z=projection["rank_probabilities"] * 100,
+        x=places,
+        y=teams,
+        customdata=np.broadcast_to(
+            summary[["Expected Points"]].to_numpy(), (len(teams), len(teams))
+        ),
+        colorscale=_COLORSCALES["YlOrRd"],
+        zmin=0,
+        zmax=100,
+        colorbar=dict(title=dict(text="%")),
+        hovertemplate=(
+            "<b>%{y}</b> finishes %{x}: %{z:.1f}%<br>"
+            "Expected points: %{customdata:,.0f}<extra></extra>"
+        ),
+    )
+    if len(teams) <= 15:
+        heatmap["texttemplate"] = "%{z:.0f}%"
+    return _figure(
+        [heatmap],
+        title=f"Final Rank Probabilities · {projection['simulations']:,} simulated seasons",
+        xaxis_title="Final place",
+        yaxis=dict(autorange="reversed"),
+        height=max(CHART_HEIGHT, len(teams) * 36 + 160),
+    )
+
+
 # ─── Radar Comparison ────────────────────────────────────────────────────────
 
 
@@ -223,29 +443,20 @@ def fig_radar_comparison(stats_a, stats_b, team_a, team_b, colors):
     norm_a = [a / m * 100 for a, m in zip(vals_a, max_vals)]
     norm_b = [b / m * 100 for b, m in zip(vals_b, max_vals)]
 
-    fig = go.Figure()
-    fig.add_trace(
-        go.Scatterpolar(
-            r=norm_a + [norm_a[0]],
-            theta=categories + [categories[0]],
-            fill="toself",
-            name=team_a,
-            line=dict(color=colors.get(team_a, "#888"), width=2),
-            opacity=0.7,
-        )
-    )
-    fig.add_trace(
-        go.Scatterpolar(
-            r=norm_b + [norm_b[0]],
+    data = [
+        dict(
+            type="scatterpolar",
+            r=norm + [norm[0]],
             theta=categories + [categories[0]],
             fill="toself",
-            name=team_b,
-            line=dict(color=colors.get(team_b, "#888"), width=2),
+            name=t,
+            line=dict(color=colors.get(t, "#888"), width=2),
             opacity=0.7,
         )
-    )
-    return _apply_theme(
-        fig,
+        for t, norm in ((team_a, norm_a), (team_b, norm_b))
+    ]
+    return _figure(
+        data,
         title=f"{team_a}  vs  {team_b}",
         polar=dict(
             bgcolor="rgba(0,0,0,0)",
@@ -264,32 +475,24 @@ def fig_differential(scores_df, team_a, team_b, diff_series, colors):
     """Area chart of cumulative points difference (A − B)."""
     if diff_series.empty:
         return empty_fig("Select two teams to compare")
-    matches = scores_df["Match"].iloc[diff_series.index]
-    fig = go.Figure()
-    positive = diff_series.clip(lower=0)
-    negative = diff_series.clip(upper=0)
-    fig.add_trace(
-        go.Scatter(
+    matches = _values(scores_df["Match"].iloc[diff_series.index])
+    data = [
+        dict(
+            type="scatter",
             x=matches,
-            y=positive,
+            y=_values(side),
             fill="tozeroy",
-            name=f"{team_a} leads",
-            line=dict(color=colors.get(team_a, "#888"), width=1),
-            fillcolor=_hex_to_rgba(colors.get(team_a, "#888")),
+            name=f"{t} leads",
+            line=dict(color=colors.get(t, "#888"), width=1),
+            fillcolor=_hex_to_rgba(colors.get(t, "#888")),
         )
-    )
-    fig.add_trace(
-        go.Scatter(
-            x=matches,
-            y=negative,
-            fill="tozeroy",
-            name=f"{team_b} leads",
-            line=dict(color=colors.get(team_b, "#888"), width=1),
-            fillcolor=_hex_to_rgba(colors.get(team_b, "#888")),
+        for t, side in (
+            (team_a, diff_series.clip(lower=0)),
+            (team_b, diff_series.clip(upper=0)),
         )
-    )
-    return _apply_theme(
-        fig,
+    ]
+    return _figure(
+        data,
         title="Cumulative Points Differential",
         xaxis_title="Match",
         yaxis_title="Points Diff (cumulative)",
@@ -299,25 +502,27 @@ def fig_differential(scores_df, team_a, team_b, diff_series, colors):
 # ─── Momentum (Rolling Average) ─────────────────────────────────────────────
 
 
-def fig_momentum(rolling_df, colors):
+def fig_momentum(rolling_df, colors, webgl_threshold=WEBGL_POINT_THRESHOLD):
     """Rolling average line chart."""
     if rolling_df.empty:
         return empty_fig()
-    fig = go.Figure()
+    x = _values(rolling_df["Match"])
     teams = _team_cols(rolling_df)
-    for t in teams:
-        fig.add_trace(
-            go.Scatter(
-                x=rolling_df["Match"],
-                y=rolling_df[t],
-                mode="lines",
-                name=t,
-                line=dict(color=colors.get(t, "#888"), width=2.5, shape="spline"),
-                hovertemplate=f"<b>{t}</b><br>Match %{{x}}<br>Rolling Avg: %{{y:,.1f}}<extra></extra>",
-            )
+    kind = _scatter_type(rolling_df, teams, webgl_threshold)
+    data = [
+        dict(
+            type=kind,
+            x=x,
+            y=_values(rolling_df[t]),
+            mode="lines",
+            name=t,
+            line=dict(color=colors.get(t, "#888"), width=2.5, **_line_shape(kind)),
+            hovertemplate=f"<b>{t}</b><br>Match %{{x}}<br>Rolling Avg: %{{y:,.1f}}<extra></extra>",
         )
-    return _apply_theme(
-        fig,
+        for t in teams
+    ]
+    return _figure(
+        data,
         title="Momentum (5-Match Rolling Avg)",
         xaxis_title="Match",
         yaxis_title="Rolling Avg Points",
@@ -327,25 +532,27 @@ def fig_momentum(rolling_df, colors):
 # ─── Transfer Efficiency ────────────────────────────────────────────────────
 
 
-def fig_transfer_efficiency(efficiency_df, colors):
+def fig_transfer_efficiency(efficiency_df, colors, webgl_threshold=WEBGL_POINT_THRESHOLD):
     """Cumulative points per transfer over the season."""
     if efficiency_df.empty:
         return empty_fig()
-    fig = go.Figure()
+    x = _values(efficiency_df["Match"])
     teams = _team_cols(efficiency_df)
-    for t in teams:
-        fig.add_trace(
-            go.Scatter(
-                x=efficiency_df["Match"],
-                y=efficiency_df[t],
-                mode="lines",
-                name=t,
-                line=dict(color=colors.get(t, "#888"), width=2.5, shape="spline"),
-                hovertemplate=f"<b>{t}</b><br>Match %{{x}}<br>Efficiency: %{{y:,.1f}}<extra></extra>",
-            )
+    kind = _scatter_type(efficiency_df, teams, webgl_threshold)
+    data = [
+        dict(
+            type=kind,
+            x=x,
+            y=_values(efficiency_df[t]),
+            mode="lines",
+            name=t,
+            line=dict(color=colors.get(t, "#888"), width=2.5, **_line_shape(kind)),
+            hovertemplate=f"<b>{t}</b><br>Match %{{x}}<br>Efficiency: %{{y:,.1f}}<extra></extra>",
         )
-    return _apply_theme(
-        fig,
+        for t in teams
+    ]
+    return _figure(
+        data,
         title="Transfer Efficiency (Pts / Transfer)",
         xaxis_title="Match",
         yaxis_title="Points per Transfer",
@@ -359,51 +566,135 @@ def fig_transfers_accumulated(transfers_df, colors):
     """Cumulative transfers line chart."""
     if transfers_df.empty:
         return empty_fig()
-    fig = go.Figure()
+    x = _values(transfers_df["Match"])
     teams = _team_cols(transfers_df)
-    cum = transfers_df.copy()
-    for t in teams:
-        cum[t] = transfers_df[t].fillna(0).cumsum()
-        fig.add_trace(
-            go.Scatter(
-                x=cum["Match"],
-                y=cum[t],
+    used = _running_totals(transfers_df, teams)
+    data = [
+        dict(
+            type="scatter",
+            x=x,
+            y=used[t],
+            mode="lines",
+            name=t,
+            line=dict(color=colors.get(t, "#888"), width=2.5, shape="spline"),
+            hovertemplate=f"<b>{t}</b><br>Match %{{x}}<br>Total Transfers: %{{y:.0f}}<extra></extra>",
+        )
+        for t in teams
+    ]
+    return _figure(
+        data,
+        title="Accumulated Transfers",
+        xaxis_title="Match",
+        yaxis_title="Total Transfers",
+    )
+
+
+# ─── Transfer Pacing (Line + Projection) ────────────────────────────────────
+
+
+def fig_transfer_pacing(transfers_df, pacing_df, current_match, colors):
+    """Transfers used so far, projected on at each team's burn rate.
+
+    Solid lines are the running totals, dotted lines extend them at the current
+    burn rate to the match the budget runs out (or the end of the season), and
+    the dashed line is an even pace that uses the whole budget.
+    """
+    if transfers_df.empty or pacing_df.empty:
+        return empty_fig()
+    x = _values(transfers_df["Match"])
+    used = _running_totals(transfers_df, pacing_df["Team"])
+    data = [
+        dict(
+            type="scatter",
+            x=[0, TOTAL_MATCHES],
+            y=[0, TOTAL_TRANSFERS],
+            mode="lines",
+            name="Even pace",
+            line=dict(color="rgba(255,255,255,0.35)", width=1.5, dash="dash"),
+            hoverinfo="skip",
+        )
+    ]
+    for r in pacing_df.to_dict("records"):
+        t = r["Team"]
+        color = colors.get(t, "#888")
+        data.append(
+            dict(
+                type="scatter",
+                x=x,
+                y=used[t],
                 mode="lines",
                 name=t,
-                line=dict(color=colors.get(t, "#888"), width=2.5, shape="spline"),
-                hovertemplate=f"<b>{t}</b><br>Match %{{x}}<br>Total Transfers: %{{y:.0f}}<extra></extra>",
+                legendgroup=t,
+                line=dict(color=color, width=2.5),
+                hovertemplate=f"<b>{t}</b><br>Match %{{x}}<br>Used: %{{y:.0f}}<extra></extra>",
             )
         )
-    return _apply_theme(
-        fig,
-        title="Accumulated Transfers",
+        end = TOTAL_MATCHES if np.isnan(r["Runs Out"]) else r["Runs Out"]
+        if r["Exhausted"] or end <= current_match:
+            continue
+        projected = min(TOTAL_TRANSFERS, r["Used"] + r["Burn Rate"] * (end - current_match))
+        data.append(
+            dict(
+                type="scatter",
+                x=[current_match, end],
+                y=[r["Used"], projected],
+                mode="lines",
+                name=t,
+                legendgroup=t,
+                showlegend=False,
+                line=dict(color=color, width=1.5, dash="dot"),
+                hovertemplate=f"<b>{t}</b><br>Projected at {r['Burn Rate']:.2f}/match"
+                "<br>Match %{x:.0f}: %{y:.0f}<extra></extra>",
+            )
+        )
+    budget = dict(xref="x domain", x0=0, x1=1, yref="y", y0=TOTAL_TRANSFERS, y1=TOTAL_TRANSFERS)
+    return _figure(
+        data,
+        title="Transfer Pacing",
         xaxis_title="Match",
-        yaxis_title="Total Transfers",
+        yaxis_title="Transfers Used",
+        shapes=[
+            dict(type="line", line=dict(color="rgba(255,107,53,0.6)", width=1.5), **budget)
+        ],
+        annotations=[
+            dict(
+                text="Budget",
+                showarrow=False,
+                xref="x domain",
+                x=0,
+                xanchor="left",
+                yref="y",
+                y=TOTAL_TRANSFERS,
+                yanchor="bottom",
+            )
+        ],
     )
 
 
 # ─── Transfers Per Match (Scatter) ──────────────────────────────────────────
 
 
-def fig_transfers_per_match(transfers_df, colors):
+def fig_transfers_per_match(transfers_df, colors, webgl_threshold=WEBGL_POINT_THRESHOLD):
     """Scatter plot of transfer counts per match."""
     if transfers_df.empty:
         return empty_fig()
-    fig = go.Figure()
+    x = _values(transfers_df["Match"])
     teams = _team_cols(transfers_df)
-    for t in teams:
-        fig.add_trace(
-            go.Scatter(
-                x=transfers_df["Match"],
-                y=transfers_df[t],
-                mode="markers",
-                name=t,
-                marker=dict(color=colors.get(t, "#888"), size=8, opacity=0.8),
-                hovertemplate=f"<b>{t}</b><br>Match %{{x}}<br>Transfers: %{{y}}<extra></extra>",
-            )
+    kind = _scatter_type(transfers_df, teams, webgl_threshold)
+    data = [
+        dict(
+            type=kind,
+            x=x,
+            y=_values(transfers_df[t]),
+            mode="markers",
+            name=t,
+            marker=dict(color=colors.get(t, "#888"), size=8, opacity=0.8),
+            hovertemplate=f"<b>{t}</b><br>Match %{{x}}<br>Transfers: %{{y}}<extra></extra>",
         )
-    return _apply_theme(
-        fig,
+        for t in teams
+    ]
+    return _figure(
+        data,
         title="Transfers Per Match",
         xaxis_title="Match",
         yaxis_title="Transfers",
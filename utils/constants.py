@@ -1,4 +1,5 @@
 import os
+import tempfile
 
 # ─── App Settings ────────────────────────────────────────────────────────────
 APP_TITLE = "IPL Rasiya 2026"
@@ -9,6 +10,26 @@ TOTAL_TRANSFERS = 160
 BASE_DIR = os.path.dirname(os.path.dirname(__file__))
 DEFAULT_DB_PATH = os.path.join(BASE_DIR, "data", "fantasy.db")
 DB_PATH = os.environ.get("FANTASY_DB_PATH", DEFAULT_DB_PATH)
+DB_READER_MMAP_SIZE = 64 * 1024 * 1024  # Bytes of the DB file memory-mapped per reader
+DB_READER_CACHE_SIZE = -16_000  # Negative = KiB of page cache per reader connection
+DB_STATEMENT_CACHE_SIZE = 128  # Prepared statements kept per connection
+
+# ─── Cache ───────────────────────────────────────────────────────────────────
+# File-backed so every gunicorn worker shares one cache; keys carry data versions.
+CACHE_DIR = os.environ.get(
+    "FANTASY_CACHE_DIR", os.path.join(tempfile.gettempdir(), "ipl-fantasy-cache")
+)
+CACHE_TIMEOUT = 300  # Seconds before an entry expires
+CACHE_THRESHOLD = 2000  # Max entries on disk before the oldest are pruned
+
+# ─── Refresh ─────────────────────────────────────────────────────────────────
+# The server pushes data version changes over server-sent events
+# (/data-version/stream); the app still polls at this rate as a fallback.
+# Pages only refresh when the version moves.
+VERSION_POLL_INTERVAL = 60_000  # Milliseconds
+LIVE_CHECK_INTERVAL = 1.0  # Seconds between each worker's data version reads
+LIVE_HEARTBEAT_INTERVAL = 15  # Seconds between keep-alive lines on idle streams
+LIVE_RETRY_INTERVAL = 5_000  # Milliseconds before a dropped stream reconnects
 
 # ─── Team Color Palette (assigned in order when teams are added) ─────────────
 TEAM_COLORS = [
@@ -55,9 +76,19 @@ CHART_LAYOUT_DEFAULTS = dict(
     xaxis=dict(gridcolor=CHART_GRID_COLOR, zeroline=False),
     yaxis=dict(gridcolor=CHART_GRID_COLOR, zeroline=False),
 )
+# Line/scatter charts with more points than this draw with WebGL (scattergl)
+WEBGL_POINT_THRESHOLD = int(os.environ.get("FANTASY_WEBGL_POINT_THRESHOLD", "3000"))
 
 # ─── Awards Configuration ────────────────────────────────────────────────────
 CENTURION_THRESHOLD = 500  # Points in a single match to earn "Centurion"
 STREAK_MIN_LENGTH = 3  # Minimum matches for a hot/cold streak
 ROLLING_WINDOW = 5  # Matches for rolling average
+ROLLING_WINDOWS = (3, 5, 10, None)  # Stats page window choices; None = whole season
 POWER_RANKING_DECAY = 0.92  # Exponential decay factor (closer to 1 = slower decay)
+
+# ─── Projections (Monte Carlo) ───────────────────────────────────────────────
+PROJECTION_SIMULATIONS = 20_000  # Simulated seasons per projection
+PROJECTION_BATCH_CELLS = 4_000_000  # Sampled scores (seasons × matches × teams) per batch
+PROJECTION_SEED = 2026  # Fixed so every worker projects the same data identically
+# Processes to spread batches over; 0 or 1 runs them in the calling process.
+PROJECTION_WORKERS = int(os.environ.get("FANTASY_PROJECTION_WORKERS", "0"))
@@ -1,68 +1,251 @@
+import json
 import sqlite3
 import os
-from utils.constants import DB_PATH
+import threading
+import zlib
+from contextlib import contextmanager
+from utils.constants import (
+    DB_PATH,
+    DB_READER_MMAP_SIZE,
+    DB_READER_CACHE_SIZE,
+    DB_STATEMENT_CACHE_SIZE,
+)
 from utils.fixtures import IPL_2026_MATCHES
 
 
-def get_connection():
-    """Return a new SQLite connection with row_factory and WAL mode."""
-    os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-    conn = sqlite3.connect(DB_PATH)
+# ─── Connection Pool ─────────────────────────────────────────────────────────
+#
+# Readers are one long-lived connection per thread, tuned for queries only.
+# All writes share a single connection serialized by a lock, which matches
+# SQLite's one-writer model. Both are dropped in forked children (gunicorn
+# workers) so no connection is ever shared across processes.
+#
+# Under gevent workers (gunicorn.conf.py) threading.local is patched to be
+# per greenlet, which would open a reader for every request. Reads never
+# yield to other greenlets, so the worker's real threads keep one each.
+
+try:
+    from gevent.monkey import get_original
+
+    _thread_local = get_original("threading", "local")
+except ImportError:
+    _thread_local = threading.local
+
+_readers = _thread_local()
+_writer_lock = threading.RLock()
+_writer = None
+_writer_depth = 0
+_inherited = []
+
+
+def _open_reader():
+    conn = sqlite3.connect(DB_PATH, cached_statements=DB_STATEMENT_CACHE_SIZE)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA query_only=ON")
+    conn.execute(f"PRAGMA mmap_size={DB_READER_MMAP_SIZE}")
+    conn.execute(f"PRAGMA cache_size={DB_READER_CACHE_SIZE}")
+    return conn
+
+
+def _open_writer():
+    conn = sqlite3.connect(
+        DB_PATH,
+        cached_statements=DB_STATEMENT_CACHE_SIZE,
+        check_same_thread=False,
+    )
     conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA journal_mode=WAL")
     conn.execute("PRAGMA foreign_keys=ON")
     return conn
 
 
+@contextmanager
+def read_connection():
+    """Yield this thread's pooled read-only connection."""
+    conn = getattr(_readers, "conn", None)
+    if conn is None:
+        conn = _readers.conn = _open_reader()
+    yield conn
+
+
+@contextmanager
+def write_connection():
+    """Yield the shared writer connection inside a transaction.
+
+    Commits when the outermost block exits cleanly and rolls back on error,
+    so nested blocks join the caller's transaction.
+    """
+    global _writer, _writer_depth
+    with _writer_lock:
+        if _writer is None:
+            _writer = _open_writer()
+        _writer_depth += 1
+        try:
+            yield _writer
+        except BaseException:
+            if _writer_depth == 1:
+                _writer.rollback()
+            raise
+        else:
+            if _writer_depth == 1:
+                _writer.commit()
+        finally:
+            _writer_depth -= 1
+
+
+def _reset_after_fork():
+    """Forget connections inherited from the parent without closing them.
+
+    Closing an inherited handle can release the parent's POSIX locks, so the
+    objects are parked in ``_inherited`` instead of being garbage-collected.
+    """
+    global _readers, _writer_lock, _writer, _writer_depth
+    _inherited.append((_readers, _writer))
+    _readers = _thread_local()
+    _writer_lock = threading.RLock()
+    _writer = None
+    _writer_depth = 0
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+# ─── Schema & Migrations ─────────────────────────────────────────────────────
+#
+# PRAGMA user_version packs the schema version (high bits) with a checksum of
+# IPL_2026_MATCHES (low 20 bits). An up-to-date database boots with a single
+# pragma read; otherwise each pending migration, and a fixture re-seed when
+# the checksum moved, runs in its own IMMEDIATE transaction. Concurrent
+# workers re-check the version after taking the write lock.
+
+BASE_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS teams (
+    id          INTEGER PRIMARY KEY AUTOINCREMENT,
+    name        TEXT    NOT NULL UNIQUE,
+    color       TEXT    NOT NULL,
+    abbreviation TEXT   NOT NULL,
+    active      INTEGER NOT NULL DEFAULT 1,
+    created_at  TEXT    NOT NULL DEFAULT (datetime('now'))
+);
+
+CREATE TABLE IF NOT EXISTS matches (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    match_number INTEGER NOT NULL UNIQUE,
+    team_1       TEXT    DEFAULT '',
+    team_2       TEXT    DEFAULT '',
+    stadium      TEXT    DEFAULT '',
+    date_played  TEXT    DEFAULT ''
+);
+
+CREATE TABLE IF NOT EXISTS scores (
+    id       INTEGER PRIMARY KEY AUTOINCREMENT,
+    match_id INTEGER NOT NULL REFERENCES matches(id) ON DELETE CASCADE,
+    team_id  INTEGER NOT NULL REFERENCES teams(id)   ON DELETE CASCADE,
+    points   REAL    NOT NULL DEFAULT 0,
+    UNIQUE(match_id, team_id)
+);
+
+CREATE TABLE IF NOT EXISTS transfers (
+    id       INTEGER PRIMARY KEY AUTOINCREMENT,
+    match_id INTEGER NOT NULL REFERENCES matches(id) ON DELETE CASCADE,
+    team_id  INTEGER NOT NULL REFERENCES teams(id)   ON DELETE CASCADE,
+    count    INTEGER NOT NULL DEFAULT 0,
+    UNIQUE(match_id, team_id)
+);
+
+CREATE INDEX IF NOT EXISTS idx_scores_match   ON scores(match_id);
+CREATE INDEX IF NOT EXISTS idx_scores_team    ON scores(team_id);
+CREATE INDEX IF NOT EXISTS idx_transfers_match ON transfers(match_id);
+CREATE INDEX IF NOT EXISTS idx_transfers_team  ON transfers(team_id);
+"""
+
+_FIXTURE_BITS = 20
+FIXTURES_CHECKSUM = zlib.crc32(
+    json.dumps(IPL_2026_MATCHES, sort_keys=True).encode()
+) & ((1 << _FIXTURE_BITS) - 1)
+
+
+def _create_base_schema(conn):
+    _execute_script(conn, BASE_SCHEMA_SQL)
+    _migrate_matches_table(conn)
+
+
+def _create_data_versions(conn):
+    _execute_script(conn, DATA_VERSIONS_SQL)
+
+
+# Append-only: a migration's position is its schema version.
+MIGRATIONS = (
+    _create_base_schema,
+    _create_data_versions,
+)
+SCHEMA_VERSION = len(MIGRATIONS)
+
+
+def _pack_user_version(schema_version, fixtures_checksum):
+    return (schema_version << _FIXTURE_BITS) | fixtures_checksum
+
+
+def _unpack_user_version(user_version):
+    return user_version >> _FIXTURE_BITS, user_version & ((1 << _FIXTURE_BITS) - 1)
+
+
+def _execute_script(conn, script):
+    """Run a multi-statement script inside the caller's transaction.
+
+    Unlike executescript(), this never issues an implicit COMMIT.
+    """
+    statement = ""
+    for line in script.splitlines(keepends=True):
+        statement += line
+        if sqlite3.complete_statement(statement):
+            conn.execute(statement)
+            statement = ""
+
+
+@contextmanager
+def _immediate_transaction(conn):
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+    conn.execute("COMMIT")
+
+
 def init_db():
-    """Create all tables if they don't exist."""
-    conn = get_connection()
+    """Create or migrate the schema and seed fixtures, only when needed."""
+    target = _pack_user_version(SCHEMA_VERSION, FIXTURES_CHECKSUM)
+    os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
+    conn = sqlite3.connect(DB_PATH, isolation_level=None)
+    conn.row_factory = sqlite3.Row
     try:
-        conn.executescript(
-            """
-            CREATE TABLE IF NOT EXISTS teams (
-                id          INTEGER PRIMARY KEY AUTOINCREMENT,
-                name        TEXT    NOT NULL UNIQUE,
-                color       TEXT    NOT NULL,
-                abbreviation TEXT   NOT NULL,
-                active      INTEGER NOT NULL DEFAULT 1,
-                created_at  TEXT    NOT NULL DEFAULT (datetime('now'))
-            );
-
-            CREATE TABLE IF NOT EXISTS matches (
-                id           INTEGER PRIMARY KEY AUTOINCREMENT,
-                match_number INTEGER NOT NULL UNIQUE,
-                team_1       TEXT    DEFAULT '',
-                team_2       TEXT    DEFAULT '',
-                stadium      TEXT    DEFAULT '',
-                date_played  TEXT    DEFAULT ''
-            );
-
-            CREATE TABLE IF NOT EXISTS scores (
-                id       INTEGER PRIMARY KEY AUTOINCREMENT,
-                match_id INTEGER NOT NULL REFERENCES matches(id) ON DELETE CASCADE,
-                team_id  INTEGER NOT NULL REFERENCES teams(id)   ON DELETE CASCADE,
-                points   REAL    NOT NULL DEFAULT 0,
-                UNIQUE(match_id, team_id)
-            );
-
-            CREATE TABLE IF NOT EXISTS transfers (
-                id       INTEGER PRIMARY KEY AUTOINCREMENT,
-                match_id INTEGER NOT NULL REFERENCES matches(id) ON DELETE CASCADE,
-                team_id  INTEGER NOT NULL REFERENCES teams(id)   ON DELETE CASCADE,
-                count    INTEGER NOT NULL DEFAULT 0,
-                UNIQUE(match_id, team_id)
-            );
-
-            CREATE INDEX IF NOT EXISTS idx_scores_match   ON scores(match_id);
-            CREATE INDEX IF NOT EXISTS idx_scores_team    ON scores(team_id);
-            CREATE INDEX IF NOT EXISTS idx_transfers_match ON transfers(match_id);
-            CREATE INDEX IF NOT EXISTS idx_transfers_team  ON transfers(team_id);
-        """
-        )
-        _migrate_matches_table(conn)
-        _seed_matches_table(conn)
-        conn.commit()
+        if conn.execute("PRAGMA user_version").fetchone()[0] == target:
+            return
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA foreign_keys=ON")
+
+        for version, migration in enumerate(MIGRATIONS, start=1):
+            with _immediate_transaction(conn):
+                current, checksum = _unpack_user_version(
+                    conn.execute("PRAGMA user_version").fetchone()[0]
+                )
+                if current >= version:
+                    continue
+                migration(conn)
+                conn.execute(
+                    f"PRAGMA user_version={_pack_user_version(version, checksum)}"
+                )
+
+        with _immediate_transaction(conn):
+            current, checksum = _unpack_user_version(
+                conn.execute("PRAGMA user_version").fetchone()[0]
+            )
+            if checksum != FIXTURES_CHECKSUM:
+                _seed_matches_table(conn)
+                conn.execute(
+                    f"PRAGMA user_version={_pack_user_version(current, FIXTURES_CHECKSUM)}"
+                )
     finally:
         conn.close()
 
@@ -134,7 +317,7 @@ def _migrate_matches_table(conn):
         conn.execute("ALTER TABLE matches DROP COLUMN description")
 
 
-def _seed_matches_table(conn):
+def _seed_matches_table(conn, fixtures=IPL_2026_MATCHES):
     """Insert the IPL 2026 fixture list without overwriting existing metadata."""
     conn.executemany(
         """
@@ -145,6 +328,68 @@ def _seed_matches_table(conn):
             team_2 = CASE WHEN COALESCE(matches.team_2, '') = '' THEN excluded.team_2 ELSE matches.team_2 END,
             stadium = CASE WHEN COALESCE(matches.stadium, '') = '' THEN excluded.stadium ELSE matches.stadium END,
             date_played = CASE WHEN COALESCE(matches.date_played, '') = '' THEN excluded.date_played ELSE matches.date_played END
+        WHERE (COALESCE(matches.team_1, '') = '' AND excluded.team_1 != '')
+           OR (COALESCE(matches.team_2, '') = '' AND excluded.team_2 != '')
+           OR (COALESCE(matches.stadium, '') = '' AND excluded.stadium != '')
+           OR (COALESCE(matches.date_played, '') = '' AND excluded.date_played != '')
         """,
-        IPL_2026_MATCHES,
+        fixtures,
+    )
+
+
+def restore_fixture(conn, match_number):
+    """Re-insert the seeded fixture row of match_number, if it has one.
+
+    init_db() only re-seeds when the fixture list changes, so a match record
+    removed at runtime must get its schedule metadata back in the same write.
+    """
+    _seed_matches_table(
+        conn, [m for m in IPL_2026_MATCHES if m["match_number"] == match_number]
+    )
+
+
+# ─── Data Versions ───────────────────────────────────────────────────────────
+#
+# One monotonically increasing counter per data table, bumped by triggers in
+# the same transaction as the write. Cache keys are derived from the versions
+# a reader depends on (see utils.cache.memoize_versioned), so a write only
+# invalidates entries that read the tables it touched.
+
+DATA_TABLES = ("teams", "matches", "scores", "transfers")
+
+DATA_VERSIONS_SQL = """
+CREATE TABLE IF NOT EXISTS data_versions (
+    table_name TEXT    PRIMARY KEY,
+    version    INTEGER NOT NULL DEFAULT 0
+) WITHOUT ROWID;
+
+-- Random per-database id: cache entries never outlive a replaced or restored DB.
+INSERT OR IGNORE INTO data_versions (table_name, version) VALUES ('database', abs(random()));
+""" + "".join(
+    f"""
+INSERT OR IGNORE INTO data_versions (table_name) VALUES ('{table}');
+"""
+    + "".join(
+        f"""
+CREATE TRIGGER IF NOT EXISTS trg_{table}_version_{event.lower()} AFTER {event} ON {table}
+BEGIN
+    UPDATE data_versions SET version = version + 1 WHERE table_name = '{table}';
+END;
+"""
+        for event in ("INSERT", "UPDATE", "DELETE")
     )
+    for table in DATA_TABLES
+)
+
+
+def get_data_versions(tables=DATA_TABLES):
+    """Return {table_name: version} for the requested data tables.
+
+    The pseudo-table "database" is the random id assigned when the database
+    was created.
+    """
+    with read_connection() as conn:
+        rows = conn.execute("SELECT table_name, version FROM data_versions").fetchall()
+    versions = {r["table_name"]: r["version"] for r in rows}
+    return {t: versions.get(t, 0) for t in tables}
+
@@ -0,0 +1,412 @@
+"""Incrementally maintained per-match standings.
+
+LeaderboardState keeps, for every match prefix, each team's running total,
+its rank order, rank and previous rank, its power score and power rank, plus
+running transfer totals and transfer budget pacing. It follows the
+version-cached Seasons as they change. A Season read at the same data
+versions as the last one is taken as unchanged without looking at its
+values; otherwise a sync finds the first match row that differs and
+recomputes from there only. A new match costs one vectorized comparison of
+the matrices plus O(teams) of ranking, an edit or delete of an older match
+O(teams × later matches). Every later row is re-ranked starting from its
+stored order, so even an edit of the first match costs no more than building
+a new state.
+
+Moving to any match (the Overview slider) is then a row lookup, and a range
+of matches ranks the difference of two stored rows.
+
+The running totals use the same sequential cumsum, and the ranks the same
+stable tie-breaking, as compute_leaderboard(), so both give identical results.
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+
+from utils.calculations import (
+    LEADERBOARD_COLUMNS,
+    POWER_RANKING_COLUMNS,
+    TRANSFER_PACING_COLUMNS,
+    pacing_frame,
+    power_scores,
+    rank_power,
+    transfer_pacing,
+    update_power_sums,
+)
+from utils.constants import TOTAL_MATCHES
+from utils.season import Season, first_changed_row
+
+
+def _grow(buffer, rows, columns, keep):
+    """buffer with room for rows × columns, keeping its first keep rows."""
+    if buffer.shape[1] != columns:
+        return np.zeros((max(len(buffer), rows), columns), dtype=buffer.dtype)
+    if len(buffer) < rows:
+        grown = np.zeros((max(2 * len(buffer), rows), columns), dtype=buffer.dtype)
+        grown[:keep] = buffer[:keep]
+        return grown
+    return buffer
+
+
+def _rank_order(values, hint=None, tiebreak=None):
+    """Row-wise order of values, highest first, ties by ascending tiebreak.
+
+    tiebreak holds a key per team and row (default: the team's column, as in
+    np.argsort(-values, kind="stable")). hint holds an earlier order for each
+    row, such as the stored rows before an edit: laid out in that order the
+    values are nearly sorted when few teams moved, which the stable sort
+    handles in close to linear time. Runs of equal values are then put in
+    tiebreak order with a second, equally near-sorted pass.
+    """
+    if hint is None or (len(values) < 2 and tiebreak is None):
+        return np.argsort(-values, axis=1, kind="stable").astype(np.int32)
+    presorted = np.take_along_axis(-values, hint, axis=1)
+    moved = np.argsort(presorted, axis=1, kind="stable")
+    order = np.take_along_axis(hint, moved, axis=1).astype(np.int32)
+    ordered = np.take_along_axis(presorted, moved, axis=1)
+    tied = ordered[:, 1:] == ordered[:, :-1]
+    rows = np.flatnonzero(tied.any(axis=1))
+    if len(rows):
+        n_teams = values.shape[1]
+        starts = np.concatenate(
+            [np.ones((len(rows), 1), dtype=bool), ~tied[rows]], axis=1
+        )
+        run = np.maximum.accumulate(np.where(starts, np.arange(n_teams), 0), axis=1)
+        keys = order[rows] if tiebreak is None else np.take_along_axis(
+            tiebreak[rows], order[rows], axis=1
+        )
+        by_run = np.argsort(run.astype(np.int64) * n_teams + keys, axis=1, kind="stable")
+        order[rows] = np.take_along_axis(order[rows], by_run, axis=1)
+    return order
+
+
+def _standings_frame(teams, totals, order, rank, prev_rank):
+    """compute_leaderboard()-shaped DataFrame of one standings row."""
+    totals = totals[order]
+    prev_rank = prev_rank[order].astype(np.int64)
+    return pd.DataFrame(
+        {
+            "Rank": np.arange(1, len(order) + 1),
+            "Team": [teams[i] for i in order],
+            "Total Points": totals,
+            "Prev Rank": prev_rank,
+            "Rank Change": prev_rank - rank[order],
+            "Gap to Leader": totals[0] - totals,
+        }
+    )
+
+
+def _hint_rows(start, n, stored):
+    """Rows of the stored orders to start rows start..n-1 from (None without any).
+
+    Rows past the stored ones start from the last stored row.
+    """
+    if not stored:
+        return None
+    return np.minimum(np.arange(start, n), stored - 1)
+
+
+class _RunningTotals:
+    """Per-match running totals of one Season, recomputed from the first change."""
+
+    def __init__(self, capacity):
+        self.season = Season.empty()
+        self.cum = np.zeros((capacity, 0))  # first len(season.matches) rows valid
+
+    def sync(self, season):
+        """Follow season; return the first recomputed row (None when unchanged).
+
+        A Season with the same version as the last one (or the same object)
+        is unchanged without comparing any values.
+        """
+        if season is self.season or (
+            season.version is not None and season.version == self.season.version
+        ):
+            return None
+        start = first_changed_row(self.season, season)
+        n, n_teams = season.values.shape
+        if start is not None and n:
+            if self.cum.shape[1] != n_teams:
+                start = 0
+            self.cum = _grow(self.cum, n, n_teams, start)
+            if start == 0:
+                np.cumsum(season.values, axis=0, dtype=np.float64, out=self.cum[:n])
+            else:
+                # Seed with the last unchanged row so additions run in the same
+                # order as a full cumsum.
+                suffix = np.vstack([self.cum[start - 1], season.values[start:]])
+                self.cum[start:n] = np.cumsum(suffix, axis=0)[1:]
+        self.season = season
+        return start
+
+    def row(self, match_number):
+        """Index of the last match row <= match_number (-1 before the first)."""
+        return int(np.searchsorted(self.season.matches, match_number, side="right")) - 1
+
+    def totals(self, row):
+        if row < 0:
+            return np.zeros(len(self.season.teams))
+        return self.cum[row]
+
+
+class LeaderboardState:
+    def __init__(self, capacity=TOTAL_MATCHES):
+        self._lock = threading.RLock()
+        self._points = _RunningTotals(capacity)
+        self._transfers = _RunningTotals(capacity)
+        self._order = np.zeros((capacity, 0), dtype=np.int32)  # teams by rank
+        self._rank = np.zeros((capacity, 0), dtype=np.int32)
+        self._prev_rank = np.zeros((capacity, 0), dtype=np.int32)
+        self._power_sums = np.zeros((capacity, 0))  # decayed running sums
+        self._power = np.zeros((capacity, 0))  # power score after each match
+        self._power_rank = np.zeros((capacity, 0), dtype=np.int32)
+        self._ranked = 0  # valid rows in the rank and power arrays
+        # Transfer budget pacing after each transfer row (see transfer_pacing())
+        self._pacing = {
+            name: np.zeros((capacity, 0))
+            for name in ("remaining", "burn_rate", "sustainable", "exhausted_at", "runs_out")
+        }
+        self.recomputed_rows = 0  # score rows recomputed by the last sync
+
+    def sync(self, season, transfers=None):
+        """Bring the state in line with the Seasons, recomputing only what changed."""
+        with self._lock:
+            start = self._points.sync(season)
+            n = len(season.matches)
+            if start is not None and n:
+                self._rank_from(start, n)
+                self._power_from(start, n)
+            self.recomputed_rows = n - start if start is not None else 0
+            if transfers is not None:
+                transfer_start = self._transfers.sync(transfers)
+                n_transfers = len(transfers.matches)
+                if transfer_start is not None and n_transfers:
+                    self._pacing_from(transfer_start, n_transfers)
+
+    def read_synced(self, season, transfers, read):
+        """read(self) after syncing to the Seasons, under one hold of the lock.
+
+        A separate sync() and read would let another thread sync a different
+        data version in between; callers that need a result for particular
+        Seasons use this.
+        """
+        with self._lock:
+            self.sync(season, transfers)
+            return read(self)
+
+    def _rank_from(self, start, n):
+        """Recompute the rank rows start..n-1 from the running totals.
+
+        Each row is re-sorted starting from its stored order, so an edit that
+        moves a few teams costs close to O(teams) per later row.
+        """
+        n_teams = len(self._points.season.teams)
+        # Rows before start survive any reallocation; rank arrays track cum's size.
+        keep = start if self._order.shape[1] == n_teams else 0
+        start = keep
+        hint = None
+        if self._order.shape[1] == n_teams:
+            rows = _hint_rows(start, n, self._ranked)
+            hint = None if rows is None else self._order[rows]
+        self._order = _grow(self._order, n, n_teams, keep)
+        self._rank = _grow(self._rank, n, n_teams, keep)
+        self._prev_rank = _grow(self._prev_rank, n, n_teams, keep)
+
+        cum = self._points.cum[start:n]
+        rows = np.arange(n - start)[:, None]
+        places = np.arange(1, n_teams + 1, dtype=np.int32)
+        order = _rank_order(cum, hint)
+        rank = np.empty_like(order)
+        rank[rows, order] = places
+        self._order[start:n] = order
+        self._rank[start:n] = rank
+
+        # Previous rank: ties on the previous total keep the current rank
+        # order. Each previous row's order is the starting point.
+        prev_rank = np.empty_like(order)
+        if start == 0:
+            prev_rank[0] = rank[0]
+        first = 1 if start == 0 else 0
+        if first < len(order):
+            before = slice(start + first - 1, n - 1)
+            prev_order = _rank_order(
+                self._points.cum[before], self._order[before], rank[first:]
+            )
+            prev_rank[rows[first:], prev_order] = places
+        self._prev_rank[start:n] = prev_rank
+
+    def _power_from(self, start, n):
+        """Recompute power rows start..n-1 with the recursive decayed sums."""
+        values = self._points.season.values
+        n_teams = values.shape[1]
+        keep = start if self._power.shape[1] == n_teams else 0
+        hint = None
+        rows = _hint_rows(keep, n, self._ranked if self._power_rank.shape[1] == n_teams else 0)
+        if rows is not None:
+            # Stored power order of each hint row, from its ranks.
+            hint = np.empty((len(rows), n_teams), dtype=np.int32)
+            np.put_along_axis(
+                hint, self._power_rank[rows] - 1, np.arange(n_teams, dtype=np.int32), axis=1
+            )
+        self._power_sums = _grow(self._power_sums, n, n_teams, keep)
+        self._power = _grow(self._power, n, n_teams, keep)
+        self._power_rank = _grow(self._power_rank, n, n_teams, keep)
+        update_power_sums(values[:n], self._power_sums, keep)
+        self._power[keep:n] = power_scores(self._power_sums[keep:n], keep)
+        order = _rank_order(self._power[keep:n], hint)
+        ranks = np.empty_like(order)
+        np.put_along_axis(ranks, order, np.arange(1, n_teams + 1, dtype=np.int32), axis=1)
+        self._power_rank[keep:n] = ranks
+        self._ranked = n
+
+    def _pacing_from(self, start, n):
+        """Recompute transfer pacing rows start..n-1, seeded with row start-1."""
+        transfers = self._transfers
+        n_teams = len(transfers.season.teams)
+        keep = start if self._pacing["runs_out"].shape[1] == n_teams else 0
+        for name, buffer in self._pacing.items():
+            self._pacing[name] = _grow(buffer, n, n_teams, keep)
+        before = self._pacing["exhausted_at"][keep - 1] if keep else None
+        pacing = transfer_pacing(
+            transfers.cum[keep:n], transfers.season.matches[keep:n], before
+        )
+        for name, values in pacing.items():
+            self._pacing[name][keep:n] = values
+
+    # ─── Reads ──────────────────────────────────────────────────────────
+
+    def running_totals(self):
+        """(matches, teams, totals); totals[i] holds each total after matches[i]."""
+        with self._lock:
+            points = self._points
+            n = len(points.season.matches)
+            return points.season.matches, points.season.teams, points.cum[:n].copy()
+
+    def leaderboard(self, upto_match=None):
+        """compute_leaderboard() for matches <= upto_match (all when None).
+
+        A lookup of the precomputed row for that match: no sums and no sorting.
+        """
+        with self._lock:
+            points = self._points
+            row = len(points.season.matches) - 1
+            if upto_match is not None:
+                row = points.row(upto_match)
+            if row < 0:
+                return pd.DataFrame(columns=LEADERBOARD_COLUMNS)
+            return _standings_frame(
+                points.season.teams,
+                points.cum[row],
+                self._order[row],
+                self._rank[row],
+                self._prev_rank[row],
+            )
+
+    def standings_history(self):
+        """Every stored standings row: dict of matches, teams and (rows, teams)
+        totals, order (teams by rank), rank and prev_rank."""
+        with self._lock:
+            points = self._points
+            n = len(points.season.matches)
+            return {
+                "matches": points.season.matches,
+                "teams": points.season.teams,
+                "totals": points.cum[:n].copy(),
+                "order": self._order[:n].copy(),
+                "rank": self._rank[:n].copy(),
+                "prev_rank": self._prev_rank[:n].copy(),
+            }
+
+    def transfer_history(self):
+        """(matches, teams, totals): running transfer totals after each transfer row."""
+        with self._lock:
+            transfers = self._transfers
+            n = len(transfers.season.matches)
+            return transfers.season.matches, transfers.season.teams, transfers.cum[:n].copy()
+
+    def power_history(self):
+        """(matches, teams, power, power_rank): one row per match."""
+        with self._lock:
+            season = self._points.season
+            n = len(season.matches)
+            return (
+                season.matches,
+                season.teams,
+                self._power[:n].copy(),
+                self._power_rank[:n].copy(),
+            )
+
+    def power_rankings(self):
+        """compute_power_rankings() for the latest match, from the stored row."""
+        with self._lock:
+            season = self._points.season
+            n = len(season.matches)
+            if n == 0:
+                return pd.DataFrame(columns=POWER_RANKING_COLUMNS)
+            return rank_power(season.teams, self._power[n - 1], self.leaderboard())
+
+    def leaderboard_between(self, first_match, last_match):
+        """Leaderboard over matches first_match..last_match (inclusive).
+
+        Totals are the difference of two stored running-total rows, ranked
+        here (O(teams log teams)); Prev Total leaves out the last match in
+        the range, as compute_leaderboard() does.
+        """
+        with self._lock:
+            points = self._points
+            base = points.totals(points.row(first_match - 1))
+            last = points.row(last_match)
+            if last < 0 or points.season.matches[last] < first_match:
+                return pd.DataFrame(columns=LEADERBOARD_COLUMNS)
+            totals = points.cum[last] - base
+            order = _rank_order(totals[None])
+            rank = np.empty_like(order)
+            places = np.arange(1, order.shape[1] + 1, dtype=np.int32)
+            rank[0, order[0]] = places
+            prev_rank = rank
+            if last > 0 and points.season.matches[last - 1] >= first_match:
+                # Ties on the previous total keep the current rank order.
+                prev_order = _rank_order((points.cum[last - 1] - base)[None], order, rank)
+                prev_rank = np.empty_like(rank)
+                prev_rank[0, prev_order[0]] = places
+            return _standings_frame(
+                points.season.teams, totals, order[0], rank[0], prev_rank[0]
+            )
+
+    def current_match(self):
+        """Latest match with scores or transfers entered (0 before any)."""
+        with self._lock:
+            last = [
+                int(season.matches[-1])
+                for season in (self._points.season, self._transfers.season)
+                if len(season.matches)
+            ]
+            return max(last, default=0)
+
+    def transfer_pacing(self, current_match=None):
+        """compute_transfer_pacing() after current_match (the latest when None).
+
+        The stored row when transfers were entered for that match, otherwise
+        one O(teams) row from the running totals.
+        """
+        with self._lock:
+            transfers = self._transfers
+            teams = transfers.season.teams
+            current = current_match or self.current_match()
+            if not teams or not current:
+                return pd.DataFrame(columns=TRANSFER_PACING_COLUMNS)
+            row = transfers.row(current)
+            used = transfers.totals(row).copy()
+            if row >= 0 and transfers.season.matches[row] == current:
+                pacing = {name: buffer[row] for name, buffer in self._pacing.items()}
+            else:
+                before = self._pacing["exhausted_at"][row] if row >= 0 else None
+                pacing = transfer_pacing(used[None], [current], before)
+                pacing = {name: values[0] for name, values in pacing.items()}
+            return pacing_frame(teams, used, pacing)
+
+
+# Shared by all callbacks in this process; each worker keeps its own copy and
+# syncs it from the version-cached Seasons.
+LEADERBOARD = LeaderboardState()
@@ -0,0 +1,106 @@
+"""Server-sent events channel for data version changes.
+
+Every open /data-version/stream connection waits on one Condition per
+worker process. A watcher thread reads the data version every
+LIVE_CHECK_INTERVAL seconds and wakes the streams when it moves, so a write
+made through any worker reaches every connection. The watcher runs only while
+its worker has streams open: the first stream starts it and it stops at the
+first check after the last one closed. The admin callbacks also call
+publish_data_version() right after a save or delete commits, which wakes the
+streams of the worker that made the write without waiting for the next check.
+
+Idle streams cost no queries: each worker does one small read per check,
+however many connections it holds, and none without connections. Under
+gevent workers (gunicorn.conf.py) the watcher and the waiting streams are
+greenlets, so one worker holds hundreds of them.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+
+from utils.constants import (
+    LIVE_CHECK_INTERVAL,
+    LIVE_HEARTBEAT_INTERVAL,
+    LIVE_RETRY_INTERVAL,
+)
+from utils.metrics import get_version_key
+
+_changed = threading.Condition()
+_version = None
+_streams = 0  # open streams in this process
+_watcher_pid = None  # process whose watcher is running (None when stopped)
+
+
+def publish_data_version():
+    """Read the data version and wake this worker's streams if it moved."""
+    global _version
+    version = get_version_key()
+    with _changed:
+        if version != _version:
+            _version = version
+            _changed.notify_all()
+    return version
+
+
+def _watch():
+    global _watcher_pid
+    while True:
+        try:
+            publish_data_version()
+        except sqlite3.Error:
+            pass  # Checked again next time; clients keep polling meanwhile.
+        time.sleep(LIVE_CHECK_INTERVAL)
+        with _changed:
+            if not _streams:
+                _watcher_pid = None
+                return
+
+
+def _subscribe():
+    """Count an opened stream, starting the watcher if this process has none.
+
+    A forked worker inherits its parent's state but not its threads, so a
+    watcher counts only in the process that started it.
+    """
+    global _streams, _version, _watcher_pid
+    with _changed:
+        if _watcher_pid != os.getpid():
+            _streams = 0
+            _version = None  # possibly stale; the watcher reads it first
+            _watcher_pid = os.getpid()
+            threading.Thread(target=_watch, name="data-version-watcher", daemon=True).start()
+        _streams += 1
+
+
+def _unsubscribe():
+    global _streams
+    with _changed:
+        _streams -= 1
+
+
+def data_version_events():
+    """Yield the stream's events: the current version, then each new one.
+
+    Idle streams repeat the current version every LIVE_HEARTBEAT_INTERVAL
+    seconds, which keeps proxies from closing them, tells the client the
+    stream is still up and lets the server notice clients that went away.
+    """
+    _subscribe()
+    try:
+        yield f"retry: {LIVE_RETRY_INTERVAL}\n\n"
+        sent = None
+        while True:
+            with _changed:
+                _changed.wait_for(
+                    lambda: _version is not None and _version != sent,
+                    timeout=LIVE_HEARTBEAT_INTERVAL,
+                )
+                version = _version
+            if version is not None:
+                sent = version
+                yield f"event: version\ndata: {version}\n\n"
+    finally:
+        # The server closes the generator when the client goes away.
+        _unsubscribe()
@@ -0,0 +1,234 @@
+"""Lazily computed season metrics shared by every page.
+
+Each metric is a function of other metrics, its inputs, registered with
+@metric. A MetricSnapshot belongs to one set of data versions. It computes a
+metric the first time a callback asks for it and keeps the result, so pages
+with overlapping stats share the work and a callback pays only for what it
+reads. A write moves the data versions, and the next get_metrics() call
+starts a fresh snapshot.
+
+Values are shared between callbacks, so treat them as read-only.
+"""
+
+import threading
+
+from utils.db import get_data_versions
+from utils.models import get_season, get_transfers_season
+from utils.leaderboard import LEADERBOARD, LeaderboardState
+from utils.calculations import (
+    compute_awards,
+    compute_consistency,
+    compute_cumulative_points,
+    compute_form_guide,
+    compute_head_to_head_matrix,
+    compute_rank_trajectory,
+    compute_rolling_average,
+    compute_rolling_stats,
+    compute_streak_history,
+    compute_transfer_efficiency,
+)
+
+METRIC_TABLES = ("database", "teams", "matches", "scores", "transfers")
+
+_REGISTRY = {}  # name -> (function, input metric names)
+
+
+def metric(*inputs):
+    """Register a function as the metric of that name, computed from inputs.
+
+    Inputs must already be registered, which keeps the graph acyclic.
+    """
+
+    def register(fn):
+        missing = [name for name in inputs if name not in _REGISTRY]
+        if missing:
+            raise ValueError(f"Metric {fn.__name__!r} needs unknown metrics {missing}")
+        _REGISTRY[fn.__name__] = (fn, inputs)
+        return fn
+
+    return register
+
+
+class MetricSnapshot:
+    """Metric values for one set of data versions, each computed at most once."""
+
+    def __init__(self, versions):
+        self.versions = versions
+        self._values = {}
+        self._lock = threading.Lock()
+        self._metric_locks = {}
+
+    def __getitem__(self, name):
+        if name in self._values:
+            return self._values[name]
+        fn, inputs = _REGISTRY[name]
+        with self._lock:
+            lock = self._metric_locks.setdefault(name, threading.Lock())
+        # Inputs are registered before the metrics that use them, so threads
+        # always take metric locks in the same order and cannot deadlock.
+        with lock:
+            if name not in self._values:
+                self._values[name] = fn(*(self[i] for i in inputs))
+        return self._values[name]
+
+    def get(self, *names):
+        """Tuple of the named metric values."""
+        return tuple(self[name] for name in names)
+
+    @property
+    def version_key(self):
+        """The data versions as one string, for clients to send back."""
+        return _version_key(self.versions)
+
+    @property
+    def computed(self):
+        """Names of the metrics computed so far."""
+        return tuple(self._values)
+
+
+def _version_key(versions):
+    return ",".join(f"{t}={v}" for t, v in versions.items())
+
+
+def get_version_key():
+    """version_key of the current data, read without building a snapshot."""
+    return _version_key(get_data_versions(METRIC_TABLES))
+
+
+_current = MetricSnapshot(None)
+_current_lock = threading.Lock()
+
+
+def get_metrics():
+    """The MetricSnapshot for the current data versions.
+
+    Read every metric a callback needs from one snapshot so they all describe
+    the same data.
+    """
+    global _current
+    versions = get_data_versions(METRIC_TABLES)
+    with _current_lock:
+        if _current.versions != versions:
+            _current = MetricSnapshot(versions)
+        return _current
+
+
+# ─── Sources ────────────────────────────────────────────────────────────────
+
+
+@metric()
+def season():
+    return get_season()
+
+
+@metric()
+def transfers():
+    return get_transfers_season()
+
+
+@metric("season")
+def scores_frame(season):
+    return season.to_frame()
+
+
+@metric("transfers")
+def transfers_frame(transfers):
+    return transfers.to_frame()
+
+
+# ─── Standings (incremental LeaderboardState) ───────────────────────────────
+#
+# Each read syncs the shared LEADERBOARD to this snapshot's Seasons and reads
+# it under one lock hold, so a concurrent sync to another data version can
+# never slip in between.
+
+
+@metric("season", "transfers")
+def leaderboard(season, transfers):
+    return LEADERBOARD.read_synced(season, transfers, LeaderboardState.leaderboard)
+
+
+@metric("season", "transfers")
+def power_rankings(season, transfers):
+    return LEADERBOARD.read_synced(season, transfers, LeaderboardState.power_rankings)
+
+
+@metric("season", "transfers")
+def power_history(season, transfers):
+    """(power_df, power_rank_df): Match | Team1 | Team2 … after each match."""
+    _, _, power, ranks = LEADERBOARD.read_synced(
+        season, transfers, LeaderboardState.power_history
+    )
+    return season.to_frame(power), season.to_frame(ranks)
+
+
+@metric("season", "transfers")
+def standings_history(season, transfers):
+    return LEADERBOARD.read_synced(
+        season, transfers, LeaderboardState.standings_history
+    )
+
+
+@metric("season", "transfers")
+def transfer_history(season, transfers):
+    return LEADERBOARD.read_synced(
+        season, transfers, LeaderboardState.transfer_history
+    )
+
+
+@metric("season", "transfers")
+def transfer_pacing(season, transfers):
+    return LEADERBOARD.read_synced(season, transfers, LeaderboardState.transfer_pacing)
+
+
+# ─── Season stats ───────────────────────────────────────────────────────────
+
+
+@metric("season")
+def cumulative_points(season):
+    return compute_cumulative_points(season)
+
+
+@metric("season")
+def rank_trajectory(season):
+    return compute_rank_trajectory(season)
+
+
+@metric("season")
+def consistency(season):
+    return compute_consistency(season)
+
+
+@metric("season")
+def rolling_average(season):
+    return compute_rolling_average(season)
+
+
+@metric("season")
+def head_to_head_matrix(season):
+    return compute_head_to_head_matrix(season)
+
+
+@metric("season")
+def rolling_stats(season):
+    return compute_rolling_stats(season)
+
+
+@metric("season")
+def form_guide(season):
+    return compute_form_guide(season)
+
+
+@metric("season")
+def streak_history(season):
+    return compute_streak_history(season)
+
+
+@metric("season", "transfers")
+def transfer_efficiency(season, transfers):
+    return compute_transfer_efficiency(season, transfers)
+
+
+@metric("season", "transfers")
+def awards(season, transfers):
+    return compute_awards(season, transfers)
@@ -1,16 +1,15 @@
-import pandas as pd
-from utils.db import get_connection
-from utils.cache import cache
+from utils.db import read_connection, write_connection, restore_fixture
+from utils.cache import memoize_versioned
+from utils.season import Season
+from utils.projections import simulate_season
 
 
 # ─── Teams ───────────────────────────────────────────────────────────────────
 
 
-@cache.memoize()
 def get_all_teams(active_only=True):
     """Return list of team dicts. If active_only, filter to active=1."""
-    conn = get_connection()
-    try:
+    with read_connection() as conn:
         if active_only:
             rows = conn.execute(
                 "SELECT id, name, color, abbreviation, active FROM teams WHERE active=1 ORDER BY name"
@@ -20,11 +19,8 @@ def get_all_teams(active_only=True):
                 "SELECT id, name, color, abbreviation, active FROM teams ORDER BY name"
             ).fetchall()
         return [dict(r) for r in rows]
-    finally:
-        conn.close()
 
 
-@cache.memoize()
 def get_team_color_map():
     """Return {team_name: color_hex} for active teams."""
     teams = get_all_teams()
@@ -33,22 +29,17 @@ def get_team_color_map():
 
 def add_team(name, color, abbreviation):
     """Insert a new team. Returns the new team id."""
-    conn = get_connection()
-    try:
+    with write_connection() as conn:
         cur = conn.execute(
             "INSERT INTO teams (name, color, abbreviation) VALUES (?, ?, ?)",
             (name.strip(), color, abbreviation.strip().upper()),
         )
-        conn.commit()
         return cur.lastrowid
-    finally:
-        conn.close()
 
 
 def update_team(team_id, name=None, color=None, abbreviation=None):
     """Update team fields (only non-None values)."""
-    conn = get_connection()
-    try:
+    with write_connection() as conn:
         parts, vals = [], []
         if name is not None:
             parts.append("name=?")
@@ -63,58 +54,42 @@ def update_team(team_id, name=None, color=None, abbreviation=None):
             return
         vals.append(team_id)
         conn.execute(f"UPDATE teams SET {', '.join(parts)} WHERE id=?", vals)
-        conn.commit()
-    finally:
-        conn.close()
 
 
 def deactivate_team(team_id):
     """Soft-delete: set active=0."""
-    conn = get_connection()
-    try:
+    with write_connection() as conn:
         conn.execute("UPDATE teams SET active=0 WHERE id=?", (team_id,))
-        conn.commit()
-    finally:
-        conn.close()
 
 
 def reactivate_team(team_id):
     """Re-enable a deactivated team."""
-    conn = get_connection()
-    try:
+    with write_connection() as conn:
         conn.execute("UPDATE teams SET active=1 WHERE id=?", (team_id,))
-        conn.commit()
-    finally:
-        conn.close()
 
 
 # ─── Matches ─────────────────────────────────────────────────────────────────
 
 
-@cache.memoize()
 def get_all_matches():
     """Return list of match dicts ordered by match_number."""
-    conn = get_connection()
-    try:
+    with read_connection() as conn:
         rows = conn.execute(
             "SELECT id, match_number, team_1, team_2, stadium, date_played FROM matches ORDER BY match_number"
         ).fetchall()
         return [dict(r) for r in rows]
-    finally:
-        conn.close()
 
 
 def get_or_create_match(
     match_number, team_1=None, team_2=None, stadium=None, date_played=None
 ):
     """Get existing match id or create one, updating metadata when provided."""
-    conn = get_connection()
-    try:
+    with write_connection() as conn:
         row = conn.execute(
             "SELECT id FROM matches WHERE match_number=?", (match_number,)
         ).fetchone()
         if row:
-            updates = []
+            columns = []
             values = []
             for column_name, column_value in (
                 ("team_1", team_1),
@@ -123,15 +98,16 @@ def get_or_create_match(
                 ("date_played", date_played),
             ):
                 if column_value is not None:
-                    updates.append(f"{column_name}=?")
+                    columns.append(column_name)
                     values.append(column_value)
-            if updates:
-                values.append(match_number)
+            if columns:
+                # Skip no-op updates so re-saving a match keeps its data version.
+                assignments = ", ".join(f"{c}=?" for c in columns)
+                changed = " OR ".join(f"{c} IS NOT ?" for c in columns)
                 conn.execute(
-                    f"UPDATE matches SET {', '.join(updates)} WHERE match_number=?",
-                    values,
+                    f"UPDATE matches SET {assignments} WHERE match_number=? AND ({changed})",
+                    [*values, match_number, *values],
                 )
-                conn.commit()
             return row["id"]
         cur = conn.execute(
             "INSERT INTO matches (match_number, team_1, team_2, stadium, date_played) VALUES (?, ?, ?, ?, ?)",
@@ -143,17 +119,12 @@ def get_or_create_match(
                 date_played or "",
             ),
         )
-        conn.commit()
         return cur.lastrowid
-    finally:
-        conn.close()
 
 
-@cache.memoize()
 def get_match_details(match_number):
     """Return match metadata for editing."""
-    conn = get_connection()
-    try:
+    with read_connection() as conn:
         row = conn.execute(
             "SELECT team_1, team_2, stadium, date_played FROM matches WHERE match_number=?",
             (match_number,),
@@ -161,15 +132,11 @@ def get_match_details(match_number):
         if not row:
             return {"team_1": "", "team_2": "", "stadium": "", "date_played": ""}
         return dict(row)
-    finally:
-        conn.close()
 
 
-@cache.memoize()
 def get_max_match_number():
     """Return the highest match_number that has scores entered, or 0 if none."""
-    conn = get_connection()
-    try:
+    with read_connection() as conn:
         row = conn.execute(
             """
             SELECT MAX(m.match_number) as mx
@@ -178,46 +145,92 @@ def get_max_match_number():
             """
         ).fetchone()
         return row["mx"] or 0
-    finally:
-        conn.close()
 
 
-# ─── Scores ──────────────────────────────────────────────────────────────────
+# ─── Scores & Transfers ──────────────────────────────────────────────────────
 
 
-def upsert_scores(
+def _active_team_ids(conn, team_names):
+    """Return {team_name: id} for the given names, in a single query."""
+    team_names = list(team_names)
+    if not team_names:
+        return {}
+    placeholders = ", ".join("?" * len(team_names))
+    rows = conn.execute(
+        f"SELECT id, name FROM teams WHERE active=1 AND name IN ({placeholders})",
+        team_names,
+    ).fetchall()
+    return {r["name"]: r["id"] for r in rows}
+
+
+def save_match_results(
     match_number,
-    scores_dict,
+    scores_dict=None,
+    transfers_dict=None,
     team_1=None,
     team_2=None,
     stadium=None,
     date_played=None,
 ):
-    """Insert or update scores for a match.
+    """Write match metadata, scores and transfers in one transaction.
 
     scores_dict: {team_name: points_value, ...}
+    transfers_dict: {team_name: count, ...}
+    Names that are unknown or inactive are skipped.
     """
-    match_id = get_or_create_match(match_number, team_1, team_2, stadium, date_played)
-    conn = get_connection()
-    try:
-        for team_name, points in scores_dict.items():
-            team_row = conn.execute(
-                "SELECT id FROM teams WHERE name=? AND active=1", (team_name,)
-            ).fetchone()
-            if not team_row:
-                continue
-            conn.execute(
+    scores_dict = scores_dict or {}
+    transfers_dict = transfers_dict or {}
+    with write_connection() as conn:
+        match_id = get_or_create_match(
+            match_number, team_1, team_2, stadium, date_played
+        )
+        team_ids = _active_team_ids(conn, {*scores_dict, *transfers_dict})
+        if scores_dict:
+            conn.executemany(
                 """INSERT INTO scores (match_id, team_id, points)
                    VALUES (?, ?, ?)
-                   ON CONFLICT(match_id, team_id) DO UPDATE SET points=excluded.points""",
-                (match_id, team_row["id"], float(points)),
+                   ON CONFLICT(match_id, team_id) DO UPDATE SET points=excluded.points
+                   WHERE points IS NOT excluded.points""",
+                [
+                    (match_id, team_ids[name], float(points))
+                    for name, points in scores_dict.items()
+                    if name in team_ids
+                ],
             )
-        conn.commit()
-    finally:
-        conn.close()
+        if transfers_dict:
+            conn.executemany(
+                """INSERT INTO transfers (match_id, team_id, count)
+                   VALUES (?, ?, ?)
+                   ON CONFLICT(match_id, team_id) DO UPDATE SET count=excluded.count
+                   WHERE count IS NOT excluded.count""",
+                [
+                    (match_id, team_ids[name], int(count))
+                    for name, count in transfers_dict.items()
+                    if name in team_ids
+                ],
+            )
+
 
+def upsert_scores(
+    match_number,
+    scores_dict,
+    team_1=None,
+    team_2=None,
+    stadium=None,
+    date_played=None,
+):
+    """Insert or update scores for a match.
 
-# ─── Transfers ───────────────────────────────────────────────────────────────
+    scores_dict: {team_name: points_value, ...}
+    """
+    save_match_results(
+        match_number,
+        scores_dict=scores_dict,
+        team_1=team_1,
+        team_2=team_2,
+        stadium=stadium,
+        date_played=date_played,
+    )
 
 
 def upsert_transfers(match_number, transfers_dict):
@@ -225,82 +238,74 @@ def upsert_transfers(match_number, transfers_dict):
 
     transfers_dict: {team_name: count, ...}
     """
-    match_id = get_or_create_match(match_number)
-    conn = get_connection()
-    try:
-        for team_name, count in transfers_dict.items():
-            team_row = conn.execute(
-                "SELECT id FROM teams WHERE name=? AND active=1", (team_name,)
-            ).fetchone()
-            if not team_row:
-                continue
-            conn.execute(
-                """INSERT INTO transfers (match_id, team_id, count)
-                   VALUES (?, ?, ?)
-                   ON CONFLICT(match_id, team_id) DO UPDATE SET count=excluded.count""",
-                (match_id, team_row["id"], int(count)),
-            )
-        conn.commit()
-    finally:
-        conn.close()
+    save_match_results(match_number, transfers_dict=transfers_dict)
 
 
 # ─── DataFrames (pivoted for charts) ────────────────────────────────────────
 
 
-@cache.memoize()
-def get_scores_dataframe():
-    """Return DataFrame with columns: Match, Team1, Team2, ...
-    Rows = match_numbers, values = points. Sorted by Match.
+def _load_season(table, column):
+    """Season of one per-match column of scores or transfers.
+
+    The rows and the data versions they depend on are read in one read
+    transaction and kept as Season.version, so a LeaderboardState can tell
+    an unchanged Season from its version alone.
     """
-    conn = get_connection()
-    try:
-        df = pd.read_sql_query(
-            """SELECT m.match_number AS Match, t.name AS team, s.points
-               FROM scores s
-               JOIN matches m ON s.match_id = m.id
-               JOIN teams t   ON s.team_id  = t.id
-               WHERE t.active = 1
-               ORDER BY m.match_number""",
-            conn,
-        )
-    finally:
-        conn.close()
-    if df.empty:
-        return pd.DataFrame(columns=["Match"])
-    return df.pivot(index="Match", columns="team", values="points").reset_index()
+    with read_connection() as conn:
+        cur = conn.cursor()
+        cur.row_factory = None
+        cur.execute("BEGIN")
+        try:
+            version = tuple(
+                cur.execute(
+                    """SELECT table_name, version FROM data_versions
+                       WHERE table_name IN ('database', 'teams', 'matches', ?)
+                       ORDER BY table_name""",
+                    (table,),
+                )
+            )
+            names = dict(cur.execute("SELECT id, name FROM teams WHERE active = 1"))
+            rows = cur.execute(
+                f"""SELECT m.match_number, r.team_id, r.{column}
+                    FROM {table} r JOIN matches m ON m.id = r.match_id"""
+            ).fetchall()
+        finally:
+            conn.commit()
+    return Season.from_rows(rows, names, version)
 
 
-@cache.memoize()
-def get_transfers_dataframe():
-    """Return DataFrame with columns: Match, Team1, Team2, ...
-    Rows = match_numbers, values = transfer counts. Sorted by Match.
+@memoize_versioned("teams", "matches", "scores")
+def get_season():
+    """Return the points Season (match × team float32 matrix) for active teams."""
+    return _load_season("scores", "points")
+
+
+@memoize_versioned("teams", "matches", "transfers")
+def get_transfers_season():
+    """Return the transfers Season (match × team float32 matrix) for active teams."""
+    return _load_season("transfers", "count")
+
+
+@memoize_versioned("teams", "matches", "scores")
+def get_projections():
+    """Monte Carlo projection of the final standings (see simulate_season()).
+
+    Cached per data version in the shared cache, so the simulations run once
+    per change to the scores rather than on every refresh.
     """
-    conn = get_connection()
-    try:
-        df = pd.read_sql_query(
-            """SELECT m.match_number AS Match, t.name AS team, tr.count AS transfers
-               FROM transfers tr
-               JOIN matches m ON tr.match_id = m.id
-               JOIN teams t   ON tr.team_id  = t.id
-               WHERE t.active = 1
-               ORDER BY m.match_number""",
-            conn,
-        )
-    finally:
-        conn.close()
-    if df.empty:
-        return pd.DataFrame(columns=["Match"])
-    return df.pivot(index="Match", columns="team", values="transfers").reset_index()
+    return simulate_season(get_season())
 
 
 # ─── Delete ──────────────────────────────────────────────────────────────────
 
 
 def delete_match_data(match_number):
-    """Delete all scores and transfers for a match, then the match record."""
-    conn = get_connection()
-    try:
+    """Delete all scores and transfers for a match, then the match record.
+
+    A scheduled match gets its seeded fixture row back (teams, stadium and
+    date), as it did when every boot re-seeded the fixtures.
+    """
+    with write_connection() as conn:
         row = conn.execute(
             "SELECT id FROM matches WHERE match_number=?", (match_number,)
         ).fetchone()
@@ -310,16 +315,12 @@ def delete_match_data(match_number):
         conn.execute("DELETE FROM scores WHERE match_id=?", (match_id,))
         conn.execute("DELETE FROM transfers WHERE match_id=?", (match_id,))
         conn.execute("DELETE FROM matches WHERE id=?", (match_id,))
-        conn.commit()
-    finally:
-        conn.close()
+        restore_fixture(conn, match_number)
 
 
-@cache.memoize()
 def get_match_scores_for_edit(match_number):
     """Return {team_name: points} for a given match for editing."""
-    conn = get_connection()
-    try:
+    with read_connection() as conn:
         rows = conn.execute(
             """SELECT t.name, s.points
                FROM scores s
@@ -329,15 +330,11 @@ def get_match_scores_for_edit(match_number):
             (match_number,),
         ).fetchall()
         return {r["name"]: r["points"] for r in rows}
-    finally:
-        conn.close()
 
 
-@cache.memoize()
 def get_match_transfers_for_edit(match_number):
     """Return {team_name: count} for a given match for editing."""
-    conn = get_connection()
-    try:
+    with read_connection() as conn:
         rows = conn.execute(
             """SELECT t.name, tr.count
                FROM transfers tr
@@ -347,5 +344,3 @@ def get_match_transfers_for_edit(match_number):
             (match_number,),
         ).fetchall()
         return {r["name"]: r["count"] for r in rows}
-    finally:
-        conn.close()
@@ -0,0 +1,133 @@
+"""Incremental updates for the interval refresh callbacks.
+
+Each refreshing page keeps the data version its outputs were built from in a
+dcc.Store and sends it back with every tick. patch_outputs() files each
+version's outputs in the shared cache, unless a write has moved the version
+since the snapshot read it (the outputs may then hold the newer data). When
+the client's version is still there and the scores and transfers since then
+only gained match rows (a new match was saved), every output goes out as a
+Dash Patch: its lists are extended with the new points and anything else
+that moved (axis ranges, colors, table cells) is assigned. An edit or delete
+of an earlier match, a changed team list, or a client whose version has aged
+out of the cache gets the full outputs.
+
+Full outputs go out as the callbacks built them, with plotly.js typed
+arrays. A Patch can only extend JSON lists, so a typed array whose values
+changed is assigned whole (still typed); plain lists are extended.
+"""
+
+import base64
+import json
+
+import numpy as np
+from dash import Patch
+from plotly.io.json import to_json_plotly
+
+from utils.cache import cache
+from utils.metrics import get_version_key
+from utils.season import first_changed_row
+
+
+def _is_typed(value):
+    """Whether value is a plotly.js typed array ({"dtype", "bdata"})."""
+    return isinstance(value, dict) and "bdata" in value and "dtype" in value
+
+
+def _decode(value):
+    """value with its typed arrays as lists, for comparing their values."""
+    if isinstance(value, dict):
+        if _is_typed(value):
+            array = np.frombuffer(base64.b64decode(value["bdata"]), dtype=value["dtype"])
+            if "shape" in value:
+                array = array.reshape([int(n) for n in value["shape"].split(",")])
+            if array.dtype.kind == "f":
+                return np.where(np.isnan(array), None, array).tolist()
+            return array.tolist()
+        return {k: _decode(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_decode(v) for v in value]
+    return value
+
+
+def _appended(old, new):
+    """Whether Season new is old plus match rows after its last one (or equal)."""
+    start = first_changed_row(old, new)
+    return start is None or start == len(old.matches)
+
+
+def _update(target, old, new):
+    """Add operations to target (a Patch at a value equal to old) giving new.
+
+    Returns False when new can only replace old as a whole. Lists that grew
+    are extended; lists of the same or greater length holding dicts or lists
+    are updated item by item. Typed arrays are compared by value and
+    replaced whole when that differs.
+    """
+    if _is_typed(old) or _is_typed(new):
+        return _decode(old) == _decode(new)
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old.keys() - new.keys():
+            del target[key]
+        for key, value in new.items():
+            if key not in old:
+                target[key] = value
+            elif old[key] != value and not _update(target[key], old[key], value):
+                target[key] = value
+        return True
+    if isinstance(old, list) and isinstance(new, list) and len(new) >= len(old):
+        n = len(old)
+        if new[:n] != old:
+            if not all(isinstance(item, (dict, list)) for item in old):
+                return False
+            for i, (a, b) in enumerate(zip(old, new)):
+                if a != b and not _update(target[i], a, b):
+                    target[i] = b
+        if len(new) > n:
+            target.extend(new[n:])
+        return True
+    return False
+
+
+def output_patch(old, new):
+    """A Patch turning output old into new, or new when that is no smaller.
+
+    Both are JSON data as the client receives it; a Patch without
+    operations leaves the output as it is.
+    """
+    patch = Patch()
+    if old != new and not _update(patch, old, new):
+        return new
+    if len(to_json_plotly(patch)) >= len(json.dumps(new)):
+        return new
+    return patch
+
+
+def _outputs_key(name, version):
+    return f"outputs:{name}@{version}"
+
+
+def patch_outputs(name, metrics, client_version, outputs):
+    """outputs for the data version of metrics, as Patches where possible.
+
+    name identifies the callback; client_version is the version_key the
+    client's outputs were built from (None on a page load). Returns a list
+    with one entry per output: a Patch, or the full output as built.
+    """
+    seasons = metrics.get("season", "transfers")
+    outputs = list(outputs)
+    new = json.loads(to_json_plotly(outputs))
+    # A write after the snapshot read its versions may have reached the
+    # Seasons; keep those outputs out of the older version's entry.
+    if get_version_key() == metrics.version_key:
+        cache.add(_outputs_key(name, metrics.version_key), (seasons, new))
+    stored = cache.get(_outputs_key(name, client_version)) if client_version else None
+    if stored is None:
+        return outputs
+    old_seasons, old = stored
+    if not all(_appended(o, s) for o, s in zip(old_seasons, seasons)):
+        return outputs
+    patched = []
+    for output, o, n in zip(outputs, old, new):
+        patch = output_patch(o, n)
+        patched.append(output if patch is n else patch)
+    return patched
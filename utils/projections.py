@@ -0,0 +1,134 @@
+"""Monte Carlo projections of the final standings.
+
+Each simulated season draws every team's remaining match scores from its own
+entered scores (a bootstrap: uniform picks with replacement), adds them to the
+current totals and ranks the result. Seasons are simulated as NumPy batches;
+with workers > 1 the batches are spread over a ProcessPoolExecutor. Every
+batch gets its own seed from one SeedSequence, so a projection depends only
+on the data and the seed, never on the number of workers.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from utils.constants import (
+    PROJECTION_BATCH_CELLS,
+    PROJECTION_SEED,
+    PROJECTION_SIMULATIONS,
+    PROJECTION_WORKERS,
+    TOTAL_MATCHES,
+)
+from utils.season import as_season
+
+PROJECTION_COLUMNS = [
+    "Team",
+    "Current Points",
+    "Expected Points",
+    "Expected Rank",
+    "Win Probability",
+]
+
+
+def _histories(season):
+    """(history, counts): each team's entered scores, left-aligned, and how many.
+
+    history is (teams, longest history); padding and the single column of a
+    team without scores are 0, which is what that team then scores.
+    """
+    counts = season.mask.sum(axis=0)
+    entered_first = np.argsort(~season.mask, axis=0, kind="stable")
+    history = np.take_along_axis(season.values, entered_first, axis=0).T
+    width = max(1, int(counts.max(initial=0)))
+    return np.ascontiguousarray(history[:, :width], dtype=np.float32), counts
+
+
+def _simulate_batch(job):
+    """Simulate one batch of seasons; return (rank_counts, summed final totals).
+
+    rank_counts[t, r] counts the seasons where team t finished in place r + 1.
+    """
+    history, counts, totals, remaining, size, seed = job
+    rng = np.random.default_rng(seed)
+    n_teams, width = history.shape
+    # Pick an index into each team's history for every remaining match, then
+    # offset it to that team's row of the flattened history.
+    picks = rng.random((size, n_teams, remaining), dtype=np.float32)
+    picks *= counts.astype(np.float32)[:, None]
+    picks = picks.astype(np.int32)
+    picks += (np.arange(n_teams, dtype=np.int32) * width)[:, None]
+    # float32 sums of 0.5-step scores are exact up to 8 million points.
+    final = totals + history.ravel().take(picks).sum(axis=2)
+    # Same tie-breaking as the leaderboard: equal totals keep team order.
+    order = np.argsort(-final, axis=1, kind="stable")
+    places = np.empty_like(order)
+    np.put_along_axis(places, order, np.arange(n_teams), axis=1)
+    rank_counts = np.bincount(
+        (np.arange(n_teams) * n_teams + places).ravel(), minlength=n_teams * n_teams
+    ).reshape(n_teams, n_teams)
+    return rank_counts, final.sum(axis=0)
+
+
+def simulate_season(
+    scores,
+    simulations=PROJECTION_SIMULATIONS,
+    workers=PROJECTION_WORKERS,
+    total_matches=TOTAL_MATCHES,
+    seed=PROJECTION_SEED,
+):
+    """Project the final standings by simulating the rest of the season.
+
+    Returns dict with:
+        summary (DataFrame: Team, Current Points, Expected Points, Expected
+            Rank, Win Probability; sorted by Expected Points),
+        rank_probabilities (teams × places array, rows in summary order),
+        simulations, remaining (matches left to simulate)
+    """
+    season = as_season(scores)
+    remaining = max(0, total_matches - int((season.matches <= total_matches).sum()))
+    if season.is_empty:
+        return {
+            "summary": pd.DataFrame(columns=PROJECTION_COLUMNS),
+            "rank_probabilities": np.zeros((0, 0)),
+            "simulations": 0,
+            "remaining": remaining,
+        }
+
+    history, counts = _histories(season)
+    totals = season.values.sum(axis=0, dtype=np.float64)
+    n_teams = len(season.teams)
+    size = max(1, min(simulations, PROJECTION_BATCH_CELLS // max(1, remaining * n_teams)))
+    sizes = [size] * (simulations // size)
+    if simulations % size:
+        sizes.append(simulations % size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = [(history, counts, totals, remaining, n, s) for n, s in zip(sizes, seeds)]
+
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            results = list(pool.map(_simulate_batch, jobs))
+    else:
+        results = [_simulate_batch(job) for job in jobs]
+
+    rank_counts = sum(r[0] for r in results)
+    probabilities = rank_counts / simulations
+    expected_points = sum(r[1] for r in results) / simulations
+    expected_rank = probabilities @ np.arange(1, n_teams + 1)
+
+    summary = pd.DataFrame(
+        {
+            "Team": season.teams,
+            "Current Points": totals,
+            "Expected Points": np.round(expected_points, 1),
+            "Expected Rank": np.round(expected_rank, 1),
+            "Win Probability": probabilities[:, 0],
+        }
+    )
+    order = np.argsort(-expected_points, kind="stable")
+    return {
+        "summary": summary.iloc[order].reset_index(drop=True),
+        "rank_probabilities": probabilities[order],
+        "simulations": simulations,
+        "remaining": remaining,
+    }
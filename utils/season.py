@@ -0,0 +1,177 @@
+"""Columnar in-memory season store.
+
+A Season is the match × team grid behind every stat: one float32 value
+matrix, a validity mask, the team names (columns) and the match numbers
+(rows). It loads straight from SQLite cursor rows, with no read_sql_query or
+pivot, and the functions in utils/calculations.py work on it directly.
+"""
+
+import dataclasses
+from dataclasses import dataclass
+from functools import cached_property
+from itertools import chain
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class Season:
+    # float32 (matches, teams); 0 where no value was entered. Points are
+    # entered in steps of 0.5, which float32 holds exactly.
+    values: np.ndarray
+    mask: np.ndarray  # bool (matches, teams); True where a value was entered
+    teams: tuple  # team names, sorted, one per column
+    matches: np.ndarray  # int32 match numbers, ascending, one per row
+    # Data versions the rows were read at (models._load_season); equal
+    # versions mean equal data. None for Seasons built any other way.
+    version: tuple = None
+
+    # ─── Construction ───────────────────────────────────────────────────
+
+    @classmethod
+    def empty(cls):
+        return cls(
+            values=np.zeros((0, 0), dtype=np.float32),
+            mask=np.zeros((0, 0), dtype=bool),
+            teams=(),
+            matches=np.zeros(0, dtype=np.int32),
+        )
+
+    @classmethod
+    def from_rows(cls, rows, team_names, version=None):
+        """Build from numeric (match_number, team_id, value) cursor rows.
+
+        team_names maps team_id -> name; rows for other ids are dropped, and
+        teams without any rows get no column (same as a pivot).
+        """
+        if not rows or not team_names:
+            return dataclasses.replace(cls.empty(), version=version)
+        flat = np.fromiter(
+            chain.from_iterable(rows), dtype=np.float64, count=3 * len(rows)
+        ).reshape(-1, 3)
+        ids = np.fromiter(team_names, dtype=np.int64, count=len(team_names))
+        names = np.array([team_names[i] for i in ids.tolist()], dtype=object)
+        order = np.argsort(names, kind="stable")
+        column = np.full(int(max(ids.max(), flat[:, 1].max())) + 1, -1)
+        column[ids[order]] = np.arange(len(ids))
+        team_idx = column[flat[:, 1].astype(np.int64)]
+        flat, team_idx = flat[team_idx >= 0], team_idx[team_idx >= 0]
+        if not len(flat):
+            return dataclasses.replace(cls.empty(), version=version)
+
+        matches, match_idx = np.unique(
+            flat[:, 0].astype(np.int32), return_inverse=True
+        )
+        values = np.zeros((len(matches), len(ids)), dtype=np.float32)
+        mask = np.zeros(values.shape, dtype=bool)
+        values[match_idx, team_idx] = flat[:, 2]
+        mask[match_idx, team_idx] = True
+        keep = mask.any(axis=0)
+        return cls(
+            values=np.ascontiguousarray(values[:, keep]),
+            mask=np.ascontiguousarray(mask[:, keep]),
+            teams=tuple(names[order][keep].tolist()),
+            matches=matches,
+            version=version,
+        )
+
+    @classmethod
+    def from_frame(cls, df):
+        """Build from a pivoted DataFrame: Match | Team1 | Team2 …"""
+        teams = tuple(c for c in df.columns if c != "Match")
+        raw = df[list(teams)].to_numpy(dtype=np.float64).reshape(len(df), len(teams))
+        mask = ~np.isnan(raw)
+        matches = (
+            df["Match"].to_numpy(dtype=np.int32)
+            if "Match" in df.columns
+            else np.zeros(0, dtype=np.int32)
+        )
+        return cls(
+            values=np.where(mask, raw, 0).astype(np.float32),
+            mask=mask,
+            teams=teams,
+            matches=matches,
+        )
+
+    # ─── Views ──────────────────────────────────────────────────────────
+
+    @property
+    def is_empty(self):
+        """True when there are no matches or no teams."""
+        return self.values.size == 0
+
+    @property
+    def nbytes(self):
+        return self.values.nbytes + self.mask.nbytes + self.matches.nbytes
+
+    def team_index(self, team):
+        """Column index of team, or None when it is not in the season."""
+        try:
+            return self.teams.index(team)
+        except ValueError:
+            return None
+
+    def upto(self, match_number):
+        """Season restricted to matches <= match_number."""
+        n = int(np.searchsorted(self.matches, match_number, side="right"))
+        return Season(
+            values=self.values[:n],
+            mask=self.mask[:n],
+            teams=self.teams,
+            matches=self.matches[:n],
+        )
+
+    @cached_property
+    def above_average(self):
+        """bool (matches, teams): score strictly above that match's average.
+
+        Computed once per Season and shared by streaks, the form guide and
+        awards; False where a team has no score, so missing reads as "below".
+        """
+        sums = self.values.sum(axis=1, keepdims=True, dtype=np.float64)
+        counts = self.mask.sum(axis=1, keepdims=True)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            match_avgs = sums / counts
+        return self.mask & (self.values > match_avgs)
+
+    def masked(self):
+        """float64 copy of the values with NaN where nothing was entered."""
+        return np.where(self.mask, self.values.astype(np.float64), np.nan)
+
+    def to_frame(self, values=None):
+        """Pivoted DataFrame (Match | Team1 | …) of values, NaN where missing."""
+        if self.is_empty:
+            return pd.DataFrame(columns=["Match"])
+        data = self.masked() if values is None else values
+        df = pd.DataFrame(data, columns=list(self.teams))
+        df.insert(0, "Match", self.matches.astype(np.int64))
+        return df
+
+
+def as_season(scores):
+    """Accept a Season or a pivoted DataFrame and return a Season."""
+    if isinstance(scores, Season):
+        return scores
+    return Season.from_frame(scores)
+
+
+def first_changed_row(old, new):
+    """Index of the first match row that differs between Seasons, or None.
+
+    A different team list changes every row (0); rows added after the old
+    last match give len(old.matches).
+    """
+    if new.teams != old.teams:
+        return 0
+    common = min(len(old.matches), len(new.matches))
+    changed = np.flatnonzero(
+        (old.matches[:common] != new.matches[:common])
+        | (old.values[:common] != new.values[:common]).any(axis=1)
+        | (old.mask[:common] != new.mask[:common]).any(axis=1)
+    )
+    if len(changed):
+        return int(changed[0])
+    if len(old.matches) == len(new.matches):
+        return None
+    return common